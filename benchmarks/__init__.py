@@ -0,0 +1 @@
+"""Performance benchmarks for Eryx (run with `python -m benchmarks.<name>`)."""
@@ -0,0 +1,127 @@
+"""Per-operation cost of binary operators and compound assignments."""
+
+import timeit
+
+from eryx.frontend.ast import AssignmentExpression, BinaryExpression, Identifier
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.interpreter import eval_compound_assignment
+from eryx.runtime.operators import eval_binary_operation
+from eryx.runtime.runner import ENGINES
+from eryx.runtime.values import (
+    TRUE,
+    ArrayValue,
+    NumberValue,
+    RuntimeValue,
+    StringValue,
+)
+from benchmarks.utils import best_time, print_table
+
+CALLS = 200_000
+ITERATIONS = 20_000
+OPERATIONS_PER_ITERATION = 10
+
+NUMBER = NumberValue(7.5)
+OPERANDS: dict[str, tuple[RuntimeValue, RuntimeValue]] = {
+    "number": (NUMBER, NumberValue(3.0)),
+    "string": (StringValue("a"), StringValue("b")),
+    "array": (ArrayValue([NUMBER]), ArrayValue([NUMBER])),
+    "boolean": (TRUE, TRUE),
+}
+
+OPERATIONS = [
+    ("+", "number"),
+    ("/", "number"),
+    ("**", "number"),
+    ("<=", "number"),
+    ("==", "number"),
+    ("&", "number"),
+    (">>", "number"),
+    ("&&", "boolean"),
+    ("+", "string"),
+    ("==", "string"),
+    ("==", "array"),
+]
+
+COMPOUND_OPERATIONS = ["+=", "/=", "^=", ">>="]
+
+# Each iteration runs the loop (baseline) plus ten binary operations
+LOOP = """
+let a = 7.5;
+let b = 3;
+let x = 0;
+let i = 0;
+while (i < {iterations}) {{
+    x = {expression};
+    i += 1;
+}}
+"""
+
+EXPRESSIONS = {
+    "arithmetic": "a + b - a * b / a % b + a - b * a + b - a",
+    "comparison": "a < b == a > b != a <= b == a >= b != a < b == a",
+    "bitwise": "a & b | a ^ b << 1 >> 1 & a | b ^ a & b | a",
+}
+
+
+def per_call(func) -> float:
+    """Get the best time of a single call in nanoseconds."""
+    return min(timeit.repeat(func, number=CALLS, repeat=5)) / CALLS * 1e9
+
+
+def handler_costs() -> list[list[str]]:
+    """Time the interpreter handlers of single operations."""
+    rows = []
+    position = (1, 1, 1)
+    for operator, operand_type in OPERATIONS:
+        left, right = OPERANDS[operand_type]
+        node = BinaryExpression(position, Identifier(position, "a"), operator, left)
+        elapsed = per_call(
+            lambda n=node, l=left, r=right: eval_binary_operation(n, l, r)
+        )
+        rows.append([f"{operand_type} {operator} {operand_type}", f"{elapsed:.0f} ns"])
+
+    for operator in COMPOUND_OPERATIONS:
+        left, right = OPERANDS["number"]
+        node = AssignmentExpression(position, Identifier(position, "a"), left, operator)
+        elapsed = per_call(
+            lambda n=node, l=left, r=right: eval_compound_assignment(l, r, n)
+        )
+        rows.append([f"number {operator} number", f"{elapsed:.0f} ns"])
+
+    return rows
+
+
+def loop_costs() -> list[list[str]]:
+    """Time operations in a loop on every engine (without the cost of the loop)."""
+    baseline = Parser().produce_ast(LOOP.format(iterations=ITERATIONS, expression="a"))
+    operations = ITERATIONS * OPERATIONS_PER_ITERATION
+
+    rows = []
+    for name, expression in EXPRESSIONS.items():
+        program = Parser().produce_ast(
+            LOOP.format(iterations=ITERATIONS, expression=expression)
+        )
+        costs = []
+        for engine in ENGINES:
+            base, _ = best_time(
+                lambda e=engine, p=baseline: ENGINES[e](p, Environment())
+            )
+            total, _ = best_time(
+                lambda e=engine, p=program: ENGINES[e](p, Environment())
+            )
+            costs.append(f"{(total - base) / operations * 1e9:.0f} ns")
+        rows.append([name] + costs)
+
+    return rows
+
+
+def main():
+    """Run the benchmark."""
+    print_table(["operation", f"per call ({CALLS:,} calls)"], handler_costs())
+    print()
+    print_table(["per operation in a loop"] + list(ENGINES), loop_costs())
+
+
+if __name__ == "__main__":
+    main()
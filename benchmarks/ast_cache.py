@@ -0,0 +1,50 @@
+"""Cold versus warm start of the frontend with the on-disk AST cache."""
+
+import os
+import tempfile
+
+from eryx.frontend.cache import AstCache
+from benchmarks.utils import best_time, load_corpus, print_table, scale_source
+
+SIZES = (20_000, 2_000_000)
+
+
+def main():
+    """Run the benchmark."""
+    corpus = "\n".join(load_corpus().values())
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            source_code = scale_source(corpus, size)
+            file_path = os.path.join(directory, f"program_{size}.eryx")
+            cache = AstCache()
+
+            def cold(s=source_code, f=file_path, c=cache):
+                if os.path.exists(c.cache_path(f)):
+                    os.remove(c.cache_path(f))
+                return c.parse(s, f)
+
+            cold_time, _ = best_time(cold, repeat=1)
+            warm_time, _ = best_time(
+                lambda s=source_code, f=file_path, c=cache: c.parse(s, f)
+            )
+            rows.append(
+                [
+                    f"{len(source_code):,}",
+                    f"{os.path.getsize(cache.cache_path(file_path)) / 1000:,.0f} KB",
+                    f"{cold_time * 1000:.1f} ms",
+                    f"{warm_time * 1000:.1f} ms",
+                    f"{cold_time / warm_time:.1f}x",
+                    f"{cache.hits}/{cache.misses}",
+                ]
+            )
+
+    print_table(
+        ["chars", "cache file", "cold (parse)", "warm (cache)", "speedup", "hit/miss"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
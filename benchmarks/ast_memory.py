@@ -0,0 +1,69 @@
+"""Per-node memory and build time of the AST for a large program."""
+
+import tracemalloc
+from dataclasses import fields, is_dataclass
+
+from eryx.frontend.ast import Statement
+from eryx.frontend.lexer import tokenize
+from eryx.frontend.parser import Parser
+from benchmarks.utils import best_time, load_corpus, print_table, scale_source
+
+SIZE = 2_000_000
+
+
+def count_nodes(node) -> int:
+    """Count all AST nodes reachable from a node."""
+    if isinstance(node, list):
+        return sum(count_nodes(item) for item in node)
+    if not isinstance(node, Statement) or not is_dataclass(node):
+        return 0
+    return 1 + sum(count_nodes(getattr(node, field.name)) for field in fields(node))
+
+
+def traced_size(func) -> tuple[float, object]:
+    """Return the memory retained by the result of a function (in bytes)."""
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return retained, result
+
+
+def main():
+    """Run the benchmark."""
+    source_code = scale_source("\n".join(load_corpus().values()), SIZE)
+
+    token_bytes, tokens = traced_size(lambda: tokenize(source_code))
+    token_count = len(tokens)  # type: ignore
+    del tokens
+
+    ast_bytes, program = traced_size(lambda: Parser().produce_ast(source_code))
+    node_count = count_nodes(program)
+    del program
+
+    elapsed, _ = best_time(lambda: Parser().produce_ast(source_code))
+
+    print_table(
+        ["objects", "count", "memory", "per object"],
+        [
+            [
+                "tokens",
+                f"{token_count:,}",
+                f"{token_bytes / 1_000_000:.1f} MB",
+                f"{token_bytes / token_count:.0f} B",
+            ],
+            [
+                "AST nodes",
+                f"{node_count:,}",
+                f"{ast_bytes / 1_000_000:.1f} MB",
+                f"{ast_bytes / node_count:.0f} B",
+            ],
+        ],
+    )
+    print(f"\nAST build time: {elapsed * 1000:.0f} ms for {len(source_code):,} chars")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Cost of assignments in a scope with many constants."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+CONSTANTS = [0, 1_000]
+ITERATIONS = 20_000
+
+# Assigns a variable and an object property in a loop, below the constants
+LOOP = """
+let x = 0;
+let point = {{ x: 0 }};
+let i = 0;
+while (i < {iterations}) {{
+    x = i;
+    point.x = i;
+    i += 1;
+}}
+"""
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for count in CONSTANTS:
+        declarations = "".join(f"const c{index} = {index};\n" for index in range(count))
+        program = Parser().produce_ast(
+            declarations + LOOP.format(iterations=ITERATIONS)
+        )
+        row = [f"{count:,} constants"]
+        for engine in ENGINES:
+            elapsed, _ = best_time(
+                lambda e=engine, p=program: ENGINES[e](p, Environment())
+            )
+            row.append(f"{elapsed / ITERATIONS * 1e9:,.0f} ns")
+        rows.append(row)
+
+    print_table(["per iteration"] + list(ENGINES), rows)
+
+
+if __name__ == "__main__":
+    main()
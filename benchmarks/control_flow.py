@@ -0,0 +1,70 @@
+"""Micro-benchmarks for break, continue and early returns."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+PROGRAMS = {
+    "early return (20k calls)": """
+func find(values, target) {
+    for value in values {
+        if (value == target) {
+            return value;
+        }
+    }
+    return -1;
+}
+let values = range(10);
+let i = 0;
+while (i < 20000) {
+    find(values, i % 12);
+    i += 1;
+}
+""",
+    "continue (50k iterations)": """
+let i = 0;
+let odd = 0;
+while (i < 50000) {
+    i += 1;
+    if (i % 2 == 0) {
+        continue;
+    }
+    odd += 1;
+}
+""",
+    "break (10k loops)": """
+let round = 0;
+let found = 0;
+while (round < 10000) {
+    round += 1;
+    let n = 0;
+    loop {
+        n += 1;
+        if (n == 5) {
+            break;
+        }
+    }
+    found += n;
+    del n;
+}
+""",
+}
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, source_code in PROGRAMS.items():
+        program = Parser().produce_ast(source_code)
+        times = [
+            best_time(lambda e=engine, p=program: ENGINES[e](p, Environment()))[0]
+            for engine in ENGINES
+        ]
+        rows.append([name] + [f"{elapsed * 1000:.0f} ms" for elapsed in times])
+
+    print_table(["program"] + list(ENGINES), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Execution engine benchmark on loop and call heavy programs."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+PROGRAMS = {
+    "fib(20)": """
+func fib(n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+fib(20);
+""",
+    "nested for 300x300": """
+let total = 0;
+for i in range(300) {
+    for j in range(300) {
+        total += i * j % 7;
+    }
+}
+""",
+    "nested for 300x300 (in a function)": """
+func run() {
+    let total = 0;
+    for i in range(300) {
+        for j in range(300) {
+            total += i * j % 7;
+        }
+    }
+    return total;
+}
+run();
+""",
+    "globals from a nested function (20k)": """
+let values = range(10);
+let scale = 2;
+func outer() {
+    func middle() {
+        func inner() {
+            let i = 0;
+            let total = 0;
+            while (i < 20000) {
+                total = total + len(values) + scale;
+                i += 1;
+            }
+            return total;
+        }
+        return inner();
+    }
+    return middle();
+}
+outer();
+""",
+    "while 100k": """
+let i = 0;
+let evens = 0;
+while (i < 100000) {
+    if (i % 2 == 0) {
+        evens += 1;
+    }
+    i += 1;
+}
+""",
+    "array index 200x500": """
+let values = range(500);
+let total = 0;
+let round = 0;
+let i = 0;
+while (round < 200) {
+    i = 0;
+    while (i < 500) {
+        total = total + values[i];
+        i += 1;
+    }
+    round += 1;
+}
+""",
+}
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, source_code in PROGRAMS.items():
+        program = Parser().produce_ast(source_code)
+        times = {
+            engine: best_time(
+                lambda e=engine, p=program: ENGINES[e](p, Environment()), repeat=3
+            )[0]
+            for engine in ENGINES
+        }
+        baseline = times["interpreter"]
+        rows.append(
+            [name]
+            + [
+                f"{elapsed * 1000:.0f} ms ({baseline / elapsed:.2f}x)"
+                for elapsed in times.values()
+            ]
+        )
+
+    print_table(["program"] + list(ENGINES), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Throughput of the path based and handle based file functions."""
+
+import os
+import tempfile
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+LINES = 20_000
+LINE = "x" * 99
+
+# Every program writes or reads LINES lines of 100 characters in "{path}", the
+# write programs run first and leave the file for the read ones
+PROGRAMS = {
+    "write: file.append per line": """
+import "file";
+file.write("{path}", "");
+let i = 0;
+while (i < {lines}) {{
+    file.append("{path}", "{line}");
+    i += 1;
+}}
+""",
+    "write: file.write on a handle": """
+import "file";
+let handle = file.open("{path}", "w");
+let i = 0;
+while (i < {lines}) {{
+    file.write(handle, "{line}");
+    i += 1;
+}}
+file.close(handle);
+""",
+    "read: file.read": """
+import "file";
+let content = file.read("{path}");
+""",
+    "read: file.readLine": """
+import "file";
+let handle = file.open("{path}");
+let line = file.readLine(handle);
+while (line != null) {{
+    line = file.readLine(handle);
+}}
+file.close(handle);
+""",
+    "read: file.readChunk (64 KiB)": """
+import "file";
+let handle = file.open("{path}");
+let chunk = file.readChunk(handle, 65536);
+while (chunk != null) {{
+    chunk = file.readChunk(handle, 65536);
+}}
+file.close(handle);
+""",
+}
+
+
+def main():
+    """Run the benchmark."""
+    size = LINES * (len(LINE) + 1) / 1024 / 1024
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lines.txt").replace("\\", "/")
+        for name, source_code in PROGRAMS.items():
+            program = Parser().produce_ast(
+                source_code.format(path=path, lines=LINES, line=LINE + "\n")
+            )
+            row = [name]
+            for engine in ENGINES:
+                elapsed, _ = best_time(
+                    lambda e=engine, p=program: ENGINES[e](p, Environment())
+                )
+                row.append(f"{size / elapsed:.1f} MiB/s")
+            rows.append(row)
+
+    print_table([f"{size:.1f} MiB in {LINES:,} lines"] + list(ENGINES), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Peak memory and time of looping over the lines of a file."""
+
+import os
+import tempfile
+import tracemalloc
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+LINES = 50_000
+LINE = "x" * 99 + "\n"
+
+# Reading the whole file and splitting it builds every line up front
+LOOPS = {
+    "file.lines": """
+import "file";
+let count = 0;
+for line in file.lines("{path}") {{
+    count += 1;
+}}
+""",
+    "file.read + split": """
+import "file";
+import "string";
+let count = 0;
+for line in string.split(file.read("{path}"), "\n") {{
+    count += 1;
+}}
+""",
+}
+
+
+def peak_memory(engine: str, program) -> int:
+    """Get the peak memory used by running a program."""
+    tracemalloc.start()
+    try:
+        ENGINES[engine](program, Environment())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lines.txt")
+        with open(path, "w", encoding="utf8") as file:
+            file.write(LINE * LINES)
+
+        rows = []
+        for name, source_code in LOOPS.items():
+            program = Parser().produce_ast(
+                source_code.format(path=path.replace("\\", "/"))
+            )
+            for engine in ENGINES:
+                elapsed, _ = best_time(
+                    lambda e=engine, p=program: ENGINES[e](p, Environment())
+                )
+                rows.append(
+                    [
+                        f"{name} ({engine})",
+                        f"{peak_memory(engine, program) / 1024 / 1024:.1f} MiB",
+                        f"{elapsed * 1000:.0f} ms",
+                    ]
+                )
+
+    print_table(
+        ["loop", f"peak memory ({LINES * len(LINE) / 1024 / 1024:.1f} MiB)", "time"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
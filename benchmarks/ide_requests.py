@@ -0,0 +1,46 @@
+"""Requests per second on the IDE /run endpoint, and the cost of a global scope."""
+
+import timeit
+
+from eryx.runtime.environment import Environment
+from eryx.server.ide import app
+from benchmarks.utils import best_time, print_table
+
+REQUESTS = 2_000
+ENVIRONMENTS = 100_000
+
+PROGRAMS = {
+    "print": 'print("Hello, world!");',
+    "function call": "func add(a, b) { return a + b; } print(add(1, 2));",
+}
+
+
+def requests_per_second(source_code: str) -> float:
+    """Send /run requests through the test client, returns the requests per second."""
+    client = app.test_client()
+
+    def send():
+        for _ in range(REQUESTS):
+            response = client.post("/run", json={"source_code": source_code})
+            assert "result" in response.get_json()
+
+    elapsed, _ = best_time(send)
+    return REQUESTS / elapsed
+
+
+def main():
+    """Run the benchmark."""
+    rows = [
+        [f"/run ({name})", f"{requests_per_second(source_code):,.0f} requests/s"]
+        for name, source_code in PROGRAMS.items()
+    ]
+    per_environment = (
+        min(timeit.repeat(Environment, number=ENVIRONMENTS, repeat=5)) / ENVIRONMENTS
+    )
+    rows.append(["Environment()", f"{per_environment * 1e9:,.0f} ns"])
+
+    print_table(["operation", "result"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Tokenizer throughput benchmark (MB/s on small, medium and large inputs)."""
+
+from eryx.frontend.lexer import tokenize
+from benchmarks.utils import best_time, load_corpus, print_table, scale_source
+
+SIZES = {
+    "small": 2_000,
+    "medium": 200_000,
+    "large": 4_000_000,
+}
+
+
+def main():
+    """Run the benchmark."""
+    source_code = "\n".join(load_corpus().values())
+
+    rows = []
+    throughputs = []
+    for name, size in SIZES.items():
+        scaled = scale_source(source_code, size)
+        elapsed, tokens = best_time(lambda s=scaled: tokenize(s))
+        megabytes = len(scaled) / 1_000_000
+        throughputs.append(megabytes / elapsed)
+        rows.append(
+            [
+                name,
+                f"{len(scaled):,}",
+                f"{len(tokens):,}",  # type: ignore
+                f"{elapsed * 1000:.1f} ms",
+                f"{megabytes / elapsed:.2f} MB/s",
+            ]
+        )
+
+    print_table(["input", "chars", "tokens", "time", "throughput"], rows)
+
+    # Throughput must stay roughly constant as the input grows (linear lexing)
+    ratio = throughputs[-1] / throughputs[0]
+    print(f"\nlarge/small throughput ratio: {ratio:.2f} (~1.0 means linear)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Peak memory and time of random access to a file read whole or mapped."""
+
+import os
+import tempfile
+import tracemalloc
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+SIZE = 32 * 1024 * 1024
+LOOKUPS = 1_000
+ENGINE = "closures"
+
+# Both programs search for the last line, then read LOOKUPS spread out bytes
+PROGRAMS = {
+    "file.read": """
+import "file";
+import "string";
+let data = file.read("{path}");
+let found = string.contains(data, "needle");
+let i = 0;
+let byte = null;
+while (i < {lookups}) {{
+    byte = data[i * {step}];
+    i += 1;
+}}
+""",
+    "file.map": """
+import "file";
+let data = file.map("{path}");
+let found = file.find(data, "needle");
+let i = 0;
+let byte = null;
+while (i < {lookups}) {{
+    byte = data[i * {step}];
+    i += 1;
+}}
+file.close(data);
+""",
+}
+
+
+def peak_memory(program) -> int:
+    """Get the peak memory used by running a program."""
+    tracemalloc.start()
+    try:
+        ENGINES[ENGINE](program, Environment())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data.txt")
+        with open(path, "w", encoding="utf8") as file:
+            file.write("x" * (SIZE - 7) + "needle\n")
+
+        for name, source_code in PROGRAMS.items():
+            program = Parser().produce_ast(
+                source_code.format(
+                    path=path.replace("\\", "/"),
+                    lookups=LOOKUPS,
+                    step=SIZE // LOOKUPS,
+                )
+            )
+            elapsed, _ = best_time(lambda p=program: ENGINES[ENGINE](p, Environment()))
+            rows.append(
+                [
+                    name,
+                    f"{peak_memory(program) / 1024 / 1024:.1f} MiB",
+                    f"{elapsed * 1000:.1f} ms",
+                ]
+            )
+
+    print_table(
+        [f"{SIZE // 1024 // 1024} MiB file ({ENGINE})", "peak memory", "time"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
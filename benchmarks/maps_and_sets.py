@@ -0,0 +1,77 @@
+"""Dedup and membership workloads with arrays against the set module."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+SIZE = 1_000
+ENGINE = "closures"
+
+# Every program builds "values", SIZE numbers with about half of them repeated
+SETUP = """
+import "array" as "arr";
+import "set";
+let values = [];
+let i = 0;
+while (i < {size}) {{
+    arr.push(values, i % {distinct});
+    i += 1;
+}}
+let found = 0;
+"""
+
+PROGRAMS = {
+    "dedup (array scan)": """
+let unique = [];
+let j = 0;
+for value in values {
+    j = 0;
+    while ((j < len(unique)) && (unique[j] != value)) {
+        j += 1;
+    }
+    if (j == len(unique)) {
+        arr.push(unique, value);
+    }
+}
+""",
+    "dedup (set.new)": """
+let unique = set.values(set.new(values));
+""",
+    "lookups (array scan)": """
+for value in values {
+    for other in values {
+        if (other == value + 1) {
+            found += 1;
+            break;
+        }
+    }
+}
+""",
+    "lookups (set.has)": """
+let lookup = set.new(values);
+for value in values {
+    if (set.has(lookup, value + 1)) {
+        found += 1;
+    }
+}
+""",
+}
+
+
+def main():
+    """Run the benchmark."""
+    setup = SETUP.format(size=SIZE, distinct=SIZE // 2)
+    rows = []
+    for name, source_code in PROGRAMS.items():
+        program = Parser().produce_ast(setup + source_code)
+        elapsed, _ = best_time(
+            lambda p=program: ENGINES[ENGINE](p, Environment()), repeat=1
+        )
+        rows.append([name, f"{elapsed * 1000:.1f} ms"])
+
+    print_table([f"{SIZE:,} values ({ENGINE})", "time"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Recursive dynamic programming with memoized functions (by cache size)."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+FIB = """
+func fib(n) {{
+    if (n < 2) {{
+        return n;
+    }}
+    return fib(n - 1) + fib(n - 2);
+}}
+{memo}
+let result = fib(20);
+"""
+
+DISTANCE = """
+func distance(a, b, i, j) {{
+    if (i == 0) {{
+        return j;
+    }}
+    if (j == 0) {{
+        return i;
+    }}
+    let cost = 1;
+    if (a[i - 1] == b[j - 1]) {{
+        cost = 0;
+    }}
+    let best = distance(a, b, i - 1, j) + 1;
+    let other = distance(a, b, i, j - 1) + 1;
+    if (other < best) {{
+        best = other;
+    }}
+    other = distance(a, b, i - 1, j - 1) + cost;
+    if (other < best) {{
+        best = other;
+    }}
+    return best;
+}}
+{memo}
+let result = distance("{a}", "{b}", {i}, {j});
+"""
+
+WORDS = {"a": "intention", "b": "execution", "i": 9, "j": 9}
+
+# Every program stores its answer in "result", memoized ones in "fib" or "distance"
+PROGRAMS = {
+    "fib(20)": (FIB.format(memo=""), None),
+    "fib(20), memo": (FIB.format(memo="fib = memo(fib);"), "fib"),
+    "distance (9x9), memo(distance, 8)": (
+        DISTANCE.format(memo="distance = memo(distance, 8);", **WORDS),
+        "distance",
+    ),
+    "distance (9x9), memo(distance, 32)": (
+        DISTANCE.format(memo="distance = memo(distance, 32);", **WORDS),
+        "distance",
+    ),
+    "distance (9x9), memo(distance)": (
+        DISTANCE.format(memo="distance = memo(distance);", **WORDS),
+        "distance",
+    ),
+}
+
+
+def run(engine: str, source_code: str, name: str | None) -> tuple[float, str]:
+    """Run a program, returns the best time and the hit rate of its cache."""
+    program = Parser().produce_ast(source_code)
+    environments = []
+
+    def execute():
+        environment = Environment()
+        environments.append(environment)
+        ENGINES[engine](program, environment)
+
+    elapsed, _ = best_time(execute)
+    if name is None:
+        return elapsed, "-"
+
+    memo = environments[-1].lookup_variable(name)
+    return elapsed, f"{memo.hits / (memo.hits + memo.misses):.0%}"  # type: ignore
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, (source_code, memoized) in PROGRAMS.items():
+        results = [run(engine, source_code, memoized) for engine in ENGINES]
+        rows.append(
+            [name, results[0][1]]
+            + [f"{elapsed * 1000:.1f} ms" for elapsed, _ in results]
+        )
+
+    print_table(["program", "hit rate"] + list(ENGINES), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Parser throughput benchmark over the test corpus scaled up to 100k+ statements."""
+
+from eryx.frontend.lexer import tokenize
+from eryx.frontend.parser import Parser
+from benchmarks.utils import best_time, load_corpus, print_table
+
+STATEMENT_COUNTS = (1_000, 10_000, 100_000)
+
+
+def build_program(corpus: str, statements_per_copy: int, target: int) -> str:
+    """Repeat the corpus until the program has at least target statements."""
+    copies = max(1, -(-target // statements_per_copy))
+    return "\n".join([corpus] * copies)
+
+
+def main():
+    """Run the benchmark."""
+    corpus = "\n".join(load_corpus().values())
+    statements_per_copy = len(Parser().produce_ast(corpus).body)
+
+    rows = []
+    for target in STATEMENT_COUNTS:
+        source_code = build_program(corpus, statements_per_copy, target)
+        tokens = len(tokenize(source_code))
+
+        parser = Parser()
+        elapsed, program = best_time(lambda s=source_code, p=parser: p.produce_ast(s))
+        statements = len(program.body)  # type: ignore
+        rows.append(
+            [
+                f"{statements:,}",
+                f"{tokens:,}",
+                f"{elapsed * 1000:.1f} ms",
+                f"{elapsed / statements * 1_000_000:.2f} us",
+                f"{tokens / elapsed / 1000:.0f}k tok/s",
+            ]
+        )
+
+    print_table(
+        ["statements", "tokens", "tokenize + parse", "per statement", "throughput"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
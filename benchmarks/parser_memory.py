@@ -0,0 +1,55 @@
+"""Peak memory of parsing with all tokens up front versus lazily streamed tokens."""
+
+import tracemalloc
+
+from eryx.frontend.parser import Parser
+from benchmarks.utils import best_time, load_corpus, print_table, scale_source
+
+SIZES = (200_000, 2_000_000)
+
+
+def measure(source_code: str, streaming: bool) -> tuple[float, float]:
+    """Return the peak memory while parsing and the memory kept by the AST (in MB)."""
+    parser = Parser(streaming=streaming)
+    tracemalloc.start()
+    try:
+        program = parser.produce_ast(source_code)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del program
+    return peak / 1_000_000, retained / 1_000_000
+
+
+def main():
+    """Run the benchmark."""
+    corpus = "\n".join(load_corpus().values())
+
+    rows = []
+    for size in SIZES:
+        source_code = scale_source(corpus, size)
+        for streaming in (False, True):
+            peak, retained = measure(source_code, streaming)
+            elapsed, _ = best_time(
+                lambda s=source_code, m=streaming: Parser(streaming=m).produce_ast(s),
+                repeat=1,
+            )
+            rows.append(
+                [
+                    f"{len(source_code):,}",
+                    "streaming" if streaming else "tokenize first",
+                    f"{peak:.1f} MB",
+                    f"{retained:.1f} MB",
+                    f"{peak - retained:.1f} MB",
+                    f"{elapsed * 1000:.0f} ms",
+                ]
+            )
+
+    print_table(
+        ["chars", "mode", "peak", "AST", "peak - AST", "time"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Cost per operation of arrays used as work queues (array.shift and unshift)."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+SIZES = [10_000, 40_000, 160_000]
+ENGINE = "closures"
+
+# Fills a queue, then drains it from the front while it keeps growing at the back
+QUEUE = """
+import "array" as "arr";
+let queue = [];
+let i = 0;
+while (i < {size}) {{
+    arr.push(queue, i);
+    i += 1;
+}}
+let item = null;
+while (i > 0) {{
+    item = arr.shift(queue);
+    if (i % 2 == 0) {{
+        arr.push(queue, item);
+    }}
+    i -= 1;
+}}
+"""
+
+# Builds a stack from the front, then empties it from the front
+STACK = """
+import "array" as "arr";
+let stack = [];
+let i = 0;
+while (i < {size}) {{
+    arr.unshift(stack, i);
+    i += 1;
+}}
+while (i > 0) {{
+    arr.shift(stack);
+    i -= 1;
+}}
+"""
+
+# Peeks at the front of a queue before every shift (stays a deque)
+PEEK = """
+import "array" as "arr";
+let queue = [];
+let i = 0;
+while (i < {size}) {{
+    arr.push(queue, i);
+    i += 1;
+}}
+let item = null;
+while (i > 0) {{
+    item = queue[0];
+    arr.shift(queue);
+    i -= 1;
+}}
+"""
+
+# Drains a few items from the front, then reads the rest by index (back to a list)
+INDEXED = """
+import "array" as "arr";
+let queue = [];
+let i = 0;
+while (i < {size}) {{
+    arr.push(queue, i);
+    i += 1;
+}}
+arr.shift(queue);
+i = 0;
+let total = 0;
+while (i < {size} - 1) {{
+    total += queue[i];
+    i += 1;
+}}
+"""
+
+PROGRAMS = {"queue": QUEUE, "front stack": STACK, "peek": PEEK, "indexed": INDEXED}
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, source_code in PROGRAMS.items():
+        for size in SIZES:
+            program = Parser().produce_ast(source_code.format(size=size))
+            elapsed, _ = best_time(
+                lambda p=program: ENGINES[ENGINE](p, Environment()), repeat=1
+            )
+            rows.append(
+                [
+                    f"{name} ({size:,})",
+                    f"{elapsed * 1000:.0f} ms",
+                    f"{elapsed / (size * 2) * 1e9:.0f} ns",
+                ]
+            )
+
+    print_table([f"program ({ENGINE})", "time", "per operation"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Peak memory and time of for loops over lazy and built ranges."""
+
+import tracemalloc
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+SIZE = 200_000
+
+# Adding an empty array builds the elements of the range
+LOOPS = {
+    "lazy range": f"let count = 0; for i in range({SIZE}) {{ count += 1; }}",
+    "built range": f"let count = 0; for i in range({SIZE}) + [] {{ count += 1; }}",
+}
+
+
+def peak_memory(engine: str, program) -> int:
+    """Get the peak memory used by running a program."""
+    tracemalloc.start()
+    try:
+        ENGINES[engine](program, Environment())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, source_code in LOOPS.items():
+        program = Parser().produce_ast(source_code)
+        for engine in ENGINES:
+            elapsed, _ = best_time(
+                lambda e=engine, p=program: ENGINES[e](p, Environment())
+            )
+            rows.append(
+                [
+                    f"{name} ({engine})",
+                    f"{peak_memory(engine, program) / 1024 / 1024:.1f} MiB",
+                    f"{elapsed * 1000:.0f} ms",
+                ]
+            )
+
+    print_table(["loop", f"peak memory ({SIZE:,})", "time"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Calls per second of recursive functions (fib, ackermann and tree walks)."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+# Every program counts its calls in "calls"
+PROGRAMS = {
+    "fib(18)": """
+let calls = 0;
+func fib(n) {
+    calls += 1;
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+fib(18);
+""",
+    "ackermann(2, 40)": """
+let calls = 0;
+func ackermann(m, n) {
+    calls += 1;
+    if (m == 0) {
+        return n + 1;
+    }
+    if (n == 0) {
+        return ackermann(m - 1, 1);
+    }
+    return ackermann(m - 1, ackermann(m, n - 1));
+}
+ackermann(2, 40);
+""",
+    "tree walk (depth 12)": """
+let calls = 0;
+func build(depth) {
+    if (depth == 0) {
+        return null;
+    }
+    return { value: depth, left: build(depth - 1), right: build(depth - 1) };
+}
+func total(node) {
+    calls += 1;
+    if (node == null) {
+        return 0;
+    }
+    return node.value + total(node.left) + total(node.right);
+}
+let tree = build(12);
+total(tree);
+""",
+}
+
+
+def run(engine: str, source_code: str) -> tuple[float, int]:
+    """Run a program, returns the best time and the number of calls."""
+    program = Parser().produce_ast(source_code)
+    environments = []
+
+    def execute():
+        environment = Environment()
+        environments.append(environment)
+        ENGINES[engine](program, environment)
+
+    elapsed, _ = best_time(execute)
+    return elapsed, int(environments[-1].lookup_variable("calls").value)
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, source_code in PROGRAMS.items():
+        row = [name]
+        for engine in ENGINES:
+            elapsed, calls = run(engine, source_code)
+            row.append(f"{calls / elapsed:,.0f} calls/s")
+        rows.append(row)
+
+    print_table(["program"] + list(ENGINES), rows)
+
+
+if __name__ == "__main__":
+    main()
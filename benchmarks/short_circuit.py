@@ -0,0 +1,88 @@
+"""Guard-heavy loops, with the calls that && and || skip."""
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+# Every program counts the calls to its guarded function in "calls"
+PROGRAMS = {
+    "null guard && (20k)": """
+let calls = 0;
+func expensive(value) {
+    calls += 1;
+    return value == 20;
+}
+let values = [null, 5, null, 20];
+let i = 0;
+let value = null;
+let matches = 0;
+while (i < 20000) {
+    value = values[i % 4];
+    if ((value != null) && expensive(value)) {
+        matches += 1;
+    }
+    i += 1;
+}
+""",
+    "cached flag || (20k)": """
+let calls = 0;
+func expensive(value) {
+    calls += 1;
+    return value % 7 == 0;
+}
+let i = 0;
+let found = false;
+while (i < 20000) {
+    found = found || expensive(i + 1);
+    i += 1;
+}
+""",
+    "chained guards (20k)": """
+let calls = 0;
+func positive(value) {
+    calls += 1;
+    return value > 0;
+}
+let i = 0;
+let valid = 0;
+while (i < 20000) {
+    if ((i % 3 == 0) && positive(i) && positive(i - 1) && positive(i - 2)) {
+        valid += 1;
+    }
+    i += 1;
+}
+""",
+}
+
+
+def run(engine: str, source_code: str) -> tuple[float, int]:
+    """Run a program, returns the best time and the number of guarded calls."""
+    program = Parser().produce_ast(source_code)
+    environments = []
+
+    def execute():
+        environment = Environment()
+        environments.append(environment)
+        ENGINES[engine](program, environment)
+
+    elapsed, _ = best_time(execute)
+    return elapsed, int(environments[-1].lookup_variable("calls").value)
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, source_code in PROGRAMS.items():
+        results = [run(engine, source_code) for engine in ENGINES]
+        calls = {count for _, count in results}
+        rows.append(
+            [name, f"{calls.pop():,}" if len(calls) == 1 else "mismatch"]
+            + [f"{elapsed * 1000:.0f} ms" for elapsed, _ in results]
+        )
+
+    print_table(["program", "calls"] + list(ENGINES), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Deep tail recursion, run in place (time per call and peak memory by depth)."""
+
+import tracemalloc
+
+from eryx.frontend.parser import Parser
+from eryx.runtime.environment import Environment
+from eryx.runtime.runner import ENGINES
+from benchmarks.utils import best_time, print_table
+
+DEPTHS = [1_000, 10_000, 100_000]
+
+PROGRAM = """
+func total(n, sum) {{
+    if (n == 0) {{
+        return sum;
+    }}
+    return total(n - 1, sum + n);
+}}
+let result = total({depth}, 0);
+"""
+
+
+def run(engine: str, depth: int) -> float:
+    """Run the program on an engine, returns the best time."""
+    program = Parser().produce_ast(PROGRAM.format(depth=depth))
+
+    def execute():
+        environment = Environment()
+        ENGINES[engine](program, environment)
+        return environment.lookup_variable("result").value
+
+    elapsed, result = best_time(execute)
+    assert result == depth * (depth + 1) // 2
+    return elapsed
+
+
+def peak_memory(engine: str, depth: int) -> int:
+    """Get the peak memory allocated while running the program on an engine."""
+    program = Parser().produce_ast(PROGRAM.format(depth=depth))
+    tracemalloc.start()
+    try:
+        ENGINES[engine](program, Environment())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for depth in DEPTHS:
+        rows.append(
+            [f"{depth:,}"]
+            + [f"{run(engine, depth) / depth * 1e9:,.0f} ns" for engine in ENGINES]
+            + [f"{peak_memory('interpreter', depth) / 1024:,.0f} KiB"]
+        )
+
+    print_table(
+        ["depth"] + [f"{engine} per call" for engine in ENGINES] + ["peak memory"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
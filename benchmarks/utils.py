@@ -0,0 +1,61 @@
+"""Shared helpers for the benchmark scripts."""
+
+import gc
+import os
+import time
+from typing import Callable, Tuple
+
+current_path = os.path.dirname(os.path.abspath(__file__))
+corpus_folder = os.path.join(current_path, "..", "eryx", "tests", "test")
+
+
+def load_corpus() -> dict[str, str]:
+    """Load the source code of every program in the test corpus."""
+    corpus = {}
+    for test_folder in sorted(os.listdir(corpus_folder)):
+        file_path = os.path.join(corpus_folder, test_folder, f"{test_folder}.eryx")
+        if os.path.isfile(file_path):
+            with open(file_path, "r", encoding="utf8") as file:
+                corpus[test_folder] = file.read()
+    return corpus
+
+
+def scale_source(source_code: str, target_size: int) -> str:
+    """Repeat some source code until it is at least target_size characters long."""
+    if not source_code:
+        return source_code
+    copies = max(1, -(-target_size // (len(source_code) + 1)))
+    return "\n".join([source_code] * copies)
+
+
+def best_time(func: Callable, repeat: int = 3) -> Tuple[float, object]:
+    """
+    Run a function a few times and return the best time and the last result.
+
+    Like timeit, the garbage collector is disabled while timing.
+    """
+    best = float("inf")
+    result = None
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            result = None
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best, result
+
+
+def print_table(headers: list[str], rows: list[list]) -> None:
+    """Print a simple aligned table."""
+    widths = [
+        max(len(str(row[i])) for row in [headers] + rows) for i in range(len(headers))
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
@@ -0,0 +1,84 @@
+"""Memory used by runtime values while running the test corpus (with tracemalloc)."""
+
+import contextlib
+import gc
+import io
+import os
+import tracemalloc
+
+from eryx.frontend.parser import Parser
+from eryx.runtime import values
+from eryx.runtime.environment import Environment
+from eryx.runtime.interpreter import evaluate
+from benchmarks.utils import load_corpus, print_table
+
+RUNTIME_FOLDER = os.path.dirname(values.__file__)
+
+PROGRAMS = {
+    "array of 100k small numbers": """
+import "array" as "arrays";
+let values = [];
+let i = 0;
+while (i < 100000) {
+    arrays.push(values, i % 100);
+    i += 1;
+}
+""",
+    "100k comparisons": """
+import "array" as "arrays";
+let flags = [];
+let i = 0;
+while (i < 100000) {
+    arrays.push(flags, i % 3 == 0);
+    i += 1;
+}
+""",
+}
+
+
+def run(source_code: str) -> tuple[int, int, int]:
+    """Run a program, returns the peak and retained memory and the retained blocks."""
+    program = Parser().produce_ast(source_code)
+    environment = Environment()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                evaluate(program, environment)
+            except RuntimeError:
+                pass  # Some corpus programs end with an error on purpose
+        retained, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Memory blocks still alive that were allocated by the runtime (mostly values)
+    runtime_blocks = snapshot.filter_traces(
+        [tracemalloc.Filter(True, os.path.join(RUNTIME_FOLDER, "*"))]
+    ).statistics("filename")
+    return peak, retained, sum(stat.count for stat in runtime_blocks)
+
+
+def main():
+    """Run the benchmark."""
+    programs = load_corpus() | PROGRAMS
+
+    rows = []
+    for name, source_code in programs.items():
+        peak, retained, blocks = run(source_code)
+        rows.append(
+            [
+                name,
+                f"{peak / 1000:,.1f} KB",
+                f"{retained / 1000:,.1f} KB",
+                f"{blocks:,}",
+            ]
+        )
+
+    print_table(["program", "peak", "retained", "runtime blocks"], rows)
+
+
+if __name__ == "__main__":
+    main()
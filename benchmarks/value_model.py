@@ -0,0 +1,56 @@
+"""Memory per element and deep equality cost of runtime values."""
+
+import tracemalloc
+
+from eryx.runtime.values import ArrayValue, NumberValue, ObjectValue, StringValue
+from benchmarks.utils import best_time, print_table
+
+SIZE = 1_000_000
+EQUALITY_SIZE = 100_000
+
+ELEMENTS = {
+    "numbers": lambda i: NumberValue(i + 0.5),
+    "strings": lambda i: StringValue(str(i)),
+    "objects": lambda i: ObjectValue({"id": NumberValue(i + 0.5)}),
+    "arrays": lambda i: ArrayValue([NumberValue(i + 0.5)]),
+}
+
+
+def build(make_element, size: int) -> ArrayValue:
+    """Build an array value."""
+    return ArrayValue([make_element(i) for i in range(size)])
+
+
+def main():
+    """Run the benchmark."""
+    rows = []
+    for name, make_element in ELEMENTS.items():
+        tracemalloc.start()
+        try:
+            array = build(make_element, SIZE)
+            retained, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del array
+
+        left = build(make_element, EQUALITY_SIZE)
+        right = build(make_element, EQUALITY_SIZE)
+        elapsed, equal = best_time(lambda l=left, r=right: l == r)
+        assert equal
+
+        rows.append(
+            [
+                name,
+                f"{retained / SIZE:.0f} B",
+                f"{elapsed * 1000:.1f} ms",
+            ]
+        )
+
+    print_table(
+        ["elements", f"memory per element ({SIZE:,})", f"== ({EQUALITY_SIZE:,})"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import pytest
 from colorama import init
 
 from eryx.__init__ import CURRENT_VERSION
+from eryx.frontend.cache import AST_CACHE
 from eryx.packages.packages import (
     DEFAULT_SERVER,
     delete_package,
@@ -14,10 +15,10 @@ from eryx.packages.packages import (
     list_packages,
     uninstall,
     upload_package,
-    init_package
+    init_package,
 )
 from eryx.runtime.repl import start_repl
-from eryx.runtime.runner import run_code
+from eryx.runtime.runner import ENGINES, run_code
 from eryx.server.ide import start_ide
 
 init(autoreset=True)
@@ -71,6 +72,26 @@ def main():
     run_parser.add_argument(
         "--tokenize", action="store_true", help="Print the tokenized source code."
     )
+    run_parser.add_argument(
+        "--bytecode", action="store_true", help="Print the compiled bytecode."
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the cached AST (__eryxcache__).",
+    )
+    run_parser.add_argument(
+        "-O",
+        "--optimize",
+        action="store_true",
+        help="Fold constant expressions and prune constant if branches.",
+    )
+    run_parser.add_argument(
+        "--engine",
+        choices=list(ENGINES),
+        default="interpreter",
+        help="Engine used to run the program.",
+    )
 
     # 'server' command
     server_parser = subparsers.add_parser("server", help="Start the web IDE")
@@ -83,6 +104,12 @@ def main():
     server_parser.add_argument(
         "--no-file-io", action="store_true", help="Disable file I/O", default=False
     )
+    server_parser.add_argument(
+        "--engine",
+        choices=list(ENGINES),
+        default="interpreter",
+        help="Engine used to run programs.",
+    )
 
     # 'test' command
     subparsers.add_parser("test", help="Run the test suite")
@@ -157,6 +184,7 @@ def main():
 
     elif args.command == "run":
         # Run an Eryx file
+        AST_CACHE.enabled = not args.no_cache
         try:
             with open(args.filepath, "r", encoding="utf8") as file:
                 source_code = file.read()
@@ -165,6 +193,10 @@ def main():
                 log_ast=args.ast,
                 log_result=args.result,
                 log_tokens=args.tokenize,
+                file_path=args.filepath,
+                engine=args.engine,
+                log_bytecode=args.bytecode,
+                optimize=args.optimize,
             )
         except FileNotFoundError as e:
             print(
@@ -177,6 +209,7 @@ def main():
             args.host,
             port=args.port,
             disable_file_io=args.no_file_io,
+            engine=args.engine,
         )
 
     elif args.command == "test":
@@ -1,29 +1,29 @@
 """Abstract syntax tree (AST) for the frontend."""
 
 from dataclasses import dataclass, field
-from typing import List, Union
+from typing import Any, List, Union
 
 
-@dataclass()
+@dataclass(slots=True)
 class Statement:
     """Base class for all statements in the AST."""
 
     position: tuple[int, int, int]
 
 
-@dataclass()
+@dataclass(slots=True)
 class Program(Statement):
     """Program class."""
 
     body: List[Statement]
 
 
-@dataclass()
+@dataclass(slots=True)
 class Expression(Statement):
     """Expression base class."""
 
 
-@dataclass()
+@dataclass(slots=True)
 class AssignmentExpression(Expression):
     """Assignment expression class."""
 
@@ -32,7 +32,7 @@ class AssignmentExpression(Expression):
     operator: str | None = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class BinaryExpression(Expression):
     """Binary expression class."""
 
@@ -41,14 +41,26 @@ class BinaryExpression(Expression):
     right: Expression
 
 
-@dataclass()
+@dataclass(slots=True)
+class LogicalExpression(Expression):
+    """Logical expression class (the right side is only evaluated if needed)."""
+
+    left: Expression
+    operator: str
+    right: Expression
+
+
+@dataclass(slots=True)
 class Identifier(Expression):
     """Identifier class."""
 
     symbol: str
+    # Set by the resolver: environments to go up and the local slot (if any)
+    depth: int | None = field(default=None, repr=False, compare=False)
+    slot: int | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass()
+@dataclass(slots=True)
 class VariableDeclaration(Statement):
     """Variable declaration class."""
 
@@ -57,21 +69,25 @@ class VariableDeclaration(Statement):
     value: Union[Expression, None] = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class NumericLiteral(Expression):
     """Numeric literal class."""
 
     value: float
+    # Set by the runtime on the first evaluation, literals always evaluate to the same
+    # (immutable) value
+    runtime_value: Any = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass()
+@dataclass(slots=True)
 class StringLiteral(Expression):
     """String literal class."""
 
     value: str
+    runtime_value: Any = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass()
+@dataclass(slots=True)
 class Property(Expression):
     """Property class."""
 
@@ -79,21 +95,21 @@ class Property(Expression):
     value: Union[Expression, None] = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class ObjectLiteral(Expression):
     """Object literal class."""
 
     properties: List[Property]
 
 
-@dataclass()
+@dataclass(slots=True)
 class ArrayLiteral(Expression):
     """Represents an array literal."""
 
     elements: List[Expression]
 
 
-@dataclass()
+@dataclass(slots=True)
 class CallExpression(Expression):
     """Binary expression class."""
 
@@ -101,7 +117,7 @@ class CallExpression(Expression):
     caller: Expression
 
 
-@dataclass()
+@dataclass(slots=True)
 class MemberExpression(Expression):
     """Binary expression class."""
 
@@ -110,16 +126,18 @@ class MemberExpression(Expression):
     computed: bool
 
 
-@dataclass()
+@dataclass(slots=True)
 class FunctionDeclaration(Statement):
     """Function declaration class."""
 
     name: str
     arguments: List[str]
     body: list[Statement]
+    # Set by the resolver: slots of the variables declared in the function
+    local_slots: dict[str, int] | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass()
+@dataclass(slots=True)
 class IfStatement(Statement):
     """If statement class."""
 
@@ -128,14 +146,16 @@ class IfStatement(Statement):
     else_: list[Union[Statement, None]] = field(default_factory=list)
 
 
-@dataclass()
+@dataclass(slots=True)
 class ReturnStatement(Statement):
     """Return statement class."""
 
     value: Union[Expression, None] = None
+    # Set by the resolver: the value is a call of the function the return is in
+    tail_call: bool = field(default=False, repr=False, compare=False)
 
 
-@dataclass()
+@dataclass(slots=True)
 class ImportStatement(Statement):
     """Import statement class."""
 
@@ -144,14 +164,14 @@ class ImportStatement(Statement):
     alias: str | None = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class LoopStatement(Statement):
     """Loop statement class."""
 
     body: list[Statement]
 
 
-@dataclass()
+@dataclass(slots=True)
 class WhileStatement(Statement):
     """While statement class."""
 
@@ -159,7 +179,7 @@ class WhileStatement(Statement):
     body: list[Statement]
 
 
-@dataclass()
+@dataclass(slots=True)
 class ForStatement(Statement):
     """For statement class."""
 
@@ -168,24 +188,24 @@ class ForStatement(Statement):
     body: list[Statement]
 
 
-@dataclass()
+@dataclass(slots=True)
 class BreakLiteral(Expression):
     """Break literal class."""
 
 
-@dataclass()
+@dataclass(slots=True)
 class DelStatement(Statement):
     """Del statement class."""
 
     identifier: Expression
 
 
-@dataclass()
+@dataclass(slots=True)
 class ContinueLiteral(Expression):
     """Continue literal class."""
 
 
-@dataclass()
+@dataclass(slots=True)
 class ClassDeclaration(Statement):
     """Class declaration class."""
 
@@ -194,7 +214,7 @@ class ClassDeclaration(Statement):
     arguments: List[str] | None = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class EnumDeclaration(Statement):
     """Enum declaration class."""
 
@@ -202,7 +222,7 @@ class EnumDeclaration(Statement):
     values: list[Identifier]
 
 
-@dataclass()
+@dataclass(slots=True)
 class AssertStatement(Statement):
     """Assert statement class."""
 
@@ -0,0 +1,101 @@
+"""Persistent on-disk cache for parsed programs (similar to __pycache__)."""
+
+import hashlib
+import os
+import pickle
+from dataclasses import fields, is_dataclass
+
+from eryx.__init__ import CURRENT_VERSION
+from eryx.frontend import ast as ast_nodes
+from eryx.frontend.ast import Program
+from eryx.frontend.parser import Parser
+
+CACHE_DIR = "__eryxcache__"
+CACHE_MAGIC = b"ERYXAST\x00"
+
+
+def ast_fingerprint() -> str:
+    """Get a fingerprint of the AST node layout so stale caches are never loaded."""
+    layout = sorted(
+        f"{name}({','.join(field.name for field in fields(node))})"
+        for name, node in vars(ast_nodes).items()
+        if isinstance(node, type) and is_dataclass(node)
+    )
+    return hashlib.sha256(";".join(layout).encode()).hexdigest()
+
+
+class AstCache:
+    """Cache of parsed programs keyed by source hash and Eryx version."""
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.fingerprint = ast_fingerprint()
+
+    def cache_path(self, file_path: str) -> str:
+        """Get the path of the cache file for a source file."""
+        directory, file_name = os.path.split(os.path.abspath(file_path))
+        return os.path.join(directory, CACHE_DIR, f"{file_name}.{CURRENT_VERSION}.ast")
+
+    def cache_key(self, source_code: str) -> bytes:
+        """Get the key that a cache file must match to be valid."""
+        key = hashlib.sha256(f"{CURRENT_VERSION}\0{self.fingerprint}\0".encode())
+        key.update(source_code.encode("utf8", "surrogatepass"))
+        return key.digest()
+
+    def load(self, file_path: str, source_code: str) -> Program | None:
+        """Load a cached program, returns None if there is no valid cache."""
+        try:
+            with open(self.cache_path(file_path), "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        header = CACHE_MAGIC + self.cache_key(source_code)
+        if not data.startswith(header):
+            return None
+
+        try:
+            program = pickle.loads(data[len(header) :])
+        except Exception:  # pylint: disable=broad-except
+            return None  # Corrupted cache file
+
+        return program if isinstance(program, Program) else None
+
+    def store(self, file_path: str, source_code: str, program: Program) -> None:
+        """Store a parsed program in the cache (silently fails if not writable)."""
+        cache_path = self.cache_path(file_path)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, "wb") as file:
+                file.write(CACHE_MAGIC + self.cache_key(source_code))
+                pickle.dump(program, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)  # Atomic, never leaves partial files
+        except (OSError, pickle.PicklingError, RecursionError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def parse(
+        self, source_code: str, file_path: str, parser: Parser | None = None
+    ) -> Program:
+        """Produce the AST for a source file, using the cache when possible."""
+        if self.enabled:
+            program = self.load(file_path, source_code)
+            if program is not None:
+                self.hits += 1
+                return program
+            self.misses += 1
+
+        program = (parser or Parser()).produce_ast(source_code)
+
+        if self.enabled:
+            self.store(file_path, source_code, program)
+
+        return program
+
+
+AST_CACHE = AstCache()
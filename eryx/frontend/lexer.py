@@ -1,8 +1,9 @@
 """Lexer for the fronted."""
 
+import re
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Tuple
+from typing import Any, Iterator
 
 from colorama import Fore
 
@@ -136,7 +137,7 @@ KEYWORDS = {
 }
 
 
-@dataclass()
+@dataclass(slots=True)
 class Token:
     """Token class."""
 
@@ -145,195 +146,203 @@ class Token:
     position: tuple[int, int, int]  # (line, col, length)
 
 
-def is_skipable(
-    char: str, current_line: int, current_col: int
-) -> Tuple[bool, int, int]:
-    """Check if a character is a skipable character."""
-    if char in ("\n"):
-        return (True, current_line + 1, 0)  # Skip newlines (increment line count)
+SKIPABLE_CHARS = (" ", "\t", "\r")
+SKIPABLE_RUN = re.compile(r"[ \t\r]+")
+IDENTIFIER_RUN = re.compile(r"[A-Za-z0-9_]*")
 
-    return (
-        char in (" ", "\t", "\r"),
-        current_line,
-        current_col,
-    )  # Skip spaces, tabs carriage returns
-
-
-def pop_src(src: list[str], current_col: int, count: int = 1) -> Tuple[str, int]:
-    """Pop the first element of the source code."""
-    result = ""
-    for _ in range(count):
-        result += src.pop(0)
-    return result, current_col + len(result)
+# First characters of all double/triple character tokens
+MULTI_CHAR_STARTS = {token[0] for token in {**DOUBLE_CHAR_TOKENS, **TRIPLE_CHAR_TOKENS}}
 
 
 def tokenize(source_code: str) -> list[Token]:
     """Tokenize the source code."""
-    tokens = []  # Initialize the tokens list
-    src = list(source_code)
+    return list(iter_tokens(source_code))
+
+
+def iter_tokens(source_code: str) -> Iterator[Token]:
+    """Lazily tokenize the source code, yielding tokens one by one."""
+    length = len(source_code)
+    cursor = 0  # Index of the current character
     comment = False  # Comment flag
     current_line = 1
     current_col = 0
 
-    while len(src) > 0:
+    while cursor < length:
+        char = source_code[cursor]
         negative_num = False  # Reset the negative number flag
 
         # Skip comments
         if comment:
-            if src[0] in ("\n"):
+            if char == "\n":
                 current_line += 1  # Increment the line count
                 current_col = 0  # Reset the column count
                 comment = False
-            elif src[0] == ";":
+            elif char == ";":
                 comment = False
-            _, current_col = pop_src(src, current_col)
+            cursor += 1
+            current_col += 1
             continue
 
         # Skip skipable characters
-        skipable, current_line, current_col = is_skipable(
-            src[0], current_line, current_col
-        )
-        if skipable:  # spaces, newlines, tabs, and carriage returns
-            _, current_col = pop_src(src, current_col)
+        if char == "\n":  # Skip newlines (increment line count)
+            current_line += 1
+            current_col = 1
+            cursor += 1
             continue
 
-        # Check for triple character tokens first
-        if len(src) > 2 and src[0] + src[1] + src[2] in TRIPLE_CHAR_TOKENS:
-            token, current_col = pop_src(src, current_col, 3)
-            tokens.append(
-                Token(token, TRIPLE_CHAR_TOKENS[token], (current_line, current_col, 3))
-            )
+        if char in SKIPABLE_CHARS:  # Skip spaces, tabs and carriage returns
+            end = SKIPABLE_RUN.match(source_code, cursor).end()  # type: ignore
+            current_col += end - cursor
+            cursor = end
             continue
 
-        # Then check for double character tokens
-        if len(src) > 1 and src[0] + src[1] in DOUBLE_CHAR_TOKENS:
-            token, current_col = pop_src(src, current_col, 2)
-            tokens.append(
-                Token(token, DOUBLE_CHAR_TOKENS[token], (current_line, current_col, 2))
-            )
-            continue
+        if char in MULTI_CHAR_STARTS:
+            # Check for triple character tokens first
+            token = source_code[cursor : cursor + 3]
+            if token in TRIPLE_CHAR_TOKENS:
+                cursor += 3
+                current_col += 3
+                yield Token(
+                    token, TRIPLE_CHAR_TOKENS[token], (current_line, current_col, 3)
+                )
+                continue
 
-        # Finally check for single character tokens
-        if src[0] in SINGLE_CHAR_TOKENS:
-            token, current_col = pop_src(src, current_col)
+            # Then check for double character tokens
+            token = token[:2]
+            if token in DOUBLE_CHAR_TOKENS:
+                cursor += 2
+                current_col += 2
+                yield Token(
+                    token, DOUBLE_CHAR_TOKENS[token], (current_line, current_col, 2)
+                )
+                continue
 
-            # Single character token
-            tokens.append(
-                Token(token, SINGLE_CHAR_TOKENS[token], (current_line, current_col, 1))
-            )
+        # Finally check for single character tokens
+        if char in SINGLE_CHAR_TOKENS:
+            cursor += 1
+            current_col += 1
+            yield Token(char, SINGLE_CHAR_TOKENS[char], (current_line, current_col, 1))
             continue
 
         # Check for comments
-        if src[0] == "#":
+        if char == "#":
             comment = True
-            _, current_col = pop_src(src, current_col)
+            cursor += 1
+            current_col += 1
             continue
 
         # If its not a single/double character token, check for negative numbers/variables
-        if src[0] == "-":
-            if len(src) > 0 and (src[1].isdigit() or src[1].isalpha() or src[1] == "_"):
+        if char == "-":
+            cursor += 1
+            current_col += 1
+            following = source_code[cursor] if cursor < length else ""
+            if following and (
+                following.isdigit() or following.isalpha() or following == "_"
+            ):
                 negative_num = True  # Set negative number flag
-                _, current_col = pop_src(src, current_col)
+                char = following
             else:
                 # If its not a negative number, its a "-" operator
-                token, current_col = pop_src(src, current_col)
-                tokens.append(
-                    Token(
-                        token,
-                        TokenType.BINARY_OPERATOR,
-                        (current_line, current_col, 1),
-                    )
+                yield Token(
+                    char,
+                    TokenType.BINARY_OPERATOR,
+                    (current_line, current_col, 1),
                 )
                 continue
 
         # Check for multi character tokens
-        if src[0].isdigit():  # Number
-            number, current_col = pop_src(src, current_col)
-
-            if negative_num:
-                number = "-" + number  # Add negative sign to the number
-
+        if char.isdigit():  # Number
+            end = cursor + 1
             dots = 0
-            while len(src) > 0 and (src[0].isdigit() or src[0] == "."):
-                if src[0] == ".":
+            while end < length:
+                char = source_code[end]
+                if char == ".":
                     dots += 1
                     if dots > 1:
                         break  # Only one dot is allowed in a number
-                token, current_col = pop_src(src, current_col)
-                number += token
-            tokens.append(
-                Token(
-                    number,
-                    TokenType.NUMBER,
-                    (
-                        current_line,
-                        current_col,
-                        (len(number) + 1) if negative_num else len(number),
-                    ),
-                )
+                elif not char.isdigit():
+                    break
+                end += 1
+
+            number = source_code[cursor:end]
+            current_col += end - cursor
+            cursor = end
+
+            if negative_num:
+                number = "-" + number  # Add negative sign to the number
+
+            yield Token(
+                number,
+                TokenType.NUMBER,
+                (
+                    current_line,
+                    current_col,
+                    (len(number) + 1) if negative_num else len(number),
+                ),
             )
 
-        elif src[0].isalpha() or src[0] == "_":  # Identifier
-            identifier, current_col = pop_src(src, current_col)
-            while len(src) > 0 and (
-                src[0].isalpha() or src[0].isdigit() or src[0] == "_"
-            ):
-                token, current_col = pop_src(src, current_col)
-                identifier += token
+        elif char.isalpha() or char == "_":  # Identifier
+            end = cursor + 1
+            while end < length:
+                # Consume ASCII characters in bulk, then check for unicode ones
+                end = IDENTIFIER_RUN.match(source_code, end).end()  # type: ignore
+                if end < length and (
+                    source_code[end].isalpha() or source_code[end].isdigit()
+                ):
+                    end += 1
+                else:
+                    break
+
+            identifier = source_code[cursor:end]
+            current_col += end - cursor
+            cursor = end
 
             if identifier in KEYWORDS:  # Check if the identifier is a keyword
-                tokens.append(
-                    Token(
-                        identifier,
-                        KEYWORDS[identifier],
-                        (current_line, current_col, len(identifier)),
-                    )
+                yield Token(
+                    identifier,
+                    KEYWORDS[identifier],
+                    (current_line, current_col, len(identifier)),
                 )
 
             else:  # If its not a keyword, its an identifier
                 if negative_num:  # Fake a unary minus operator
-                    tokens.append(
-                        Token("(", TokenType.OPEN_PAREN, (current_line, current_col, 1))
+                    yield Token(
+                        "(", TokenType.OPEN_PAREN, (current_line, current_col, 1)
                     )
-                    tokens.append(
-                        Token("0", TokenType.NUMBER, (current_line, current_col, 1))
-                    )
-                    tokens.append(
-                        Token(
-                            "-",
-                            TokenType.BINARY_OPERATOR,
-                            (current_line, current_col, 1),
-                        )
+                    yield Token("0", TokenType.NUMBER, (current_line, current_col, 1))
+                    yield Token(
+                        "-",
+                        TokenType.BINARY_OPERATOR,
+                        (current_line, current_col, 1),
                     )
 
-                tokens.append(
-                    Token(
-                        identifier,
-                        TokenType.IDENTIFIER,
-                        (current_line, current_col, len(identifier)),
-                    )
+                yield Token(
+                    identifier,
+                    TokenType.IDENTIFIER,
+                    (current_line, current_col, len(identifier)),
                 )
 
                 if negative_num:  # Finish the unary minus operator
-                    tokens.append(
-                        Token(
-                            ")", TokenType.CLOSE_PAREN, (current_line, current_col, 1)
-                        )
+                    yield Token(
+                        ")", TokenType.CLOSE_PAREN, (current_line, current_col, 1)
                     )
 
-        elif src[0] == '"':  # String
-            _, current_col = pop_src(src, current_col)  # Remove the opening quote
-            string = ""
-            while len(src) > 0 and src[0] != '"':
-                token, current_col = pop_src(src, current_col)
-                string += token
-            _, current_col = pop_src(src, current_col)  # Remove the closing quote
-            tokens.append(
-                Token(
-                    string,
-                    TokenType.STRING,
-                    (current_line, current_col, len(string) + 2),
+        elif char == '"':  # String
+            end = source_code.find('"', cursor + 1)  # Find the closing quote
+            if end == -1:
+                syntax_error(
+                    source_code,
+                    (current_line, current_col + 1, 1),
+                    "Unterminated string found in source.",
                 )
+
+            string = source_code[cursor + 1 : end]
+            current_col += end - cursor + 1  # Include both quotes
+            cursor = end + 1
+            yield Token(
+                string,
+                TokenType.STRING,
+                (current_line, current_col, len(string) + 2),
             )
 
         else:
@@ -341,10 +350,8 @@ def tokenize(source_code: str) -> list[Token]:
             syntax_error(
                 source_code,
                 (current_line, current_col, 1),
-                f"Unknown character found in source '{Fore.MAGENTA}{src.pop(0)}{Fore.RESET}'",
+                f"Unknown character found in source '{Fore.MAGENTA}{char}{Fore.RESET}'",
             )
 
     # Add the final EOF token
-    tokens.append(Token("EOF", TokenType.EOF, (current_line, current_col, 1)))
-
-    return tokens
+    yield Token("EOF", TokenType.EOF, (current_line, current_col, 1))
@@ -0,0 +1,103 @@
+"""Optimizer pass that folds constant expressions and prunes dead if branches."""
+
+from dataclasses import fields
+
+from eryx.frontend.ast import (
+    BinaryExpression,
+    Expression,
+    Identifier,
+    IfStatement,
+    LogicalExpression,
+    NumericLiteral,
+    Program,
+    Statement,
+    StringLiteral,
+)
+from eryx.runtime.operators import eval_binary_operation
+from eryx.runtime.values import (
+    FALSE,
+    TRUE,
+    BooleanValue,
+    NumberValue,
+    RuntimeValue,
+    StringValue,
+    literal_value,
+)
+
+# Builtin constants, only when the resolver left them to the program environment
+CONSTANTS = {"true": TRUE, "false": FALSE}
+
+
+class Optimizer:
+    """Folds binary expressions on literals and prunes if statements on constants."""
+
+    def __init__(self) -> None:
+        self.folded = 0
+
+    def constant_value(self, node: Expression) -> RuntimeValue | None:
+        """Get the value of a constant expression, None if it is not constant."""
+        match node:
+            case NumericLiteral() | StringLiteral():
+                return literal_value(node)
+            case Identifier():
+                if node.slot is None:
+                    return CONSTANTS.get(node.symbol)
+            case BinaryExpression() | LogicalExpression():
+                left = self.constant_value(node.left)
+                right = self.constant_value(node.right)
+                if left is not None and right is not None:
+                    try:
+                        return eval_binary_operation(node, left, right)
+                    except (RuntimeError, ArithmeticError):
+                        pass  # Left for the runtime to report (e.g. division by zero)
+        return None
+
+    def fold(self, binop: BinaryExpression) -> Expression:
+        """Fold a binary expression into a literal (at the same position) if possible."""
+        value = self.constant_value(binop)
+        if isinstance(value, NumberValue):
+            self.folded += 1
+            return NumericLiteral(binop.position, value.value)
+        if isinstance(value, StringValue):
+            self.folded += 1
+            return StringLiteral(binop.position, value.value)
+        return binop
+
+    def optimize_all(self, nodes: list) -> list:
+        """Optimize a list of nodes, replacing pruned if statements by their branch."""
+        optimized = []
+
+        for node in nodes:
+            if isinstance(node, IfStatement):
+                condition = self.constant_value(node.condition)
+                if isinstance(condition, (BooleanValue, NumberValue, StringValue)):
+                    self.folded += 1
+                    branch = node.then if condition.value else node.else_
+                    optimized.extend(self.optimize_all(branch))
+                    continue
+
+            optimized.append(
+                self.optimize(node) if isinstance(node, Statement) else node
+            )
+
+        return optimized
+
+    def optimize(self, node: Statement) -> Statement:
+        """Optimize a node and its children, returns the node to use in its place."""
+        for node_field in fields(node):
+            value = getattr(node, node_field.name)
+            if isinstance(value, Statement):
+                setattr(node, node_field.name, self.optimize(value))
+            elif isinstance(value, list):
+                setattr(node, node_field.name, self.optimize_all(value))
+
+        if isinstance(node, BinaryExpression):
+            return self.fold(node)
+        return node
+
+
+def optimize_program(program: Program) -> int:
+    """Optimize a program in place, returns the number of folded nodes."""
+    optimizer = Optimizer()
+    program.body = optimizer.optimize_all(program.body)
+    return optimizer.folded
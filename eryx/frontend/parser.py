@@ -1,5 +1,8 @@
 """Parser module for the frontend of the compiler."""
 
+from itertools import islice
+from typing import Iterator
+
 from eryx.frontend.ast import (
     ArrayLiteral,
     AssertStatement,
@@ -17,6 +20,7 @@ from eryx.frontend.ast import (
     Identifier,
     IfStatement,
     ImportStatement,
+    LogicalExpression,
     LoopStatement,
     MemberExpression,
     NumericLiteral,
@@ -29,9 +33,13 @@ from eryx.frontend.ast import (
     VariableDeclaration,
     WhileStatement,
 )
-from eryx.frontend.lexer import Token, TokenType, tokenize
+from eryx.frontend.lexer import Token, TokenType, iter_tokens, tokenize
+from eryx.frontend.resolver import resolve_program
 from eryx.utils.errors import syntax_error
 
+# Amount of tokens pulled from the lexer at a time when streaming
+TOKEN_WINDOW_SIZE = 64
+
 # Precedence:
 # 1. Member expression: obj.prop, obj[expr]
 # 2. Call expression: func(), obj.method()
@@ -47,25 +55,44 @@ from eryx.utils.errors import syntax_error
 class Parser:
     """Parser class."""
 
-    def __init__(self) -> None:
+    def __init__(self, streaming: bool = True) -> None:
         self.source_code = ""
-        self.tokens = []
+        self.streaming = streaming  # Pull tokens from the lexer lazily
+        self.token_stream: Iterator[Token] | None = None
+        self.tokens: tuple[Token, ...] = ()  # All tokens (or the current window)
+        self.cursor = 0  # Index of the current token
+
+    def fill_window(self) -> None:
+        """Drop the consumed tokens and pull the next ones from the token stream."""
+        if self.token_stream is None:
+            return
+        self.tokens = self.tokens[self.cursor :] + tuple(
+            islice(self.token_stream, TOKEN_WINDOW_SIZE)
+        )
+        self.cursor = 0
 
     def not_eof(self) -> bool:
         """Check if the parser has not reached the end of the token stream."""
-        return self.tokens[0].type != TokenType.EOF
+        return self.tokens[self.cursor].type != TokenType.EOF
 
     def at(self) -> Token:
         """Get the current token."""
-        return self.tokens[0]
+        return self.tokens[self.cursor]
 
     def next(self) -> Token:
         """Get the current token and skip to next one (also called eat)."""
-        return self.tokens.pop(0)
+        token = self.tokens[self.cursor]
+        if token.type != TokenType.EOF:  # Never move past the EOF token
+            self.cursor += 1
+            if self.cursor == len(self.tokens):
+                self.fill_window()
+        return token
 
     def look_ahead(self, n: int) -> Token:
         """Look ahead n tokens."""
-        return self.tokens[n]
+        if self.cursor + n >= len(self.tokens):
+            self.fill_window()
+        return self.tokens[min(self.cursor + n, len(self.tokens) - 1)]
 
     def assert_next(self, token_type: TokenType, error: str) -> Token:
         """Return the current token and assert that the next token is of a certain type."""
@@ -353,7 +380,7 @@ class Parser:
         while self.at().value in ("&&", "||"):
             operator = self.next().value
             right = self.parse_bitwise_expression()
-            left = BinaryExpression(left.position, left, operator, right)
+            left = LogicalExpression(left.position, left, operator, right)
 
         return left
 
@@ -458,14 +485,20 @@ class Parser:
 
         parameters = []
         for argument in arguments:
-            if isinstance(argument, Identifier):
-                parameters.append(argument.symbol)
-            else:
+            if not isinstance(argument, Identifier):
                 syntax_error(
                     self.source_code,
                     self.at().position,
                     "Function arguments must be identifiers.",
                 )
+            elif argument.symbol in parameters:
+                syntax_error(
+                    self.source_code,
+                    argument.position,
+                    f'Argument "{argument.symbol}" already declared.',
+                )
+            else:
+                parameters.append(argument.symbol)
 
         self.assert_next(TokenType.OPEN_BRACE, "Expected an opening brace.")
 
@@ -801,7 +834,14 @@ class Parser:
     def produce_ast(self, source_code: str) -> Program:
         """Produce an abstract syntax tree (AST) from source code."""
         self.source_code = source_code
-        self.tokens = tokenize(source_code)
+        self.cursor = 0
+        if self.streaming:
+            self.token_stream = iter_tokens(source_code)
+            self.tokens = ()
+            self.fill_window()
+        else:
+            self.token_stream = None
+            self.tokens = tuple(tokenize(source_code))
         program = Program((0, 0, 0), body=[])
 
         # Parse all statements in the program until the EOF
@@ -810,4 +850,8 @@ class Parser:
             if statement != Expression((0, 0, 0)):
                 program.body.append(statement)
 
-        return program
+        # Release the tokens (and the lexer) once parsing is done
+        self.token_stream = None
+        self.tokens = ()
+
+        return resolve_program(program)
@@ -0,0 +1,152 @@
+"""Resolver pass that binds identifiers to the scope (and local slot) declaring them."""
+
+from dataclasses import fields
+
+from eryx.frontend.ast import (
+    AssignmentExpression,
+    CallExpression,
+    ClassDeclaration,
+    DelStatement,
+    EnumDeclaration,
+    ForStatement,
+    FunctionDeclaration,
+    Identifier,
+    IfStatement,
+    ImportStatement,
+    LoopStatement,
+    MemberExpression,
+    Program,
+    ReturnStatement,
+    Statement,
+    VariableDeclaration,
+    WhileStatement,
+)
+
+# Scopes mirror the environments made at runtime: a dict of local slots for a function
+# call, an empty dict for the environment holding class methods and None for the
+# environment the program runs in (which keeps its variables by name).
+Scope = dict[str, int] | None
+
+
+def declared_names(body: list[Statement]) -> list[str]:
+    """Get the names declared in a function body (without nested functions)."""
+    names = []
+
+    for statement in body:
+        match statement:
+            case VariableDeclaration():
+                names.append(statement.identifier.symbol)
+            case FunctionDeclaration() | ClassDeclaration() | EnumDeclaration():
+                names.append(statement.name)
+            case ImportStatement():
+                if statement.names:
+                    names.extend(statement.names)
+                else:
+                    names.append(statement.alias or statement.module)
+            case ForStatement():
+                if isinstance(statement.variable, Identifier):
+                    names.append(statement.variable.symbol)
+                names.extend(declared_names(statement.body))
+            case IfStatement():
+                names.extend(declared_names(statement.then))
+                names.extend(declared_names(statement.else_))
+            case LoopStatement() | WhileStatement():
+                names.extend(declared_names(statement.body))
+
+    return names
+
+
+def mark_tail_calls(body: list[Statement], name: str) -> None:
+    """Mark the returns of a call to the function name in a function body."""
+    for statement in body:
+        match statement:
+            case ReturnStatement(value=CallExpression(caller=Identifier() as caller)):
+                statement.tail_call = caller.symbol == name
+            case ForStatement() | LoopStatement() | WhileStatement():
+                mark_tail_calls(statement.body, name)
+            case IfStatement():
+                mark_tail_calls(statement.then, name)
+                mark_tail_calls(statement.else_, name)
+
+
+class Resolver:
+    """Annotates identifiers with the environment depth and slot of their variable."""
+
+    def __init__(self) -> None:
+        self.scopes: list[Scope] = [None]
+
+    def bind(self, identifier: Identifier) -> None:
+        """Bind an identifier to the innermost scope declaring it."""
+        for depth, scope in enumerate(reversed(self.scopes)):
+            if scope is None:
+                # Looked up by name from the program environment (globals, builtins),
+                # which is where identifiers of the program itself already start
+                if depth:
+                    identifier.depth, identifier.slot = depth, None
+                return
+
+            slot = scope.get(identifier.symbol)
+            if slot is not None:
+                identifier.depth, identifier.slot = depth, slot
+                return
+
+    def resolve_function(self, function: FunctionDeclaration) -> None:
+        """Resolve a function body in a new scope."""
+        local_slots: dict[str, int] = {}
+        for name in function.arguments + declared_names(function.body):
+            local_slots.setdefault(name, len(local_slots))
+        function.local_slots = local_slots
+        mark_tail_calls(function.body, function.name)
+
+        self.scopes.append(local_slots)
+        self.resolve_all(function.body)
+        self.scopes.pop()
+
+    def resolve_all(self, nodes: list) -> None:
+        """Resolve a list of nodes."""
+        for node in nodes:
+            if isinstance(node, Statement):
+                self.resolve(node)
+
+    def resolve(self, node: Statement | None) -> None:
+        """Resolve a node and its children."""
+        match node:
+            case None:
+                pass
+            case Identifier():
+                self.bind(node)
+            case FunctionDeclaration():
+                self.resolve_function(node)
+            case ClassDeclaration():
+                for method in node.methods:
+                    if isinstance(method, FunctionDeclaration):
+                        # Methods are declared in their own (empty) class environment
+                        self.scopes.append({})
+                        self.resolve_function(method)
+                        self.scopes.pop()
+                    elif isinstance(method, AssignmentExpression):
+                        self.resolve(method.value)
+            case MemberExpression():
+                self.resolve(node.object)
+                if node.computed:
+                    self.resolve(node.property)
+            case VariableDeclaration():
+                self.resolve(node.value)
+            case ForStatement():
+                self.resolve(node.iterator)
+                self.resolve_all(node.body)
+            case DelStatement() | EnumDeclaration() | ImportStatement():
+                pass  # Only names, no variables to look up
+            case _:
+                for node_field in fields(node):
+                    value = getattr(node, node_field.name)
+                    if isinstance(value, Statement):
+                        self.resolve(value)
+                    elif isinstance(value, list):
+                        self.resolve_all(value)
+
+
+def resolve_program(program: Program) -> Program:
+    """Resolve the variables of a program."""
+    Resolver().resolve_all(program.body)
+    return program
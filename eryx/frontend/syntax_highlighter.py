@@ -46,6 +46,8 @@ NATIVE_FUNCTIONS = [
     "sum",
     "min",
     "max",
+    "memo",
+    "memoStats",
 ]
 
 
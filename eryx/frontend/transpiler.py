@@ -19,6 +19,7 @@ from eryx.frontend.ast import (
     Identifier,
     IfStatement,
     ImportStatement,
+    LogicalExpression,
     LoopStatement,
     MemberExpression,
     NumericLiteral,
@@ -37,6 +38,10 @@ PRINT_OUTPUT = False
 IMPORT_ALIASES = {
     "http": "requests",
 }
+LOGICAL_OPERATORS = {
+    "&&": "and",
+    "||": "or",
+}
 OUT = {}
 
 
@@ -88,6 +93,11 @@ def convert_value(value: Expression) -> str:
             f"{convert_value(value.left)} {value.operator} {convert_value(value.right)}"
         )
 
+    if isinstance(value, LogicalExpression):
+        # Python's and/or short-circuit too, && and || have the same precedence
+        operator = LOGICAL_OPERATORS[value.operator]
+        return f"({convert_value(value.left)} {operator} {convert_value(value.right)})"
+
     if isinstance(value, CallExpression):
         return (
             f"{convert_value(value.caller)}"
@@ -209,6 +219,9 @@ def transpile(
                 tabs,
             )
 
+        elif isinstance(node, LogicalExpression):
+            cprint(convert_value(node), tabs)
+
         elif isinstance(node, MemberExpression):
             if not node.computed:
                 cprint(
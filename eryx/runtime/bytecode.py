@@ -0,0 +1,565 @@
+"""Bytecode format, compiler and disassembler for the virtual machine."""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Iterator
+
+from eryx.frontend.ast import (
+    ArrayLiteral,
+    AssertStatement,
+    AssignmentExpression,
+    BinaryExpression,
+    BreakLiteral,
+    CallExpression,
+    ClassDeclaration,
+    ContinueLiteral,
+    DelStatement,
+    EnumDeclaration,
+    Expression,
+    ForStatement,
+    FunctionDeclaration,
+    Identifier,
+    IfStatement,
+    ImportStatement,
+    LogicalExpression,
+    LoopStatement,
+    MemberExpression,
+    NumericLiteral,
+    ObjectLiteral,
+    Program,
+    ReturnStatement,
+    Statement,
+    StringLiteral,
+    VariableDeclaration,
+    WhileStatement,
+)
+from eryx.runtime.closures import (
+    ARITHMETIC_OPERATORS,
+    BITWISE_OPERATORS,
+    COMPARISON_OPERATORS,
+)
+from eryx.runtime.operators import COMPOUND_OPERATORS
+from eryx.runtime.values import NULL, RuntimeValue, literal_value
+
+# Opcodes (TOS is the value on top of the stack, TOS1 the one below it)
+LOAD_CONST = 0  # Push constants[arg]
+LOAD_NAME = 1  # Push the variable names[arg]
+LOAD_FAST = 2  # Push the local varnames[arg]
+STORE_NAME = 3  # Assign TOS to the variable names[arg]
+STORE_FAST = 4  # Assign TOS to the local varnames[arg]
+DECLARE_NAME = 5  # Declare the variable names[arg] as TOS
+DECLARE_CONST = 6  # Declare the constant names[arg] as TOS
+DECLARE_FAST = 7  # Declare the local varnames[arg] as TOS
+INPLACE_NAME = 8  # Compound assignment operators[arg] of TOS to a variable
+INPLACE_FAST = (
+    9  # Compound assignment operators[arg[1]] of TOS to the local varnames[arg[0]]
+)
+ASSIGN_MEMBER = 10  # Assignment nodes[arg] of TOS to a member
+POP_TOP = 11  # Discard TOS
+ROT_TWO = 12  # Swap TOS and TOS1
+ARITHMETIC = 13  # TOS1 operators[arg] TOS, for arithmetic operators
+COMPARE = 14  # TOS1 operators[arg] TOS, for comparison operators
+BITWISE = 15  # TOS1 operators[arg] TOS, for bitwise operators
+BINARY_OP = 16  # TOS1 operators[arg] TOS, for any other operator
+LOAD_ATTR = 17  # Replace TOS with its member nodes[arg] (obj.prop)
+LOAD_SUBSCRIPT = 18  # Replace TOS1 with its member TOS (obj[prop])
+BUILD_ARRAY = 19  # Replace the arg topmost values with an array
+BUILD_OBJECT = 20  # Replace the property values of nodes[arg] with an object
+CALL = 21  # Call TOS with the arguments below it (call expression nodes[arg])
+MAKE_FUNCTION = 22  # Push a function created from functions[arg]
+JUMP = 23  # Jump to arg
+POP_JUMP_IF_FALSE = 24  # Pop a condition, jump to arg[0] if falsy or arg[1] if invalid
+SETUP_LOOP = 25  # Enter a loop that breaks to arg and continues to the next instruction
+POP_BLOCK = 26  # Exit the innermost loop
+BREAK_LOOP = 27  # Break out of the innermost loop
+CONTINUE_LOOP = 28  # Continue the innermost loop
+GET_ITER = 29  # Replace the array TOS with an iterator (for statement nodes[arg])
+SAVE_NAME = 30  # Push the current value of the variable names[arg] (None if undeclared)
+SAVE_FAST = 31  # Push the current value of the local varnames[arg] (None if undeclared)
+FOR_ITER = 32  # Push the next value of the iterator TOS, jump to arg when exhausted
+FOR_DECLARE_NAME = 33  # Pop TOS into the loop variable names[arg] (marks it declared)
+FOR_DECLARE_FAST = (
+    34  # Pop TOS into the loop variable varnames[arg] (marks it declared)
+)
+FOR_RESTORE_NAME = 35  # Pop the iterator and the saved value of the variable names[arg]
+FOR_RESTORE_FAST = 36  # Pop the iterator and the saved value of the local varnames[arg]
+ASSERT = 37  # Replace the condition TOS of the assert statement nodes[arg] with null
+EVAL = 38  # Push the result of evaluating nodes[arg] with the interpreter
+RETURN_VALUE = 39  # Return TOS
+SHORT_CIRCUIT = 40  # Replace TOS by the result of operators[arg[1]] and jump to
+# arg[0] if TOS (the left side of a logical expression) decides it
+TAIL_CALL = 41  # Return the result of a CALL, running it in place if it calls the
+# running function
+
+OPNAMES = {
+    value: name
+    for name, value in dict(globals()).items()
+    if name.isupper() and isinstance(value, int)
+}
+
+JUMP_OPCODES = (JUMP, POP_JUMP_IF_FALSE, SETUP_LOOP, FOR_ITER)
+
+# Nodes that can only be evaluated (by the interpreter) with a real environment
+ENVIRONMENT_NODES = (
+    FunctionDeclaration,
+    ClassDeclaration,
+    EnumDeclaration,
+    ImportStatement,
+    DelStatement,
+)
+
+
+@dataclass()
+class CodeObject:
+    """Compiled bytecode of a program or a function body."""
+
+    name: str
+    instructions: list[tuple[int, Any]] = field(default_factory=list)
+    constants: list[RuntimeValue] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    varnames: list[str] = field(default_factory=list)
+    nodes: list[Statement] = field(default_factory=list)
+    # Operator function (for numbers) and the binary, logical or assignment node
+    operators: list[tuple[Callable | None, Expression]] = field(default_factory=list)
+    functions: list[tuple[FunctionDeclaration, "CodeObject"]] = field(
+        default_factory=list
+    )
+    fast: bool = False  # Locals live in slots instead of an environment
+
+
+def iter_nodes(nodes: list) -> Iterator[Statement]:
+    """Iterate over some AST nodes and all of their children."""
+    for node in nodes:
+        if isinstance(node, list):
+            yield from iter_nodes(node)
+        elif isinstance(node, Statement):
+            yield node
+            yield from iter_nodes([getattr(node, f.name) for f in fields(node)])
+
+
+def fast_locals(arguments: list[str], body: list[Statement]) -> list[str] | None:
+    """Get the local variables of a function body, None if it needs an environment."""
+    local_names = list(arguments)
+    for node in iter_nodes(body):
+        if isinstance(node, ENVIRONMENT_NODES):
+            return None
+
+        if isinstance(node, VariableDeclaration):
+            if node.constant:
+                return None
+            local_names.append(node.identifier.symbol)
+
+        elif isinstance(node, ForStatement):
+            if not isinstance(node.variable, Identifier):
+                return None
+            local_names.append(node.variable.symbol)
+
+        elif isinstance(node, AssignmentExpression):
+            if not isinstance(node.assigne, Identifier) or (
+                node.operator and node.operator not in COMPOUND_OPERATORS
+            ):
+                return None
+
+    return list(dict.fromkeys(local_names))
+
+
+class Compiler:
+    """Compiles a program or a function body into a code object."""
+
+    def __init__(
+        self, name: str, is_function: bool, local_names: list[str] | None = None
+    ) -> None:
+        self.code = CodeObject(
+            name=name, varnames=local_names or [], fast=local_names is not None
+        )
+        self.is_function = is_function
+        self.slots = {local_name: i for i, local_name in enumerate(self.code.varnames)}
+        self.labels: list[int] = []
+        self.constant_indexes: dict[tuple, int] = {}
+        self.name_indexes: dict[str, int] = {}
+
+    # HELPERS
+    def emit(self, opcode: int, arg: Any = None) -> None:
+        """Add an instruction."""
+        self.code.instructions.append((opcode, arg))
+
+    def new_label(self) -> int:
+        """Create a jump target, to be placed with mark()."""
+        self.labels.append(-1)
+        return len(self.labels) - 1
+
+    def mark(self, label: int) -> None:
+        """Place a jump target at the next instruction."""
+        self.labels[label] = len(self.code.instructions)
+
+    def constant(self, value: RuntimeValue) -> int:
+        """Get the index of a constant."""
+        key = (type(value), type(value.value), value.value)
+        if key not in self.constant_indexes:
+            self.constant_indexes[key] = len(self.code.constants)
+            self.code.constants.append(value)
+        return self.constant_indexes[key]
+
+    def name(self, name: str) -> int:
+        """Get the index of a variable name."""
+        if name not in self.name_indexes:
+            self.name_indexes[name] = len(self.code.names)
+            self.code.names.append(name)
+        return self.name_indexes[name]
+
+    def node(self, node: Statement) -> int:
+        """Get the index of an AST node."""
+        self.code.nodes.append(node)
+        return len(self.code.nodes) - 1
+
+    def variable(self, symbol: str, name_opcode: int, fast_opcode: int) -> None:
+        """Add an instruction for a variable, using its slot if it is a local."""
+        if symbol in self.slots:
+            self.emit(fast_opcode, self.slots[symbol])
+        else:
+            self.emit(name_opcode, self.name(symbol))
+
+    def null(self) -> None:
+        """Push null."""
+        self.emit(LOAD_CONST, self.constant(NULL))
+
+    def finish(self) -> CodeObject:
+        """Resolve the jump targets and get the compiled code."""
+        for i, (opcode, arg) in enumerate(self.code.instructions):
+            if opcode in JUMP_OPCODES:
+                target = (
+                    tuple(self.labels[label] for label in arg)
+                    if isinstance(arg, tuple)
+                    else self.labels[arg]
+                )
+                self.code.instructions[i] = (opcode, target)
+            elif opcode == SHORT_CIRCUIT:
+                self.code.instructions[i] = (opcode, (self.labels[arg[0]], arg[1]))
+        return self.code
+
+    # COMPILATION
+    def compile_block(self, statements: list[Statement | None]) -> None:
+        """Compile a list of statements (pushes the last result)."""
+        statements = [statement for statement in statements if statement]
+        if not statements:
+            self.null()
+
+        for i, statement in enumerate(statements):
+            if i:
+                self.emit(POP_TOP)
+            self.compile_node(statement)
+
+    def compile_loop_body(self, statements: list[Statement]) -> None:
+        """Compile the body of a loop (pushes nothing)."""
+        for statement in statements:
+            self.compile_node(statement)
+            self.emit(POP_TOP)
+
+    def compile_node(self, node: Statement | None) -> None:
+        """Compile an AST node (pushes its result)."""
+        if not node:
+            self.null()
+            return
+
+        match node:
+            case NumericLiteral() | StringLiteral():
+                self.emit(LOAD_CONST, self.constant(literal_value(node)))
+            case ArrayLiteral():
+                for element in node.elements:
+                    self.compile_node(element)
+                self.emit(BUILD_ARRAY, len(node.elements))
+            case Identifier():
+                self.variable(node.symbol, LOAD_NAME, LOAD_FAST)
+            case BinaryExpression():
+                self.compile_binary_expression(node)
+            case LogicalExpression():
+                self.compile_logical_expression(node)
+            case AssignmentExpression():
+                self.compile_assignment_expression(node)
+            case CallExpression():
+                for argument in node.arguments:
+                    self.compile_node(argument)
+                self.compile_node(node.caller)
+                self.emit(CALL, self.node(node))
+            case VariableDeclaration():
+                self.compile_node(node.value)
+                if node.constant:
+                    self.emit(DECLARE_CONST, self.name(node.identifier.symbol))
+                else:
+                    self.variable(node.identifier.symbol, DECLARE_NAME, DECLARE_FAST)
+            case FunctionDeclaration():
+                local_names = fast_locals(node.arguments, node.body)
+                self.code.functions.append(
+                    (node, compile_function(node.name, node.body, local_names))
+                )
+                self.emit(MAKE_FUNCTION, len(self.code.functions) - 1)
+                self.emit(DECLARE_NAME, self.name(node.name))
+            case MemberExpression():
+                self.compile_node(node.object)
+                if node.computed:
+                    self.compile_node(node.property)
+                    self.emit(LOAD_SUBSCRIPT, self.node(node))
+                else:
+                    self.emit(LOAD_ATTR, self.node(node))
+            case ObjectLiteral():
+                for prop in node.properties:
+                    if prop.value:
+                        self.compile_node(prop.value)
+                    else:
+                        # { x } is evaluated as { x: x }
+                        self.variable(prop.key, LOAD_NAME, LOAD_FAST)
+                self.emit(BUILD_OBJECT, self.node(node))
+            case IfStatement():
+                self.compile_if_statement(node)
+            case AssertStatement():
+                self.compile_node(node.condition)
+                self.emit(ASSERT, self.node(node))
+            case LoopStatement():
+                self.compile_loop_statement(node)
+            case WhileStatement():
+                self.compile_while_statement(node)
+            case ForStatement():
+                self.compile_for_statement(node)
+            case BreakLiteral():
+                self.emit(BREAK_LOOP)
+            case ContinueLiteral():
+                self.emit(CONTINUE_LOOP)
+            case ReturnStatement() if self.is_function and node.tail_call:
+                call: CallExpression = node.value  # type: ignore
+                for argument in call.arguments:
+                    self.compile_node(argument)
+                self.compile_node(call.caller)
+                self.emit(TAIL_CALL, self.node(call))
+            case ReturnStatement() if self.is_function:
+                self.compile_node(node.value)
+                self.emit(RETURN_VALUE)
+            case _:
+                # Declarations that run once, returns outside of functions, ...
+                self.emit(EVAL, self.node(node))
+
+    def compile_binary_expression(self, node: BinaryExpression) -> None:
+        """Compile a binary expression."""
+        self.compile_node(node.left)
+        self.compile_node(node.right)
+
+        for opcode, operators in (
+            (ARITHMETIC, ARITHMETIC_OPERATORS),
+            (COMPARE, COMPARISON_OPERATORS),
+            (BITWISE, BITWISE_OPERATORS),
+        ):
+            if node.operator in operators:
+                self.code.operators.append((operators[node.operator], node))
+                break
+        else:
+            opcode = BINARY_OP
+            self.code.operators.append((None, node))
+
+        self.emit(opcode, len(self.code.operators) - 1)
+
+    def compile_logical_expression(self, node: LogicalExpression) -> None:
+        """Compile a logical expression (skips the right side if it is not needed)."""
+        end_label = self.new_label()
+        self.code.operators.append((None, node))
+        operator_index = len(self.code.operators) - 1
+
+        self.compile_node(node.left)
+        self.emit(SHORT_CIRCUIT, (end_label, operator_index))
+        self.compile_node(node.right)
+        self.emit(BINARY_OP, operator_index)
+        self.mark(end_label)
+
+    def compile_assignment_expression(self, node: AssignmentExpression) -> None:
+        """Compile an assignment expression."""
+        self.compile_node(node.value)
+
+        if isinstance(node.assigne, Identifier):
+            symbol = node.assigne.symbol
+            if not node.operator:
+                self.variable(symbol, STORE_NAME, STORE_FAST)
+                return
+            if node.operator in COMPOUND_OPERATORS:
+                self.code.operators.append((COMPOUND_OPERATORS[node.operator], node))
+                operator_index = len(self.code.operators) - 1
+                if symbol in self.slots:
+                    self.emit(INPLACE_FAST, (self.slots[symbol], operator_index))
+                else:
+                    self.emit(INPLACE_NAME, operator_index)
+                return
+
+        self.emit(ASSIGN_MEMBER, self.node(node))
+
+    def compile_if_statement(self, node: IfStatement) -> None:
+        """Compile an if statement."""
+        else_label = self.new_label()
+        null_label = self.new_label()
+        end_label = self.new_label()
+
+        self.compile_node(node.condition)
+        self.emit(POP_JUMP_IF_FALSE, (else_label, null_label))
+        self.compile_block(node.then)
+        self.emit(JUMP, end_label)
+
+        self.mark(else_label)
+        if node.else_:
+            self.compile_block(node.else_)
+            self.emit(JUMP, end_label)
+
+        self.mark(null_label)
+        self.null()
+        self.mark(end_label)
+
+    def compile_loop_statement(self, node: LoopStatement) -> None:
+        """Compile a loop statement."""
+        break_label = self.new_label()
+        start_label = self.new_label()
+
+        self.emit(SETUP_LOOP, break_label)
+        self.mark(start_label)
+        self.compile_loop_body(node.body)
+        self.emit(JUMP, start_label)
+
+        self.mark(break_label)
+        self.null()
+
+    def compile_while_statement(self, node: WhileStatement) -> None:
+        """Compile a while statement."""
+        break_label = self.new_label()
+        exit_label = self.new_label()
+        condition_label = self.new_label()
+
+        self.emit(SETUP_LOOP, break_label)
+        self.mark(condition_label)
+        self.compile_node(node.condition)
+        # Invalid conditions are evaluated again (like the interpreter)
+        self.emit(POP_JUMP_IF_FALSE, (exit_label, condition_label))
+        self.compile_loop_body(node.body)
+        self.emit(JUMP, condition_label)
+
+        self.mark(exit_label)
+        self.emit(POP_BLOCK)
+        self.mark(break_label)
+        self.null()
+
+    def compile_for_statement(self, node: ForStatement) -> None:
+        """Compile a for statement."""
+        if not isinstance(node.variable, Identifier):
+            self.emit(EVAL, self.node(node))  # Raises an error
+            return
+
+        symbol = node.variable.symbol
+        break_label = self.new_label()
+        exit_label = self.new_label()
+        next_label = self.new_label()
+
+        self.compile_node(node.iterator)
+        self.emit(GET_ITER, self.node(node))
+        self.variable(symbol, SAVE_NAME, SAVE_FAST)
+        self.emit(ROT_TWO)
+
+        self.emit(SETUP_LOOP, break_label)
+        self.mark(next_label)
+        self.emit(FOR_ITER, exit_label)
+        self.variable(symbol, FOR_DECLARE_NAME, FOR_DECLARE_FAST)
+        self.compile_loop_body(node.body)
+        self.emit(JUMP, next_label)
+
+        self.mark(exit_label)
+        self.emit(POP_BLOCK)
+        self.mark(break_label)
+        self.variable(symbol, FOR_RESTORE_NAME, FOR_RESTORE_FAST)
+        self.null()
+
+
+def compile_program(program: Program) -> CodeObject:
+    """Compile a program into bytecode."""
+    compiler = Compiler("<program>", is_function=False)
+    compiler.compile_block(program.body)
+    compiler.emit(RETURN_VALUE)
+    return compiler.finish()
+
+
+def compile_function(
+    name: str, body: list[Statement], local_names: list[str] | None
+) -> CodeObject:
+    """Compile a function body into bytecode (local_names from fast_locals())."""
+    compiler = Compiler(name, is_function=True, local_names=local_names)
+    compiler.compile_loop_body(body)
+    compiler.null()
+    compiler.emit(RETURN_VALUE)
+    return compiler.finish()
+
+
+def describe_arg(code: CodeObject, opcode: int, arg: Any) -> str:
+    """Get a readable description of the argument of an instruction."""
+    if arg is None:
+        return ""
+
+    description = ""
+    if opcode == LOAD_CONST:
+        value = code.constants[arg].value
+        description = "null" if value is None else repr(value)
+    elif opcode in (LOAD_NAME, STORE_NAME, DECLARE_NAME, DECLARE_CONST, SAVE_NAME):
+        description = code.names[arg]
+    elif opcode in (FOR_DECLARE_NAME, FOR_RESTORE_NAME):
+        description = code.names[arg]
+    elif opcode in (LOAD_FAST, STORE_FAST, DECLARE_FAST, SAVE_FAST):
+        description = code.varnames[arg]
+    elif opcode in (FOR_DECLARE_FAST, FOR_RESTORE_FAST):
+        description = code.varnames[arg]
+    elif opcode == INPLACE_FAST:
+        description = f"{code.varnames[arg[0]]} {code.operators[arg[1]][1].operator}"
+    elif opcode == INPLACE_NAME:
+        node = code.operators[arg][1]
+        description = f"{node.assigne.symbol} {node.operator}"
+    elif opcode in (ARITHMETIC, COMPARE, BITWISE, BINARY_OP):
+        description = code.operators[arg][1].operator
+    elif opcode == SHORT_CIRCUIT:
+        description = f"{code.operators[arg[1]][1].operator} to {arg[0]}"
+    elif opcode == LOAD_ATTR:
+        prop = code.nodes[arg].property
+        description = prop.symbol if isinstance(prop, Identifier) else "?"
+    elif opcode == MAKE_FUNCTION:
+        description = code.functions[arg][0].name
+    elif opcode in JUMP_OPCODES:
+        return "to " + (
+            ", ".join(map(str, arg)) if isinstance(arg, tuple) else str(arg)
+        )
+    elif opcode in (
+        CALL,
+        TAIL_CALL,
+        BUILD_OBJECT,
+        ASSIGN_MEMBER,
+        GET_ITER,
+        ASSERT,
+        EVAL,
+    ):
+        description = type(code.nodes[arg]).__name__
+
+    return f"{arg} ({description})" if description else str(arg)
+
+
+def disassemble(code: CodeObject) -> str:
+    """Get a readable listing of some bytecode (and the functions it declares)."""
+    targets = set()
+    for opcode, arg in code.instructions:
+        if opcode in JUMP_OPCODES:
+            targets.update(arg if isinstance(arg, tuple) else (arg,))
+        elif opcode == SHORT_CIRCUIT:
+            targets.add(arg[0])
+
+    header = f"Disassembly of {code.name}"
+    if code.fast:
+        header += f" (locals: {', '.join(code.varnames) or 'none'})"
+    lines = [header + ":"]
+
+    for offset, (opcode, arg) in enumerate(code.instructions):
+        marker = ">>" if offset in targets else "  "
+        lines.append(
+            f"{marker} {offset:4} {OPNAMES[opcode]:<18} "
+            f"{describe_arg(code, opcode, arg)}".rstrip()
+        )
+
+    for _, function_code in code.functions:
+        lines.append("")
+        lines.append(disassemble(function_code))
+
+    return "\n".join(lines)
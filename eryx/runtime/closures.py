@@ -0,0 +1,713 @@
+"""Closure compiler for the runtime (an alternative to the tree-walking interpreter).
+
+Every AST node is compiled once into a Python closure that takes an environment,
+with its operator and child closures resolved ahead of time. Declarations that only
+run once (classes, enums, imports and del) are handed to the interpreter.
+"""
+
+import operator
+from typing import Callable
+
+from eryx.frontend.ast import (
+    ArrayLiteral,
+    AssertStatement,
+    AssignmentExpression,
+    BinaryExpression,
+    BreakLiteral,
+    CallExpression,
+    ClassDeclaration,
+    ContinueLiteral,
+    DelStatement,
+    EnumDeclaration,
+    ForStatement,
+    FunctionDeclaration,
+    Identifier,
+    IfStatement,
+    ImportStatement,
+    LogicalExpression,
+    LoopStatement,
+    MemberExpression,
+    NumericLiteral,
+    ObjectLiteral,
+    Program,
+    ReturnStatement,
+    Statement,
+    StringLiteral,
+    VariableDeclaration,
+    WhileStatement,
+)
+from eryx.runtime.environment import Environment, Frame
+from eryx.runtime.interpreter import (
+    eval_assignment,
+    eval_class_declaration,
+    eval_compound_assignment,
+    eval_del_statement,
+    eval_enum_declaration,
+    eval_import_statement,
+    evaluate,
+)
+from eryx.runtime.operators import (
+    COMPOUND_OPERATORS,
+    eval_binary_operation,
+    eval_short_circuit,
+)
+from eryx.runtime.values import (
+    FALSE,
+    ITERABLE_TYPES,
+    NULL,
+    TRUE,
+    ArrayValue,
+    BooleanValue,
+    ClassValue,
+    EnumValue,
+    FunctionValue,
+    MappedFileValue,
+    MemoValue,
+    NativeFunctionValue,
+    NullValue,
+    NumberValue,
+    ObjectValue,
+    RuntimeValue,
+    StringValue,
+    literal_value,
+)
+from eryx.utils.pretty_print import fmt_pos
+
+Closure = Callable[[Environment], RuntimeValue]
+
+
+# Compiled closures have no completion values, so control flow unwinds them instead
+class ReturnException(Exception):
+    """Dummy exception to manage return statements."""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class TailCallException(Exception):
+    """Dummy exception to manage returns of a call of the running function."""
+
+    def __init__(self, arguments):
+        self.arguments = arguments
+
+
+class BreakException(Exception):
+    """Dummy exception to manage break statements."""
+
+    def __init__(self):
+        pass
+
+
+class ContinueException(Exception):
+    """Dummy exception to manage continue statements."""
+
+    def __init__(self):
+        pass
+
+
+CONDITION_TYPES = (BooleanValue, NumberValue, StringValue, NullValue)
+
+ARITHMETIC_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "**": operator.pow,
+}
+
+COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+BITWISE_OPERATORS = {
+    "^": operator.xor,
+    "&": operator.and_,
+    "|": operator.or_,
+    "<<": operator.lshift,
+    ">>": operator.rshift,
+}
+
+
+def null_closure(_: Environment) -> RuntimeValue:
+    """Closure for missing nodes (evaluates to null)."""
+    return NULL
+
+
+class ClosureCompiler:
+    """Compiles AST nodes into closures."""
+
+    def __init__(self) -> None:
+        # Compiled function bodies, keyed by the id of the (kept alive) body
+        self.functions: dict[int, tuple[list[Statement], Closure]] = {}
+        self.compilers = {
+            NumericLiteral: self.compile_numeric_literal,
+            StringLiteral: self.compile_string_literal,
+            ArrayLiteral: self.compile_array_literal,
+            Identifier: self.compile_identifier,
+            BinaryExpression: self.compile_binary_expression,
+            LogicalExpression: self.compile_logical_expression,
+            AssignmentExpression: self.compile_assignment_expression,
+            CallExpression: self.compile_call_expression,
+            Program: self.compile_program,
+            VariableDeclaration: self.compile_variable_declaration,
+            FunctionDeclaration: self.compile_function_declaration,
+            MemberExpression: self.compile_member_expression,
+            ObjectLiteral: self.compile_object_literal,
+            IfStatement: self.compile_if_statement,
+            AssertStatement: self.compile_assert_statement,
+            LoopStatement: self.compile_loop_statement,
+            WhileStatement: self.compile_while_statement,
+            ForStatement: self.compile_for_statement,
+            BreakLiteral: self.compile_break_literal,
+            ContinueLiteral: self.compile_continue_literal,
+            ReturnStatement: self.compile_return_statement,
+            ClassDeclaration: self.compile_declaration(eval_class_declaration),
+            EnumDeclaration: self.compile_declaration(eval_enum_declaration),
+            ImportStatement: self.compile_declaration(eval_import_statement),
+            DelStatement: self.compile_declaration(eval_del_statement),
+        }
+
+    def compile(self, node: Statement | None) -> Closure:
+        """Compile an AST node."""
+        if not node:
+            return null_closure
+
+        compiler = self.compilers.get(type(node))
+        if compiler is None:
+            # Let the interpreter report the unknown node when it is reached
+            return lambda environment: evaluate(node, environment)
+
+        return compiler(node)
+
+    def compile_block(self, statements: list[Statement]) -> Closure:
+        """Compile a list of statements (evaluates to the last result)."""
+        compiled = [self.compile(statement) for statement in statements]
+
+        if not compiled:
+            return null_closure
+        if len(compiled) == 1:
+            return compiled[0]
+
+        *init, last = compiled
+
+        def block(environment: Environment) -> RuntimeValue:
+            for statement in init:
+                statement(environment)
+            return last(environment)
+
+        return block
+
+    def function_body(self, func: FunctionValue) -> Closure:
+        """Get the compiled body of a function, compiling it on the first call."""
+        compiled = self.functions.get(id(func.body))
+        if compiled is None:
+            compiled = self.functions[id(func.body)] = (
+                func.body,
+                self.compile_block(func.body),
+            )
+        return compiled[1]
+
+    def compile_declaration(
+        self, evaluator: Callable[[Statement, Environment], RuntimeValue]
+    ) -> Callable[[Statement], Closure]:
+        """Get a compiler that hands a node to an interpreter function."""
+        return lambda node: lambda environment: evaluator(node, environment)
+
+    # STATEMENTS
+    def compile_program(self, program: Program) -> Closure:
+        """Compile a program."""
+        body = self.compile_block(program.body)
+
+        def run_program(environment: Environment) -> RuntimeValue:
+            try:
+                return body(environment)
+            except ReturnException as e:
+                raise RuntimeError(
+                    "Return statement found outside of a function." + fmt_pos(program)
+                ) from e
+            except BreakException as e:
+                raise RuntimeError(
+                    "Break keyword found outside of a loop." + fmt_pos(program)
+                ) from e
+            except ContinueException as e:
+                raise RuntimeError(
+                    "Continue keyword found outside of a loop." + fmt_pos(program)
+                ) from e
+
+        return run_program
+
+    def compile_variable_declaration(self, node: VariableDeclaration) -> Closure:
+        """Compile a variable declaration."""
+        value = self.compile(node.value)
+        symbol = node.identifier.symbol
+        constant = node.constant
+
+        def declare_variable(environment: Environment) -> RuntimeValue:
+            return environment.declare_variable(symbol, value(environment), constant)
+
+        return declare_variable
+
+    def compile_function_declaration(self, node: FunctionDeclaration) -> Closure:
+        """Compile a function declaration."""
+        self.functions[id(node.body)] = (node.body, self.compile_block(node.body))
+
+        def declare_function(environment: Environment) -> RuntimeValue:
+            func = FunctionValue(
+                name=node.name,
+                arguments=node.arguments,
+                environment=environment,
+                body=node.body,
+                local_slots=node.local_slots,
+            )
+            return environment.declare_variable(node.name, func, False)
+
+        return declare_function
+
+    def compile_if_statement(self, node: IfStatement) -> Closure:
+        """Compile an if statement."""
+        condition = self.compile(node.condition)
+        then = self.compile_block(node.then)
+        else_ = (
+            self.compile_block([statement for statement in node.else_ if statement])
+            if node.else_
+            else None
+        )
+
+        def if_statement(environment: Environment) -> RuntimeValue:
+            result = condition(environment)
+            if isinstance(result, CONDITION_TYPES):
+                if result.value:
+                    return then(environment)
+                if else_ is not None:
+                    return else_(environment)
+            return NULL
+
+        return if_statement
+
+    def compile_assert_statement(self, node: AssertStatement) -> Closure:
+        """Compile an assert statement."""
+        condition = self.compile(node.condition)
+
+        def assert_statement(environment: Environment) -> RuntimeValue:
+            result = condition(environment)
+            if not isinstance(result, BooleanValue):
+                raise RuntimeError(
+                    "Expected a boolean value in an assert statement." + fmt_pos(node)
+                )
+            if not result.value:
+                raise RuntimeError(f"Assertion failed: {node.message}" + fmt_pos(node))
+            return NULL
+
+        return assert_statement
+
+    def compile_loop_statement(self, node: LoopStatement) -> Closure:
+        """Compile a loop statement."""
+        body = self.compile_block(node.body)
+
+        def loop_statement(environment: Environment) -> RuntimeValue:
+            try:
+                while True:
+                    try:
+                        body(environment)
+                    except ContinueException:
+                        pass
+            except BreakException:
+                pass
+            return NULL
+
+        return loop_statement
+
+    def compile_while_statement(self, node: WhileStatement) -> Closure:
+        """Compile a while statement."""
+        condition = self.compile(node.condition)
+        body = self.compile_block(node.body)
+
+        def while_statement(environment: Environment) -> RuntimeValue:
+            try:
+                while True:
+                    result = condition(environment)
+                    if isinstance(result, CONDITION_TYPES):
+                        if not result.value:
+                            break
+                        try:
+                            body(environment)
+                        except ContinueException:
+                            pass
+            except BreakException:
+                pass
+            return NULL
+
+        return while_statement
+
+    def compile_for_statement(self, node: ForStatement) -> Closure:
+        """Compile a for statement."""
+        if not isinstance(node.variable, Identifier):
+            return lambda environment: evaluate(node, environment)  # Raises an error
+
+        iterator = self.compile(node.iterator)
+        body = self.compile_block(node.body)
+        symbol = node.variable.symbol
+
+        def for_statement(environment: Environment) -> RuntimeValue:
+            variable_value = element = None
+            try:
+                elements = iterator(environment)
+                if not isinstance(elements, ITERABLE_TYPES):
+                    raise RuntimeError(
+                        "Expected an array, string, object or iterator to loop over."
+                        + fmt_pos(node)
+                    )
+
+                try:
+                    variable_value = environment.lookup_variable(symbol)
+                except RuntimeError:
+                    pass
+
+                for element in elements.iterate():
+                    environment.declare_variable(symbol, element, False, True)
+                    try:
+                        body(environment)
+                    except ContinueException:
+                        pass
+            except BreakException:
+                pass
+
+            if variable_value:
+                environment.assign_variable(symbol, variable_value, overwrite=True)
+            elif element is not None:  # Only if the loop declared it
+                environment.delete_variable(symbol)
+
+            return NULL
+
+        return for_statement
+
+    def compile_break_literal(self, _: BreakLiteral) -> Closure:
+        """Compile a break keyword."""
+
+        def break_literal(_: Environment) -> RuntimeValue:
+            raise BreakException()
+
+        return break_literal
+
+    def compile_continue_literal(self, _: ContinueLiteral) -> Closure:
+        """Compile a continue keyword."""
+
+        def continue_literal(_: Environment) -> RuntimeValue:
+            raise ContinueException()
+
+        return continue_literal
+
+    def compile_return_statement(self, node: ReturnStatement) -> Closure:
+        """Compile a return statement."""
+        if node.tail_call:
+            return self.compile_call_expression(node.value, tail_call=True)  # type: ignore
+
+        value = self.compile(node.value)
+
+        def return_statement(environment: Environment) -> RuntimeValue:
+            raise ReturnException(value(environment))
+
+        return return_statement
+
+    # EXPRESSIONS
+    def compile_numeric_literal(self, node: NumericLiteral) -> Closure:
+        """Compile a numeric literal."""
+        value = literal_value(node)
+        return lambda _: value
+
+    def compile_string_literal(self, node: StringLiteral) -> Closure:
+        """Compile a string literal."""
+        value = literal_value(node)
+        return lambda _: value
+
+    def compile_array_literal(self, node: ArrayLiteral) -> Closure:
+        """Compile an array literal."""
+        elements = [self.compile(element) for element in node.elements]
+        return lambda environment: ArrayValue(
+            [element(environment) for element in elements]
+        )
+
+    def compile_object_literal(self, node: ObjectLiteral) -> Closure:
+        """Compile an object literal."""
+        properties = [
+            (prop.key, self.compile(prop.value) if prop.value else None)
+            for prop in node.properties
+        ]
+
+        def object_literal(environment: Environment) -> RuntimeValue:
+            values = {}
+            for key, value in properties:
+                if value is not None:
+                    values[key] = value(environment)
+                else:
+                    # { x } is evaluated as { x: x }
+                    values[key] = environment.lookup_variable(key)
+            return ObjectValue(values)
+
+        return object_literal
+
+    def compile_identifier(self, node: Identifier) -> Closure:
+        """Compile an identifier."""
+        symbol, depth, slot = node.symbol, node.depth, node.slot
+        if depth is None:
+            return lambda environment: environment.lookup_variable(symbol)
+        return lambda environment: environment.lookup_resolved(symbol, depth, slot)
+
+    def compile_binary_expression(self, node: BinaryExpression) -> Closure:
+        """Compile a binary expression (with a fast path for numbers)."""
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+
+        if node.operator in ARITHMETIC_OPERATORS:
+            function = ARITHMETIC_OPERATORS[node.operator]
+
+            def arithmetic(environment: Environment) -> RuntimeValue:
+                lhs = left(environment)
+                rhs = right(environment)
+                if lhs.__class__ is NumberValue and rhs.__class__ is NumberValue:
+                    try:
+                        return NumberValue(function(lhs.value, rhs.value))
+                    except ZeroDivisionError:
+                        pass  # Let the interpreter raise the error
+                return eval_binary_operation(node, lhs, rhs)
+
+            return arithmetic
+
+        if node.operator in COMPARISON_OPERATORS:
+            function = COMPARISON_OPERATORS[node.operator]
+
+            def comparison(environment: Environment) -> RuntimeValue:
+                lhs = left(environment)
+                rhs = right(environment)
+                if lhs.__class__ is NumberValue and rhs.__class__ is NumberValue:
+                    return TRUE if function(lhs.value, rhs.value) else FALSE
+                return eval_binary_operation(node, lhs, rhs)
+
+            return comparison
+
+        if node.operator in BITWISE_OPERATORS:
+            function = BITWISE_OPERATORS[node.operator]
+
+            def bitwise(environment: Environment) -> RuntimeValue:
+                lhs = left(environment)
+                rhs = right(environment)
+                if lhs.__class__ is NumberValue and rhs.__class__ is NumberValue:
+                    return NumberValue(function(int(lhs.value), int(rhs.value)))
+                return eval_binary_operation(node, lhs, rhs)
+
+            return bitwise
+
+        return lambda environment: eval_binary_operation(
+            node, left(environment), right(environment)
+        )
+
+    def compile_logical_expression(self, node: LogicalExpression) -> Closure:
+        """Compile a logical expression (the right side only runs if it is needed)."""
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+
+        def logical_expression(environment: Environment) -> RuntimeValue:
+            lhs = left(environment)
+            result = eval_short_circuit(node, lhs)
+            if result is not None:
+                return result
+            return eval_binary_operation(node, lhs, right(environment))
+
+        return logical_expression
+
+    def compile_assignment_expression(self, node: AssignmentExpression) -> Closure:
+        """Compile an assignment expression."""
+        value = self.compile(node.value)
+
+        if isinstance(node.assigne, Identifier) and (
+            not node.operator or node.operator in COMPOUND_OPERATORS
+        ):
+            identifier = node.assigne
+            symbol, depth, slot = identifier.symbol, identifier.depth, identifier.slot
+            current = self.compile_identifier(identifier)
+
+            if depth is None:
+                if not node.operator:
+                    return lambda environment: environment.assign_variable(
+                        symbol, value(environment)
+                    )
+            elif not node.operator:
+                return lambda environment: environment.assign_resolved(
+                    symbol, depth, slot, value(environment)
+                )
+
+            function = COMPOUND_OPERATORS[node.operator]
+
+            def compound_assignment(environment: Environment) -> RuntimeValue:
+                evaluated = value(environment)
+                current_value = current(environment)
+                if (
+                    current_value.__class__ is NumberValue
+                    and evaluated.__class__ is NumberValue
+                ):
+                    try:
+                        result = NumberValue(
+                            function(current_value.value, evaluated.value)
+                        )
+                    except ZeroDivisionError:
+                        # Let the interpreter raise the error
+                        result = eval_compound_assignment(
+                            current_value, evaluated, node
+                        )
+                else:
+                    result = eval_compound_assignment(current_value, evaluated, node)
+                if depth is None:
+                    return environment.assign_variable(symbol, result)
+                return environment.assign_resolved(symbol, depth, slot, result)
+
+            return compound_assignment
+
+        return lambda environment: eval_assignment(
+            node, value(environment), environment
+        )
+
+    def compile_member_expression(self, node: MemberExpression) -> Closure:
+        """Compile a member expression."""
+        obj = self.compile(node.object)
+        prop = self.compile(node.property) if node.computed else None
+        symbol = node.property.symbol if isinstance(node.property, Identifier) else None
+
+        def member_expression(environment: Environment) -> RuntimeValue:
+            object_value = obj(environment)
+
+            if isinstance(object_value, (ObjectValue, ClassValue, EnumValue)):
+                if prop is not None:
+                    property_value = prop(environment)
+                    if not isinstance(property_value, StringValue):
+                        raise RuntimeError(
+                            "Expected a string as a property." + fmt_pos(node)
+                        )
+                    key = property_value.value
+                else:
+                    if symbol is None:
+                        raise RuntimeError(
+                            "Expected an identifier as a property." + fmt_pos(node)
+                        )
+                    key = symbol
+
+                if isinstance(object_value, ClassValue):
+                    return object_value.methods.get(key, NULL)
+                if isinstance(object_value, EnumValue):
+                    return object_value.values.get(key, NULL)
+                return object_value.properties.get(key, NULL)
+
+            if isinstance(object_value, (ArrayValue, StringValue, MappedFileValue)):
+                if prop is None:
+                    name = "an array"
+                    if isinstance(object_value, StringValue):
+                        name = "a string"
+                    elif isinstance(object_value, MappedFileValue):
+                        name = "a mapped file"
+                    raise RuntimeError(
+                        f"Expected a computed property for {name}: string[number]."
+                        + fmt_pos(node)
+                    )
+
+                index = prop(environment)
+                if not isinstance(index, NumberValue):
+                    raise RuntimeError("Expected a number as an index." + fmt_pos(node))
+                index = int(index.value)
+
+                if isinstance(object_value, (ArrayValue, MappedFileValue)):
+                    return object_value.get(index)
+
+                string = object_value.value
+                return StringValue(string[index]) if len(string) > index else NULL
+
+            raise RuntimeError(
+                "Unsupported value type in member expression." + fmt_pos(node)
+            )
+
+        return member_expression
+
+    def compile_call_expression(
+        self, node: CallExpression, tail_call: bool = False
+    ) -> Closure:
+        """Compile a call expression (or the return of it, for a tail call)."""
+        arguments = [self.compile(argument) for argument in node.arguments]
+        caller = self.compile(node.caller)
+        function_body = self.function_body
+
+        def call_expression(environment: Environment) -> RuntimeValue:
+            values = [argument(environment) for argument in arguments]
+            func = caller(environment)
+
+            if tail_call:
+                if func is environment.function:
+                    # Left to the running call, which runs it in place
+                    raise TailCallException(values)
+                raise ReturnException(call_value(func, values, environment))
+
+            return call_value(func, values, environment)
+
+        def call_value(
+            func: RuntimeValue, values: list[RuntimeValue], environment: Environment
+        ) -> RuntimeValue:
+            if isinstance(func, FunctionValue):
+                body = function_body(func)
+
+                # Tail calls of the function run its body again (in a new frame)
+                while True:
+                    try:
+                        body(Frame(func, values, func.local_slots))
+                    except TailCallException as call:
+                        values = call.arguments
+                        continue
+                    except ReturnException as ret:
+                        return ret.value
+                    except BreakException as e:
+                        raise RuntimeError(
+                            "Break keyword found outside of a loop." + fmt_pos(node)
+                        ) from e
+                    except ContinueException as e:
+                        raise RuntimeError(
+                            "Continue keyword found outside of a loop." + fmt_pos(node)
+                        ) from e
+
+                    return NULL
+
+            if isinstance(func, NativeFunctionValue):
+                return func.call(values, environment, node)
+
+            if isinstance(func, ClassValue) and func.arguments:
+                if len(func.arguments) != len(values):
+                    raise RuntimeError(
+                        f"Expected {len(func.arguments)} arguments, got {len(values)}. "
+                        f"({', '.join(func.arguments)})" + fmt_pos(node)
+                    )
+                return ObjectValue(
+                    properties=dict(zip(func.arguments, values)) | func.methods
+                )
+
+            if isinstance(func, MemoValue):
+                return func.call(
+                    values,
+                    lambda function, arguments: call_value(
+                        function, arguments, environment
+                    ),
+                )
+
+            raise RuntimeError("Cannot call a non-function value." + fmt_pos(node))
+
+        return call_expression
+
+
+def compile_program(program: Program) -> Closure:
+    """Compile a program into a closure."""
+    return ClosureCompiler().compile(program)
+
+
+def execute(program: Program, environment: Environment) -> RuntimeValue:
+    """Compile and run a program."""
+    return compile_program(program)(environment)
@@ -1,55 +1,99 @@
 """Environment class for storing variables (also called scope)."""
 
 import hashlib
+import io
 import json
 import math
+import mmap
 import os
 import random
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from typing import Iterator
 from urllib.parse import quote, unquote
 
 import requests
 
 from eryx.frontend.ast import CallExpression
 from eryx.runtime.values import (
+    FALSE,
+    ITERABLE_TYPES,
+    KEY_TYPES,
+    NULL,
+    TRUE,
     ArrayValue,
     BooleanValue,
     ClassValue,
     EnumValue,
+    FileValue,
     FunctionValue,
+    IteratorValue,
+    MappedFileValue,
+    MapValue,
+    MemoValue,
     NativeFunctionValue,
     NullValue,
     NumberValue,
     ObjectValue,
+    RangeValue,
     RuntimeValue,
+    SetValue,
     StringValue,
+    boolean_value,
+    file_errors,
+    number_value,
 )
 from eryx.utils.pretty_print import fmt_pos
 
 BUILTINS = {}
 
+# Results kept by a memoized function when no max size is given
+MEMO_SIZE = 128
+
+# Value of a local slot whose variable is not declared (yet)
+UNBOUND = object()
+NO_SLOTS: dict[str, int] = {}
+
 
 # pylint: disable=invalid-name
 class Environment:
     """Environment class."""
 
     def __init__(
-        self, parent_env: "Environment | None" = None, disable_file_io: bool = False
+        self,
+        parent_env: "Environment | None" = None,
+        disable_file_io: bool = False,
+        local_slots: dict[str, int] | None = None,
     ):
         self.is_global = parent_env is None
         self.parent = parent_env
-        self.constants = []
+        # Function whose call made this environment (set by Frame)
+        self.function: FunctionValue | None = None
+        self.constants: set[str] = set()
         self.variables = {}
+        # Locals bound by the resolver are stored in a fixed array instead
+        self.local_slots = local_slots or NO_SLOTS
+        self.slots = [UNBOUND] * len(self.local_slots)
         self.disable_file_io = (
             disable_file_io if not parent_env else parent_env.disable_file_io
         )
+        # Files opened by the program, shared by every scope so they can be closed
+        self.open_files: dict[int, FileValue | MappedFileValue] = (
+            {} if not parent_env else parent_env.open_files
+        )
 
         if self.is_global:
             self.setup_scope()
 
+    def close_files(self) -> None:
+        """Close the files the program left open."""
+        for handle in self.open_files.values():
+            handle.close()
+        self.open_files.clear()
+
     def declare_variable(
         self,
         variable_name: str,
@@ -58,14 +102,22 @@ class Environment:
         overwrite: bool = False,
     ) -> RuntimeValue:
         """Declare a variable in the current scope."""
-        # Raise an exception if the variable is already declared
-        if variable_name in self.variables and not overwrite:
-            raise RuntimeError(f'Variable "{variable_name}" already declared')
-
-        self.variables[variable_name] = value
+        slot = self.local_slots.get(variable_name)
+        if slot is not None:
+            if self.slots[slot] is not UNBOUND and not overwrite:
+                raise RuntimeError(f'Variable "{variable_name}" already declared')
+            self.slots[slot] = value
+        else:
+            # Raise an exception if the variable is already declared
+            variables = self.variables
+            if variable_name in variables and not overwrite:
+                raise RuntimeError(f'Variable "{variable_name}" already declared')
+            if variables is BUILTIN_SCOPE:
+                variables = self.own_variables()
+            variables[variable_name] = value
 
         if constant:
-            self.constants.append(variable_name)
+            self.constants.add(variable_name)
 
         return value
 
@@ -78,52 +130,143 @@ class Environment:
         if variable_name in environment.constants and not overwrite:
             raise RuntimeError(f'Cannot assign to constant variable "{variable_name}"')
 
-        environment.variables[variable_name] = value
+        slot = environment.local_slots.get(variable_name)
+        if slot is None:
+            variables = environment.variables
+            if variables is BUILTIN_SCOPE:
+                variables = environment.own_variables()
+            variables[variable_name] = value
+        else:
+            environment.slots[slot] = value
         return value
 
     def lookup_variable(self, variable_name: str) -> RuntimeValue:
         """Lookup a variable in the current scope."""
-        environment = self.resolve(variable_name)
-        return environment.variables[variable_name]
+        environment = self
+        while environment:
+            value = environment.variables.get(variable_name, UNBOUND)
+            if value is UNBOUND:
+                slot = environment.local_slots.get(variable_name)
+                if slot is not None:
+                    value = environment.slots[slot]
+            if value is not UNBOUND:
+                return value
+            environment = environment.parent
+        raise RuntimeError(f'Variable "{variable_name}" not found in scope')
 
     def resolve(self, variable_name: str) -> "Environment":
         """Resolve a variable name to an environment."""
-        # Return self if variable_name exists in the current scope
-        if variable_name in self.variables:
-            return self
-        # If it does not exist, check the parent scope
-        if self.parent:
-            return self.parent.resolve(variable_name)
-        # If it does not exist in the parent scope, raise an exception
+        environment = self
+        while environment:
+            if variable_name in environment.variables:
+                return environment
+            slot = environment.local_slots.get(variable_name)
+            if slot is not None and environment.slots[slot] is not UNBOUND:
+                return environment
+            environment = environment.parent
         raise RuntimeError(f'Variable "{variable_name}" not found in scope')
 
+    def lookup_resolved(
+        self, variable_name: str, depth: int, slot: int | None
+    ) -> RuntimeValue:
+        """Lookup a variable bound by the resolver (slot is None for a name lookup)."""
+        environment = self
+        while depth:
+            environment = environment.parent
+            depth -= 1
+
+        # Environments made by another engine have no slots and use the names
+        if slot is not None and environment.slots:
+            value = environment.slots[slot]
+            if value is not UNBOUND:
+                return value
+            environment = environment.parent
+
+        return environment.lookup_variable(variable_name)
+
+    def assign_resolved(
+        self, variable_name: str, depth: int, slot: int | None, value: RuntimeValue
+    ) -> RuntimeValue:
+        """Assign a value to a variable bound by the resolver."""
+        environment = self
+        while depth:
+            environment = environment.parent
+            depth -= 1
+
+        if (
+            slot is not None
+            and environment.slots
+            and environment.slots[slot] is not UNBOUND
+        ):
+            if variable_name in environment.constants:
+                raise RuntimeError(
+                    f'Cannot assign to constant variable "{variable_name}"'
+                )
+            environment.slots[slot] = value
+            return value
+
+        return environment.assign_variable(variable_name, value)
+
     def delete_variable(self, variable_name: str) -> None:
         """Delete a variable from the current scope."""
-        if variable_name in self.variables:
-            if variable_name in self.constants:
-                del self.constants[self.constants.index(variable_name)]
-            del self.variables[variable_name]
+        slot = self.local_slots.get(variable_name)
+        if slot is not None and self.slots[slot] is not UNBOUND:
+            self.slots[slot] = UNBOUND
+        elif variable_name in self.variables:
+            del self.own_variables()[variable_name]
         else:
             raise RuntimeError(f'Variable "{variable_name}" not found in scope')
 
+        self.constants.discard(variable_name)
+
     def setup_scope(self) -> None:
-        """Setup the global scope."""
-        # Declare global variables
-        self.declare_variable("true", BooleanValue(True), True)
-        self.declare_variable("false", BooleanValue(False), True)
-        self.declare_variable("null", NullValue(), True)
-
-        # Declare native methods
-        self.declare_variable("print", NativeFunctionValue(_print), True)
-        self.declare_variable("input", NativeFunctionValue(_input), True)
-        self.declare_variable("len", NativeFunctionValue(_len), True)
-        self.declare_variable("exit", NativeFunctionValue(_exit), True)
-        self.declare_variable("str", NativeFunctionValue(_str), True)
-        self.declare_variable("int", NativeFunctionValue(_int), True)
-        self.declare_variable("bool", NativeFunctionValue(_bool), True)
-        self.declare_variable("array", NativeFunctionValue(_array), True)
-        self.declare_variable("type", NativeFunctionValue(_type), True)
-        self.declare_variable("range", NativeFunctionValue(_range), True)
+        """Setup the global scope from the shared builtin scope."""
+        # Read only until the first write copies it (see own_variables)
+        self.variables = BUILTIN_SCOPE
+        self.constants = BUILTIN_CONSTANTS  # type: ignore
+
+    def own_variables(self) -> dict[str, RuntimeValue]:
+        """Get the variables to write to, copying the shared builtin scope first."""
+        if self.variables is BUILTIN_SCOPE:
+            # A shallow copy, so the program can shadow or delete builtins in its
+            # own scope while the builtin values themselves are shared
+            self.variables = BUILTIN_SCOPE.copy()
+            self.constants = set(BUILTIN_CONSTANTS)
+        return self.variables
+
+
+class Frame(Environment):
+    """Environment of a function call, its arguments are bound without declaring them."""
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        function: FunctionValue,
+        arguments: list[RuntimeValue],
+        local_slots: dict[str, int] | None,
+    ):
+        parent = function.environment
+        self.is_global = False
+        self.parent = parent
+        self.function = function
+        self.constants = set()
+        self.disable_file_io = parent.disable_file_io
+        self.open_files = parent.open_files
+
+        names = function.arguments
+        values = arguments[: len(names)]
+        if len(values) < len(names):  # Allow less arguments than expected
+            values += [NULL] * (len(names) - len(values))
+
+        if local_slots:
+            self.local_slots = local_slots
+            self.slots = slots = [UNBOUND] * len(local_slots)
+            self.variables = {}
+            for name, value in zip(names, values):
+                slots[local_slots[name]] = value
+        else:
+            self.local_slots = NO_SLOTS
+            self.slots = []
+            self.variables = dict(zip(names, values))
 
 
 def get_value(value: RuntimeValue, inside_array: bool = False) -> str:
@@ -155,9 +298,21 @@ def get_value(value: RuntimeValue, inside_array: bool = False) -> str:
     elif isinstance(value, FunctionValue):
         result = f"<function {value.name}>"
 
+    elif isinstance(value, MemoValue):
+        result = f"<memoized function {value.function.name}>"
+
+    elif isinstance(value, IteratorValue):
+        result = "<iterator>"
+
+    elif isinstance(value, FileValue):
+        result = f"<file {value.path}>"
+
+    elif isinstance(value, MappedFileValue):
+        result = f"<mapped file {value.path}>"
+
     elif isinstance(value, ArrayValue):
         result += "[ "
-        for val in value.elements:
+        for val in value.iterate():
             result += f"{get_value(val, inside_array=True)}, "
         result = result[:-2] + " ]"
 
@@ -167,6 +322,19 @@ def get_value(value: RuntimeValue, inside_array: bool = False) -> str:
             result += f"{key}: {get_value(val, inside_array=True)}, "
         result = result[:-2] + " }"
 
+    elif isinstance(value, MapValue):
+        result = "Map({ " + ", ".join(
+            f"{get_value(key, inside_array=True)}: {get_value(val, inside_array=True)}"
+            for key, val in value.entries.items()
+        )
+        result = result + " })" if value.entries else "Map({})"
+
+    elif isinstance(value, SetValue):
+        result = "Set([ " + ", ".join(
+            get_value(val, inside_array=True) for val in value.items
+        )
+        result = result + " ])" if value.items else "Set([])"
+
     elif isinstance(value, ClassValue):
         result = f"{value.name}("
         if value.arguments:
@@ -193,38 +361,14 @@ def _print(
     for arg in args:
         values.append(get_value(arg))
     print(*values)
-    return NullValue()
+    return NULL
 
 
 def _range(
     args: list[RuntimeValue], _: Environment, __: CallExpression
 ) -> RuntimeValue:
-    if len(args) == 1:
-        if isinstance(args[0], NumberValue):
-            return ArrayValue([NumberValue(i) for i in range(int(args[0].value))])
-    if len(args) == 2:
-        if all(isinstance(i, NumberValue) for i in args):
-            return ArrayValue(
-                [
-                    NumberValue(i)
-                    for i in range(
-                        int(args[0].value),  # type: ignore
-                        int(args[1].value),  # type: ignore
-                    )
-                ]
-            )
-    if len(args) == 3:
-        if all(isinstance(i, NumberValue) for i in args):
-            return ArrayValue(
-                [
-                    NumberValue(i)
-                    for i in range(
-                        int(args[0].value),  # type: ignore
-                        int(args[1].value),  # type: ignore
-                        int(args[2].value),  # type: ignore
-                    )
-                ]
-            )
+    if 1 <= len(args) <= 3 and all(isinstance(i, NumberValue) for i in args):
+        return RangeValue(range(*(int(i.value) for i in args)))  # type: ignore
     raise RuntimeError(f"Cannot create range with {args}")
 
 
@@ -242,13 +386,22 @@ def _input(
 
 def _len(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
     if isinstance(args[0], StringValue):
-        return NumberValue(len(args[0].value))
+        return number_value(len(args[0].value))
 
     if isinstance(args[0], ArrayValue):
-        return NumberValue(len(args[0].elements))
+        return number_value(args[0].length())
+
+    if isinstance(args[0], MappedFileValue):
+        return number_value(len(args[0].open_data()))
 
     if isinstance(args[0], ObjectValue):
-        return NumberValue(len(args[0].properties))
+        return number_value(len(args[0].properties))
+
+    if isinstance(args[0], MapValue):
+        return number_value(len(args[0].entries))
+
+    if isinstance(args[0], SetValue):
+        return number_value(len(args[0].items))
 
     raise RuntimeError(f"Cannot get length of {args[0]}")
 
@@ -271,21 +424,25 @@ def _str(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runtim
 
 def _int(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
     if len(args) == 0:
-        return NumberValue(0)
+        return number_value(0)
     if isinstance(args[0], (StringValue, NumberValue)):
-        return NumberValue(int(args[0].value))
+        return number_value(int(args[0].value))
     raise RuntimeError(f"Cannot convert {args[0]} to int")
 
 
 def _bool(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
     if len(args) == 0:
-        return BooleanValue(False)
+        return FALSE
     if isinstance(args[0], (StringValue, NumberValue, BooleanValue)):
-        return BooleanValue(bool(args[0].value))
+        return boolean_value(bool(args[0].value))
     if isinstance(args[0], ArrayValue):
-        return BooleanValue(bool(args[0].elements))
+        return boolean_value(args[0].length() > 0)
     if isinstance(args[0], ObjectValue):
-        return BooleanValue(bool(args[0].properties))
+        return boolean_value(bool(args[0].properties))
+    if isinstance(args[0], MapValue):
+        return boolean_value(bool(args[0].entries))
+    if isinstance(args[0], SetValue):
+        return boolean_value(bool(args[0].items))
     raise RuntimeError(f"Cannot convert {args[0]} to bool")
 
 
@@ -299,18 +456,48 @@ def _array(
             return ArrayValue(list(args[0].properties.values()))
         if isinstance(args[0], ArrayValue):
             return args[0]
+        if isinstance(args[0], IteratorValue):
+            return ArrayValue(list(args[0].iterate()))
     return ArrayValue(args)
 
 
 def _type(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
+    if isinstance(args[0], RangeValue):
+        return StringValue("ArrayValue")  # Ranges are arrays to programs
     return StringValue(type(args[0]).__name__)
 
 
+def _memo(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
+    if not args or not isinstance(args[0], FunctionValue):
+        raise RuntimeError("Argument must be an Eryx function")
+    if len(args) == 1:
+        return MemoValue(args[0], MEMO_SIZE)
+    if not isinstance(args[1], NumberValue) or args[1].value < 1:
+        raise RuntimeError("Max size must be a positive number")
+    return MemoValue(args[0], int(args[1].value))
+
+
+def _memoStats(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args or not isinstance(args[0], MemoValue):
+        raise RuntimeError("Argument must be a memoized function")
+    memo = args[0]
+    return ObjectValue(
+        {
+            "hits": number_value(memo.hits),
+            "misses": number_value(memo.misses),
+            "size": number_value(len(memo.cache)),
+            "maxSize": number_value(memo.max_size),
+        }
+    )
+
+
 # TIME FUNCTIONS
 
 
 def _time(_: list[RuntimeValue], __: Environment, ___: CallExpression) -> RuntimeValue:
-    return NumberValue(time.time())
+    return number_value(time.time())
 
 
 def _sleep(
@@ -321,7 +508,7 @@ def _sleep(
     if not isinstance(args[0], NumberValue):
         raise RuntimeError("Time must be a number")
     time.sleep(args[0].value)
-    return NullValue()
+    return NULL
 
 
 def _formatTime(
@@ -339,7 +526,7 @@ def _formatTime(
 def _getTimezoneOffset(
     _: list[RuntimeValue], __: Environment, ___: CallExpression
 ) -> RuntimeValue:
-    return NumberValue(time.timezone)
+    return number_value(time.timezone)
 
 
 # FILE FUNCTIONS
@@ -359,11 +546,47 @@ def _readFile(
         raise RuntimeError(f"File '{args[0].value}' not found") from e
 
 
+def _readLines(
+    args: list[RuntimeValue], env: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args:
+        raise RuntimeError("Missing filename argument")
+    if not isinstance(args[0], StringValue):
+        raise RuntimeError("Filename must be a string")
+    try:
+        file = open(  # pylint: disable=consider-using-with
+            args[0].value, "r", encoding="utf8"
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError(f"File '{args[0].value}' not found") from e
+    except OSError as e:  # Directories, permissions, ...
+        raise RuntimeError(f"Cannot open file '{args[0].value}': {e}") from e
+    # Kept with the open handles, to be closed if the lines are not read to the end
+    handle = FileValue(args[0].value, file)
+    env.open_files[id(handle)] = handle
+    return IteratorValue(stream_lines(handle, env.open_files))
+
+
+def stream_lines(
+    handle: FileValue, open_files: dict[int, FileValue | MappedFileValue]
+) -> Iterator[StringValue]:
+    """Stream the lines of a file (without line breaks), then close it."""
+    with handle.file:
+        yield from handle.stream_lines()
+    open_files.pop(id(handle), None)
+
+
 def _writeFile(
     args: list[RuntimeValue], _: Environment, __: CallExpression
 ) -> RuntimeValue:
     if len(args) < 2:
         raise RuntimeError("Missing filename or content argument")
+    if isinstance(args[0], FileValue):
+        if not isinstance(args[1], StringValue):
+            raise RuntimeError("Content must be a string")
+        with file_errors(args[0]):
+            args[0].file.write(args[1].value)
+        return NULL
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Filename must be a string")
     if not isinstance(args[1], StringValue):
@@ -373,7 +596,7 @@ def _writeFile(
             file.write(args[1].value)
     except FileNotFoundError as e:
         raise RuntimeError(f"File '{args[0].value}' not found") from e
-    return NullValue()
+    return NULL
 
 
 def _appendFile(
@@ -390,7 +613,119 @@ def _appendFile(
             file.write(args[1].value)
     except FileNotFoundError as e:
         raise RuntimeError(f"File '{args[0].value}' not found") from e
-    return NullValue()
+    return NULL
+
+
+FILE_MODES = ("r", "w", "a")
+
+
+def _openFile(
+    args: list[RuntimeValue], env: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args:
+        raise RuntimeError("Missing filename argument")
+    if not isinstance(args[0], StringValue):
+        raise RuntimeError("Filename must be a string")
+    mode = args[1] if len(args) > 1 else StringValue("r")
+    if not isinstance(mode, StringValue) or mode.value not in FILE_MODES:
+        raise RuntimeError("Mode must be one of " + ", ".join(FILE_MODES))
+    try:
+        handle = FileValue(
+            args[0].value,
+            open(  # pylint: disable=consider-using-with
+                args[0].value, mode.value, encoding="utf8"
+            ),
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError(f"File '{args[0].value}' not found") from e
+    except OSError as e:  # Directories, permissions, ...
+        raise RuntimeError(f"Cannot open file '{args[0].value}': {e}") from e
+    env.open_files[id(handle)] = handle
+    return handle
+
+
+def _readLine(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args or not isinstance(args[0], FileValue):
+        raise RuntimeError("Missing file handle argument")
+    with file_errors(args[0]):
+        line = args[0].file.readline()
+    if not line:
+        return NULL
+    return StringValue(line.rstrip("\r\n"))
+
+
+def _readChunk(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args or not isinstance(args[0], FileValue):
+        raise RuntimeError("Missing file handle argument")
+    size = args[1] if len(args) > 1 else number_value(io.DEFAULT_BUFFER_SIZE)
+    if not isinstance(size, NumberValue) or size.value < 1:
+        raise RuntimeError("Chunk size must be a positive number")
+    with file_errors(args[0]):
+        chunk = args[0].file.read(int(size.value))
+    if not chunk:
+        return NULL
+    return StringValue(chunk)
+
+
+def _mapFile(
+    args: list[RuntimeValue], env: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args:
+        raise RuntimeError("Missing filename argument")
+    if not isinstance(args[0], StringValue):
+        raise RuntimeError("Filename must be a string")
+    try:
+        with open(args[0].value, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError as e:
+        raise RuntimeError(f"File '{args[0].value}' not found") from e
+    except (OSError, ValueError) as e:  # Empty files cannot be mapped
+        raise RuntimeError(f"Cannot map file '{args[0].value}': {e}") from e
+    mapped = MappedFileValue(args[0].value, data)
+    env.open_files[id(mapped)] = mapped
+    return mapped
+
+
+def mapped_range(args: list[RuntimeValue]) -> tuple[mmap.mmap, int, int]:
+    """Get the data of a mapped file and a byte range (all of it by default)."""
+    if not args or not isinstance(args[0], MappedFileValue):
+        raise RuntimeError("Missing mapped file argument")
+    if not all(isinstance(bound, NumberValue) for bound in args[1:3]):
+        raise RuntimeError("Start and end must be numbers")
+    data = args[0].open_data()
+    start = int(args[1].value) if len(args) > 1 else 0  # type: ignore
+    end = int(args[2].value) if len(args) > 2 else len(data)  # type: ignore
+    return data, start, end
+
+
+def _sliceFile(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    data, start, end = mapped_range(args)
+    return StringValue(data[start:end].decode("utf8", errors="replace"))
+
+
+def _findInFile(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not isinstance(args[1], StringValue):
+        raise RuntimeError("Missing mapped file or string argument")
+    data, start, end = mapped_range(args[:1] + args[2:])
+    return number_value(data.find(args[1].value.encode("utf8"), start, end))
+
+
+def _closeFile(
+    args: list[RuntimeValue], env: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args or not isinstance(args[0], (FileValue, MappedFileValue)):
+        raise RuntimeError("Missing file handle argument")
+    args[0].close()
+    env.open_files.pop(id(args[0]), None)
+    return NULL
 
 
 def _fileExists(
@@ -400,7 +735,7 @@ def _fileExists(
         raise RuntimeError("Missing filename argument")
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Filename must be a string")
-    return BooleanValue(Path(args[0].value).exists())
+    return boolean_value(Path(args[0].value).exists())
 
 
 def _deleteFile(
@@ -414,7 +749,7 @@ def _deleteFile(
         Path(args[0].value).unlink()
     except FileNotFoundError as e:
         raise RuntimeError(f"File '{args[0].value}' not found") from e
-    return NullValue()
+    return NULL
 
 
 def _copyFile(
@@ -430,7 +765,7 @@ def _copyFile(
         Path(args[0].value).write_bytes(Path(args[1].value).read_bytes())
     except FileNotFoundError as e:
         raise RuntimeError(f"File '{args[0].value}' not found") from e
-    return NullValue()
+    return NULL
 
 
 def _moveFile(
@@ -446,7 +781,7 @@ def _moveFile(
         Path(args[0].value).replace(Path(args[1].value))
     except FileNotFoundError as e:
         raise RuntimeError(f"File '{args[0].value}' not found") from e
-    return NullValue()
+    return NULL
 
 
 def _listFiles(
@@ -472,7 +807,7 @@ def _fileSize(
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Filename must be a string")
     try:
-        return NumberValue(Path(args[0].value).stat().st_size)
+        return number_value(Path(args[0].value).stat().st_size)
     except FileNotFoundError as e:
         raise RuntimeError(f"File '{args[0].value}' not found") from e
 
@@ -492,7 +827,7 @@ def _getRequest(
         return ObjectValue(
             {
                 "data": StringValue(response.content.decode("utf-8")),
-                "status": NumberValue(response.status_code),
+                "status": number_value(response.status_code),
             }
         )
     except Exception as e:
@@ -513,7 +848,7 @@ def _postRequest(
         return ObjectValue(
             {
                 "data": StringValue(response.content.decode("utf-8")),
-                "status": NumberValue(response.status_code),
+                "status": number_value(response.status_code),
             }
         )
     except Exception as e:
@@ -534,7 +869,7 @@ def _putRequest(
         return ObjectValue(
             {
                 "data": StringValue(response.content.decode("utf-8")),
-                "status": NumberValue(response.status_code),
+                "status": number_value(response.status_code),
             }
         )
     except Exception as e:
@@ -553,7 +888,7 @@ def _deleteRequest(
         return ObjectValue(
             {
                 "data": StringValue(response.content.decode("utf-8")),
-                "status": NumberValue(response.status_code),
+                "status": number_value(response.status_code),
             }
         )
     except Exception as e:
@@ -588,59 +923,59 @@ def _sqrt(args: list[RuntimeValue], _: Environment, __: CallExpression):
         raise RuntimeError("Missing number value")
     if not isinstance(args[0], NumberValue):
         raise RuntimeError("Input type must be a number")
-    return NumberValue(args[0].value ** 0.5)
+    return number_value(args[0].value ** 0.5)
 
 
 def _random(_: list[RuntimeValue], __: Environment, ___: CallExpression):
-    return NumberValue(random.random())
+    return number_value(random.random())
 
 
 def _round(
     args: list[RuntimeValue], _: Environment, __: CallExpression
 ) -> RuntimeValue:
     if len(args) == 0:
-        return NumberValue(0)
+        return number_value(0)
     if len(args) == 1:
         if isinstance(args[0], NumberValue):
-            return NumberValue(round(args[0].value))
+            return number_value(round(args[0].value))
     elif len(args) == 2:
         if isinstance(args[0], NumberValue) and isinstance(args[1], NumberValue):
-            return NumberValue(round(args[0].value, int(args[1].value)))
+            return number_value(round(args[0].value, int(args[1].value)))
     raise RuntimeError(f"Cannot round {args[0]}")
 
 
 def _sum(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
     if len(args) == 0:
-        return NumberValue(0)
+        return number_value(0)
     if isinstance(args[0], ArrayValue):
-        if all(isinstance(i, NumberValue) for i in args[0].elements):
-            return NumberValue(sum(i.value for i in args[0].elements))  # type: ignore
+        if all(isinstance(i, NumberValue) for i in args[0].iterate()):
+            return number_value(sum(i.value for i in args[0].iterate()))  # type: ignore
     raise RuntimeError(f"Cannot sum {args[0]}")
 
 
 def _min(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
     if len(args) == 0:
-        return NumberValue(0)
+        return number_value(0)
     if isinstance(args[0], ArrayValue):
-        if all(isinstance(i, NumberValue) for i in args[0].elements):
-            return NumberValue(min(i.value for i in args[0].elements))  # type: ignore
+        if all(isinstance(i, NumberValue) for i in args[0].iterate()):
+            return number_value(min(i.value for i in args[0].iterate()))  # type: ignore
     raise RuntimeError(f"Cannot get min for {args[0]}")
 
 
 def _max(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
     if len(args) == 0:
-        return NumberValue(0)
+        return number_value(0)
     if isinstance(args[0], ArrayValue):
-        if all(isinstance(i, NumberValue) for i in args[0].elements):
-            return NumberValue(max(i.value for i in args[0].elements))  # type: ignore
+        if all(isinstance(i, NumberValue) for i in args[0].iterate()):
+            return number_value(max(i.value for i in args[0].iterate()))  # type: ignore
     raise RuntimeError(f"Cannot get max for {args[0]}")
 
 
 def _abs(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
     if len(args) == 0:
-        return NumberValue(0)
+        return number_value(0)
     if isinstance(args[0], NumberValue):
-        return NumberValue(abs(args[0].value))
+        return number_value(abs(args[0].value))
     raise RuntimeError(f"Cannot get abs for {args[0]}")
 
 
@@ -648,7 +983,7 @@ def _pow(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runtim
     if len(args) < 2:
         raise RuntimeError("Missing base or exponent argument")
     if all(isinstance(i, NumberValue) for i in args):
-        return NumberValue(args[0].value ** args[1].value)  # type: ignore
+        return number_value(args[0].value ** args[1].value)  # type: ignore
     raise RuntimeError(f"Cannot get pow for {args}")
 
 
@@ -656,7 +991,7 @@ def _log(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runtim
     if len(args) < 2:
         raise RuntimeError("Missing base or value argument")
     if all(isinstance(i, NumberValue) for i in args):
-        return NumberValue(math.log(args[0].value, args[1].value))  # type: ignore
+        return number_value(math.log(args[0].value, args[1].value))  # type: ignore
     raise RuntimeError(f"Cannot get log for {args}")
 
 
@@ -666,7 +1001,7 @@ def _log10(
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.log10(args[0].value))
+        return number_value(math.log10(args[0].value))
     raise RuntimeError(f"Cannot get log10 for {args[0]}")
 
 
@@ -674,7 +1009,7 @@ def _sin(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runtim
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.sin(args[0].value))
+        return number_value(math.sin(args[0].value))
     raise RuntimeError(f"Cannot get sin for {args[0]}")
 
 
@@ -682,7 +1017,7 @@ def _cos(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runtim
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.sin(args[0].value))
+        return number_value(math.sin(args[0].value))
     raise RuntimeError(f"Cannot get cos for {args[0]}")
 
 
@@ -690,7 +1025,7 @@ def _tan(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runtim
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.sin(args[0].value))
+        return number_value(math.sin(args[0].value))
     raise RuntimeError(f"Cannot get tan for {args[0]}")
 
 
@@ -698,7 +1033,7 @@ def _asin(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runti
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.asin(args[0].value))
+        return number_value(math.asin(args[0].value))
     raise RuntimeError(f"Cannot get asin for {args[0]}")
 
 
@@ -706,7 +1041,7 @@ def _acos(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runti
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.asin(args[0].value))
+        return number_value(math.asin(args[0].value))
     raise RuntimeError(f"Cannot get acos for {args[0]}")
 
 
@@ -714,7 +1049,7 @@ def _atan(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runti
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.asin(args[0].value))
+        return number_value(math.asin(args[0].value))
     raise RuntimeError(f"Cannot get atan for {args[0]}")
 
 
@@ -724,7 +1059,7 @@ def _floor(
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.floor(args[0].value))
+        return number_value(math.floor(args[0].value))
     raise RuntimeError(f"Cannot get floor for {args[0]}")
 
 
@@ -732,7 +1067,7 @@ def _ceil(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runti
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.ceil(args[0].value))
+        return number_value(math.ceil(args[0].value))
     raise RuntimeError(f"Cannot get ceil for {args[0]}")
 
 
@@ -742,7 +1077,7 @@ def _factorial(
     if not args:
         raise RuntimeError("Missing value argument")
     if isinstance(args[0], NumberValue):
-        return NumberValue(math.factorial(int(args[0].value)))
+        return number_value(math.factorial(int(args[0].value)))
     raise RuntimeError(f"Cannot get factorial for {args[0]}")
 
 
@@ -770,9 +1105,9 @@ def _joinStrings(
         raise RuntimeError("Array must be an array")
     if not isinstance(args[1], StringValue):
         raise RuntimeError("Separator must be a string")
-    if not all(isinstance(s, StringValue) for s in args[0].elements):
+    if not all(isinstance(s, StringValue) for s in args[0].iterate()):
         raise RuntimeError("Array must contain only strings")
-    return StringValue(args[1].value.join([s.value for s in args[0].elements]))  # type: ignore
+    return StringValue(args[1].value.join([s.value for s in args[0].iterate()]))  # type: ignore
 
 
 def _replaceString(
@@ -798,7 +1133,7 @@ def _stringContains(
         raise RuntimeError("String must be a string")
     if not isinstance(args[1], StringValue):
         raise RuntimeError("Search must be a string")
-    return BooleanValue(args[1].value in args[0].value)
+    return boolean_value(args[1].value in args[0].value)
 
 
 # ARRAY FUNCTIONS
@@ -810,7 +1145,7 @@ def _push(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runti
     if not isinstance(args[0], ArrayValue):
         raise RuntimeError("First argument must be an array")
     args[0].elements.append(args[1])
-    return NullValue()
+    return NULL
 
 
 def _pop(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
@@ -828,7 +1163,7 @@ def _shift(
         raise RuntimeError("Missing array argument")
     if not isinstance(args[0], ArrayValue):
         raise RuntimeError("Argument must be an array")
-    return args[0].elements.pop(0)
+    return args[0].as_deque().popleft()
 
 
 def _unshift(
@@ -838,8 +1173,8 @@ def _unshift(
         raise RuntimeError("Missing array or value argument")
     if not isinstance(args[0], ArrayValue):
         raise RuntimeError("First argument must be an array")
-    args[0].elements.insert(0, args[1])
-    return NullValue()
+    args[0].as_deque().appendleft(args[1])
+    return NULL
 
 
 def _sort(args: list[RuntimeValue], _: Environment, __: CallExpression) -> RuntimeValue:
@@ -849,8 +1184,169 @@ def _sort(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runti
         raise RuntimeError("Argument must be an array")
     if not all(isinstance(i, NumberValue) for i in args[0].elements):
         raise RuntimeError("Array must contain only numbers")
-    args[0].elements.sort(key=lambda x: x.value)  # type: ignore
-    return NullValue()
+    args[0].elements = sorted(args[0].elements, key=lambda x: x.value)  # type: ignore
+    return NULL
+
+
+# MAP AND SET FUNCTIONS
+
+
+def hashable(value: RuntimeValue) -> RuntimeValue:
+    """Check that a value can be a map key or a set value."""
+    if not isinstance(value, KEY_TYPES):
+        raise RuntimeError(
+            "Map keys and set values must be null, numbers, booleans or strings"
+        )
+    return value
+
+
+def _newMap(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args:
+        return MapValue({})
+    if isinstance(args[0], ObjectValue):
+        return MapValue(
+            {StringValue(key): value for key, value in args[0].properties.items()}
+        )
+    if isinstance(args[0], MapValue):
+        return MapValue(dict(args[0].entries))
+    raise RuntimeError("Argument must be an object or a map")
+
+
+def _mapGet(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not isinstance(args[0], MapValue):
+        raise RuntimeError("Missing map or key argument")
+    return args[0].entries.get(hashable(args[1]), args[2] if len(args) > 2 else NULL)
+
+
+def _mapSet(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 3 or not isinstance(args[0], MapValue):
+        raise RuntimeError("Missing map, key or value argument")
+    args[0].entries[hashable(args[1])] = args[2]
+    return NULL
+
+
+def _mapHas(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not isinstance(args[0], MapValue):
+        raise RuntimeError("Missing map or key argument")
+    return boolean_value(hashable(args[1]) in args[0].entries)
+
+
+def _mapDelete(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not isinstance(args[0], MapValue):
+        raise RuntimeError("Missing map or key argument")
+    return boolean_value(args[0].entries.pop(hashable(args[1]), None) is not None)
+
+
+def _mapKeys(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args or not isinstance(args[0], MapValue):
+        raise RuntimeError("Missing map argument")
+    return ArrayValue(list(args[0].entries))
+
+
+def _mapValues(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args or not isinstance(args[0], MapValue):
+        raise RuntimeError("Missing map argument")
+    return ArrayValue(list(args[0].entries.values()))
+
+
+def _mapUnion(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not all(isinstance(arg, MapValue) for arg in args[:2]):
+        raise RuntimeError("Arguments must be two maps")
+    return MapValue({**args[0].entries, **args[1].entries})  # type: ignore
+
+
+def _mapIntersection(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not all(isinstance(arg, MapValue) for arg in args[:2]):
+        raise RuntimeError("Arguments must be two maps")
+    other = args[1].entries  # type: ignore
+    return MapValue(
+        {key: other[key] for key in args[0].entries if key in other}  # type: ignore
+    )
+
+
+def _newSet(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args:
+        return SetValue({})
+    if not isinstance(args[0], ITERABLE_TYPES):
+        raise RuntimeError("Argument must be an array, string, object or iterator")
+    return SetValue({hashable(value): None for value in args[0].iterate()})
+
+
+def _setAdd(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not isinstance(args[0], SetValue):
+        raise RuntimeError("Missing set or value argument")
+    args[0].items[hashable(args[1])] = None
+    return NULL
+
+
+def _setHas(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not isinstance(args[0], SetValue):
+        raise RuntimeError("Missing set or value argument")
+    return boolean_value(hashable(args[1]) in args[0].items)
+
+
+def _setDelete(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not isinstance(args[0], SetValue):
+        raise RuntimeError("Missing set or value argument")
+    items = args[0].items
+    value = hashable(args[1])
+    if value not in items:
+        return FALSE
+    del items[value]
+    return TRUE
+
+
+def _setValues(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if not args or not isinstance(args[0], SetValue):
+        raise RuntimeError("Missing set argument")
+    return ArrayValue(list(args[0].items))
+
+
+def _setUnion(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not all(isinstance(arg, SetValue) for arg in args[:2]):
+        raise RuntimeError("Arguments must be two sets")
+    return SetValue({**args[0].items, **args[1].items})  # type: ignore
+
+
+def _setIntersection(
+    args: list[RuntimeValue], _: Environment, __: CallExpression
+) -> RuntimeValue:
+    if len(args) < 2 or not all(isinstance(arg, SetValue) for arg in args[:2]):
+        raise RuntimeError("Arguments must be two sets")
+    other = args[1].items  # type: ignore
+    return SetValue(
+        {value: None for value in args[0].items if value in other}  # type: ignore
+    )
 
 
 # OS FUNCTIONS
@@ -870,7 +1366,7 @@ def _changeDir(
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Directory must be a string")
     os.chdir(args[0].value)
-    return NullValue()
+    return NULL
 
 
 def _getEnv(
@@ -894,7 +1390,7 @@ def _exec(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runti
     return ObjectValue(
         {
             "output": StringValue(command.read()),
-            "status": NumberValue(command.close() or 0),
+            "status": number_value(command.close() or 0),
         }
     )
 
@@ -909,11 +1405,11 @@ def json_to_value(data: dict) -> RuntimeValue:
     if isinstance(data, str):
         return StringValue(data)
     if isinstance(data, (int, float)):
-        return NumberValue(data)
+        return number_value(data)
     if isinstance(data, bool):
-        return BooleanValue(data)
+        return boolean_value(data)
     if data is None:
-        return NullValue()
+        return NULL
     return ObjectValue({key: json_to_value(value) for key, value in data.items()})
 
 
@@ -922,7 +1418,14 @@ def value_to_json(value: RuntimeValue) -> dict | list | str | int | float | bool
     if isinstance(value, ObjectValue):
         return {key: value_to_json(val) for key, val in value.properties.items()}
     if isinstance(value, ArrayValue):
-        return [value_to_json(val) for val in value.elements]
+        return [value_to_json(val) for val in value.iterate()]
+    if isinstance(value, MapValue):
+        # JSON keys are strings, get_value keeps 1 and true apart (Python does not)
+        return {
+            get_value(key): value_to_json(val) for key, val in value.entries.items()
+        }
+    if isinstance(value, SetValue):
+        return [value_to_json(val) for val in value.items]
     if isinstance(value, (StringValue, NumberValue, BooleanValue)):
         return value.value
     if isinstance(value, NullValue):
@@ -975,7 +1478,7 @@ def _debugLog(
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Message must be a string")
     print_log("DEBUG", expression, args[0].value)
-    return NullValue()
+    return NULL
 
 
 def _infoLog(
@@ -986,7 +1489,7 @@ def _infoLog(
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Message must be a string")
     print_log("INFO", expression, args[0].value)
-    return NullValue()
+    return NULL
 
 
 def _warnLog(
@@ -997,7 +1500,7 @@ def _warnLog(
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Message must be a string")
     print_log("WARN", expression, args[0].value)
-    return NullValue()
+    return NULL
 
 
 def _errorLog(
@@ -1008,7 +1511,7 @@ def _errorLog(
     if not isinstance(args[0], StringValue):
         raise RuntimeError("Message must be a string")
     print_log("ERROR", expression, args[0].value)
-    return NullValue()
+    return NULL
 
 
 # CRYPTO FUNCTIONS
@@ -1040,10 +1543,40 @@ def _md5(args: list[RuntimeValue], _: Environment, __: CallExpression) -> Runtim
     return StringValue(hashlib.md5(args[0].value.encode()).hexdigest())
 
 
+# Global variables, every global scope starts with them (all of them are constants)
+BUILTIN_SCOPE = MappingProxyType(
+    {
+        "true": TRUE,
+        "false": FALSE,
+        "null": NULL,
+        "print": NativeFunctionValue(_print),
+        "input": NativeFunctionValue(_input),
+        "len": NativeFunctionValue(_len),
+        "exit": NativeFunctionValue(_exit),
+        "str": NativeFunctionValue(_str),
+        "int": NativeFunctionValue(_int),
+        "bool": NativeFunctionValue(_bool),
+        "array": NativeFunctionValue(_array),
+        "type": NativeFunctionValue(_type),
+        "range": NativeFunctionValue(_range),
+        "memo": NativeFunctionValue(_memo),
+        "memoStats": NativeFunctionValue(_memoStats),
+    }
+)
+BUILTIN_CONSTANTS = frozenset(BUILTIN_SCOPE)
+
 # Declare builtin modules
 BUILTINS["file"] = ObjectValue(
     {
         "read": NativeFunctionValue(_readFile),
+        "lines": NativeFunctionValue(_readLines),
+        "open": NativeFunctionValue(_openFile),
+        "readLine": NativeFunctionValue(_readLine),
+        "readChunk": NativeFunctionValue(_readChunk),
+        "close": NativeFunctionValue(_closeFile),
+        "map": NativeFunctionValue(_mapFile),
+        "slice": NativeFunctionValue(_sliceFile),
+        "find": NativeFunctionValue(_findInFile),
         "write": NativeFunctionValue(_writeFile),
         "append": NativeFunctionValue(_appendFile),
         "exists": NativeFunctionValue(_fileExists),
@@ -1074,7 +1607,7 @@ BUILTINS["math"] = ObjectValue(
         "min": NativeFunctionValue(_min),
         "max": NativeFunctionValue(_max),
         "round": NativeFunctionValue(_round),
-        "pi": NumberValue(math.pi),
+        "pi": number_value(math.pi),
         "sqrt": NativeFunctionValue(_sqrt),
         "random": NativeFunctionValue(_random),
         "abs": NativeFunctionValue(_abs),
@@ -1089,7 +1622,7 @@ BUILTINS["math"] = ObjectValue(
         "atan": NativeFunctionValue(_atan),
         "floor": NativeFunctionValue(_floor),
         "ceil": NativeFunctionValue(_ceil),
-        "e": NumberValue(math.e),
+        "e": number_value(math.e),
         "factorial": NativeFunctionValue(_factorial),
     },
     immutable=True,
@@ -1126,6 +1659,34 @@ BUILTINS["array"] = ObjectValue(
     immutable=True,
 )
 
+BUILTINS["map"] = ObjectValue(
+    {
+        "new": NativeFunctionValue(_newMap),
+        "get": NativeFunctionValue(_mapGet),
+        "set": NativeFunctionValue(_mapSet),
+        "has": NativeFunctionValue(_mapHas),
+        "delete": NativeFunctionValue(_mapDelete),
+        "keys": NativeFunctionValue(_mapKeys),
+        "values": NativeFunctionValue(_mapValues),
+        "union": NativeFunctionValue(_mapUnion),
+        "intersection": NativeFunctionValue(_mapIntersection),
+    },
+    immutable=True,
+)
+
+BUILTINS["set"] = ObjectValue(
+    {
+        "new": NativeFunctionValue(_newSet),
+        "add": NativeFunctionValue(_setAdd),
+        "has": NativeFunctionValue(_setHas),
+        "delete": NativeFunctionValue(_setDelete),
+        "values": NativeFunctionValue(_setValues),
+        "union": NativeFunctionValue(_setUnion),
+        "intersection": NativeFunctionValue(_setIntersection),
+    },
+    immutable=True,
+)
+
 BUILTINS["os"] = ObjectValue(
     {
         "cwd": NativeFunctionValue(_getCwd),
@@ -2,6 +2,8 @@
 
 import json
 import os
+from dataclasses import dataclass
+from enum import Enum, auto
 from typing import Tuple
 
 from eryx.frontend.ast import (
@@ -20,6 +22,7 @@ from eryx.frontend.ast import (
     Identifier,
     IfStatement,
     ImportStatement,
+    LogicalExpression,
     LoopStatement,
     MemberExpression,
     NumericLiteral,
@@ -31,45 +34,62 @@ from eryx.frontend.ast import (
     VariableDeclaration,
     WhileStatement,
 )
-from eryx.frontend.parser import Parser
+from eryx.frontend.cache import AST_CACHE
 from eryx.packages.packages import CFG_FILE, INSTALLED_PACKAGES_LOC, packages_dir
-from eryx.runtime.environment import BUILTINS, Environment
+from eryx.runtime.environment import BUILTINS, Environment, Frame
+from eryx.runtime.operators import (
+    COMPOUND_OPERATORS,
+    eval_binary_operation,
+    eval_short_circuit,
+)
 from eryx.runtime.values import (
+    ITERABLE_TYPES,
+    NULL,
     ArrayValue,
     BooleanValue,
     ClassValue,
     EnumValue,
     FunctionValue,
+    MappedFileValue,
+    MemoValue,
     NativeFunctionValue,
     NullValue,
     NumberValue,
     ObjectValue,
     RuntimeValue,
     StringValue,
+    literal_value,
+    number_value,
 )
 from eryx.utils.pretty_print import fmt_pos, pprint
 
 
-# Custom exception to manage returns/breaks/continues
-class ReturnException(Exception):
-    """Dummy exception to manage return statements."""
+class CompletionType(Enum):
+    """Types of abrupt statement completions."""
 
-    def __init__(self, value):
-        self.value = value
+    BREAK = auto()
+    CONTINUE = auto()
+    RETURN = auto()
+    TAIL_CALL = auto()  # A return of a call of the running function
 
 
-class BreakException(Exception):
-    """Dummy exception to manage break statements."""
+@dataclass(slots=True)
+class Completion:
+    """Abrupt completion of a statement (normal completions are plain values)."""
 
-    def __init__(self):
-        pass
+    type: CompletionType
+    value: RuntimeValue | None = None
+    arguments: list[RuntimeValue] | None = None  # Of a tail call
 
 
-class ContinueException(Exception):
-    """Dummy exception to manage continue statements."""
+BREAK = Completion(CompletionType.BREAK)
+CONTINUE = Completion(CompletionType.CONTINUE)
 
-    def __init__(self):
-        pass
+MISPLACED_COMPLETIONS = {
+    CompletionType.BREAK: "Break keyword found outside of a loop.",
+    CompletionType.CONTINUE: "Continue keyword found outside of a loop.",
+    CompletionType.RETURN: "Return statement found outside of a function.",
+}
 
 
 # STATEMENTS
@@ -77,9 +97,7 @@ def eval_variable_declaration(
     declaration: VariableDeclaration, environment: Environment
 ) -> RuntimeValue:
     """Evaluate a variable declaration."""
-    value = (
-        evaluate(declaration.value, environment) if declaration.value else NullValue()
-    )
+    value = evaluate(declaration.value, environment) if declaration.value else NULL
     return environment.declare_variable(
         declaration.identifier.symbol, value, declaration.constant
     )
@@ -108,11 +126,12 @@ def eval_class_declaration(
                 arguments=method.arguments,
                 environment=env,
                 body=method.body,
+                local_slots=method.local_slots,
             )
             class_obj.methods[method.name] = func
 
         if isinstance(method, AssignmentExpression):
-            value = evaluate(method.value, environment) if method.value else NullValue()
+            value = evaluate(method.value, environment) if method.value else NULL
             if not isinstance(method.assigne, Identifier):
                 raise RuntimeError(
                     "Expected an identifier as a property." + fmt_pos(ast_node)
@@ -121,7 +140,7 @@ def eval_class_declaration(
 
     environment.declare_variable(ast_node.name, class_obj)
 
-    return NullValue()
+    return NULL
 
 
 def eval_enum_declaration(
@@ -141,7 +160,7 @@ def eval_enum_declaration(
 
     environment.declare_variable(ast_node.name, enum_obj)
 
-    return NullValue()
+    return NULL
 
 
 def eval_function_declaration(
@@ -154,6 +173,7 @@ def eval_function_declaration(
         arguments=ast_node.arguments,
         environment=environment,
         body=ast_node.body,
+        local_slots=ast_node.local_slots,
     )
 
     return environment.declare_variable(ast_node.name, func, False)
@@ -161,24 +181,14 @@ def eval_function_declaration(
 
 def eval_program(program: Program, environment: Environment) -> RuntimeValue:
     """Evaluate a program."""
-    last_evaluated = NullValue()
+    last_evaluated = NULL
 
-    try:
-        for statement in program.body:
-            last_evaluated = evaluate(statement, environment)
-    except (ReturnException, BreakException, ContinueException) as e:
-        if isinstance(e, ReturnException):
-            raise RuntimeError(
-                "Return statement found outside of a function." + fmt_pos(program)
-            ) from e
-        if isinstance(e, BreakException):
+    for statement in program.body:
+        last_evaluated = evaluate(statement, environment)
+        if isinstance(last_evaluated, Completion):
             raise RuntimeError(
-                "Break keyword found outside of a loop." + fmt_pos(program)
-            ) from e
-        if isinstance(e, ContinueException):
-            raise RuntimeError(
-                "Continue keyword found outside of a loop." + fmt_pos(program)
-            ) from e
+                MISPLACED_COMPLETIONS[last_evaluated.type] + fmt_pos(program)
+            )
 
     return last_evaluated
 
@@ -200,29 +210,36 @@ def eval_assert_statement(
             f"Assertion failed: {assert_statement.message}" + fmt_pos(assert_statement)
         )
 
-    return NullValue()
+    return NULL
+
+
+def eval_statements(
+    statements: list[Statement], environment: Environment
+) -> RuntimeValue | Completion:
+    """Evaluate statements until one of them completes abruptly."""
+    result = NULL
+    for statement in statements:
+        result = evaluate(statement, environment)
+        if isinstance(result, Completion):
+            return result
+
+    return result
 
 
 def eval_if_statement(
     if_statement: IfStatement, environment: Environment
-) -> RuntimeValue:
+) -> RuntimeValue | Completion:
     """Evaluate an if statement."""
     condition = evaluate(if_statement.condition, environment)
-    result = NullValue()
 
     if isinstance(condition, (BooleanValue, NumberValue, StringValue, NullValue)):
         if condition.value:
-            for statement in if_statement.then:
-                result = evaluate(statement, environment)
-            return result
+            return eval_statements(if_statement.then, environment)
 
         if if_statement.else_:
-            for statement in if_statement.else_:
-                if statement:  # Type check stuff
-                    result = evaluate(statement, environment)
-            return result
+            return eval_statements(if_statement.else_, environment)
 
-    return NullValue()
+    return NULL
 
 
 def eval_import_statement(
@@ -268,7 +285,7 @@ def eval_import_statement(
 
             # Import the file
             file_path = module_name
-            with open(file_path + ".eryx", "r", encoding="utf8") as file:
+            with open(file_path, "r", encoding="utf8") as file:
                 source_code = file.read()
         else:
             try:
@@ -302,15 +319,15 @@ def eval_import_statement(
                     f"installed package '{module_name}'." + fmt_pos(import_statement)
                 )
 
-            with open(entrypoint, "r", encoding="utf8") as file:
+            file_path = entrypoint
+            with open(file_path, "r", encoding="utf8") as file:
                 source_code = file.read()
 
         # Run the code
         new_environment = Environment(
             parent_env=environment, disable_file_io=environment.disable_file_io
         )
-        parser = Parser()
-        evaluate(parser.produce_ast(source_code), new_environment)
+        evaluate(AST_CACHE.parse(source_code, file_path), new_environment)
 
         if not import_statement.names:
             # Declare the imported object in the current environment
@@ -330,7 +347,7 @@ def eval_import_statement(
                         + fmt_pos(import_statement)
                     )
 
-    return NullValue()
+    return NULL
 
 
 def eval_del_statement(
@@ -344,29 +361,37 @@ def eval_del_statement(
 
     environment.delete_variable(del_statement.identifier.symbol)
 
-    return NullValue()
+    return NULL
+
+
+def eval_loop_body(
+    body: list[Statement], environment: Environment
+) -> Completion | None:
+    """Evaluate the body of a loop, returning a break or return completion."""
+    result = eval_statements(body, environment)
+    if isinstance(result, Completion) and result.type is not CompletionType.CONTINUE:
+        return result
+
+    return None
 
 
 def eval_loop_statement(
     loop_statement: LoopStatement, environment: Environment
-) -> RuntimeValue:
+) -> RuntimeValue | Completion:
     """Evaluate a loop statement."""
-    try:
-        while True:
-            try:
-                for statement in loop_statement.body:
-                    evaluate(statement, environment)
-            except ContinueException:
-                pass
-    except BreakException:
-        pass
+    while True:
+        completion = eval_loop_body(loop_statement.body, environment)
+        if completion:
+            if completion.type is not CompletionType.BREAK:
+                return completion
+            break
 
-    return NullValue()
+    return NULL
 
 
 def eval_for_statement(
     for_statement: ForStatement, environment: Environment
-) -> RuntimeValue:
+) -> RuntimeValue | Completion:
     """Evaluate a for statement."""
     if not isinstance(for_statement.variable, Identifier):
         raise RuntimeError(
@@ -374,63 +399,55 @@ def eval_for_statement(
         )
 
     variable_value = None
-    try:
-        iterator = evaluate(for_statement.iterator, environment)
-        if not isinstance(iterator, ArrayValue):
-            raise RuntimeError(
-                "Expected an array as an iterator." + fmt_pos(for_statement)
-            )
-
-        try:
-            variable_value = environment.lookup_variable(for_statement.variable.symbol)
-        except RuntimeError:
-            pass
+    iterator = evaluate(for_statement.iterator, environment)
+    if not isinstance(iterator, ITERABLE_TYPES):
+        raise RuntimeError(
+            "Expected an array, string, object or iterator to loop over."
+            + fmt_pos(for_statement)
+        )
 
-        for element in iterator.elements:
-            environment.declare_variable(
-                for_statement.variable.symbol, element, False, True
-            )
-            try:
-                for statement in for_statement.body:
-                    evaluate(statement, environment)
-            except ContinueException:
-                pass
-    except BreakException:
+    try:
+        variable_value = environment.lookup_variable(for_statement.variable.symbol)
+    except RuntimeError:
         pass
 
+    element = None
+    for element in iterator.iterate():
+        environment.declare_variable(
+            for_statement.variable.symbol, element, False, True
+        )
+        completion = eval_loop_body(for_statement.body, environment)
+        if completion:
+            if completion.type is not CompletionType.BREAK:
+                return completion
+            break
+
     if variable_value:
         environment.assign_variable(
             for_statement.variable.symbol, variable_value, overwrite=True
         )
-    else:
+    elif element is not None:  # Only if the loop declared it
         environment.delete_variable(for_statement.variable.symbol)
 
-    return NullValue()
+    return NULL
 
 
 def eval_while_statement(
     while_statement: WhileStatement, environment: Environment
-) -> RuntimeValue:
+) -> RuntimeValue | Completion:
     """Evaluate a while statement."""
+    while True:
+        condition = evaluate(while_statement.condition, environment)
+        if isinstance(condition, (BooleanValue, NumberValue, StringValue, NullValue)):
+            if not condition.value:
+                break
+            completion = eval_loop_body(while_statement.body, environment)
+            if completion:
+                if completion.type is not CompletionType.BREAK:
+                    return completion
+                break
 
-    try:
-        while True:
-            condition = evaluate(while_statement.condition, environment)
-            if isinstance(
-                condition, (BooleanValue, NumberValue, StringValue, NullValue)
-            ):
-                if condition.value:
-                    try:
-                        for statement in while_statement.body:
-                            evaluate(statement, environment)
-                    except ContinueException:
-                        pass
-                else:
-                    break
-    except BreakException:
-        pass
-
-    return NullValue()
+    return NULL
 
 
 # EXPRESSIONS
@@ -441,92 +458,22 @@ def eval_binary_expression(
     left = evaluate(binop.left, environment)
     right = evaluate(binop.right, environment)
 
-    if isinstance(left, NumberValue) and isinstance(right, NumberValue):
-        if binop.operator in ["+", "-", "*", "/", "%"]:
-            try:
-                return eval_numeric_binary_expression(left, right, binop.operator)
-            except ZeroDivisionError as e:
-                raise RuntimeError("Division by zero." + fmt_pos(binop)) from e
-
-        if binop.operator in ["==", "!=", "<", ">", "<=", ">="]:
-            return BooleanValue(
-                eval_numeric_comparison_expression(left, right, binop.operator)
-            )
-
-        if binop.operator == "**":
-            return NumberValue(left.value**right.value)
-
-        if binop.operator in ["^", "&", "|", "<<", ">>"]:
-            return eval_numeric_bitwise_expression(left, right, binop.operator)
-
-        if binop.operator in ["&&", "||"]:
-            return eval_logical_expression(left, right, binop.operator)
-
-        raise RuntimeError(
-            f"Unknown binary operator {binop.operator}." + fmt_pos(binop)
-        )
-
-    if binop.operator in ["&&", "||"]:
-        if isinstance(left, (BooleanValue, StringValue)) and isinstance(
-            right, (BooleanValue, StringValue)
-        ):
-            return eval_logical_expression(left, right, binop.operator)
-        raise RuntimeError(
-            "Expected boolean, string or number values for logical operators."
-            + fmt_pos(binop)
-        )
-
-    if binop.operator == "+":
-        if isinstance(left, StringValue) and isinstance(right, StringValue):
-            return StringValue(left.value + right.value)
-
-        if isinstance(left, ArrayValue) and isinstance(right, ArrayValue):
-            return ArrayValue(left.elements + right.elements)
+    return eval_binary_operation(binop, left, right)
 
-        if isinstance(left, ObjectValue) and isinstance(right, ObjectValue):
-            return ObjectValue({**left.properties, **right.properties})
 
-        return NullValue()
-
-    if binop.operator == "==":
-        if isinstance(left, ArrayValue) and isinstance(right, ArrayValue):
-            return BooleanValue(left.elements == right.elements)
-
-        if isinstance(left, ObjectValue) and isinstance(right, ObjectValue):
-            return BooleanValue(left.properties == right.properties)
-
-        if isinstance(left, (FunctionValue, NativeFunctionValue)) and isinstance(
-            right, (FunctionValue, NativeFunctionValue)
-        ):
-            return BooleanValue(left == right)
-
-        if isinstance(
-            left, (StringValue, NumberValue, BooleanValue, NullValue)
-        ) and isinstance(right, (StringValue, NumberValue, BooleanValue, NullValue)):
-            return BooleanValue(left.value == right.value)
-
-        return BooleanValue(False)
-
-    if binop.operator == "!=":
-        if isinstance(left, ArrayValue) and isinstance(right, ArrayValue):
-            return BooleanValue(left.elements != right.elements)
-
-        if isinstance(left, ObjectValue) and isinstance(right, ObjectValue):
-            return BooleanValue(left.properties != right.properties)
-
-        if isinstance(left, (FunctionValue, NativeFunctionValue)) and isinstance(
-            right, (FunctionValue, NativeFunctionValue)
-        ):
-            return BooleanValue(left != right)
-
-        if isinstance(
-            left, (StringValue, NumberValue, BooleanValue, NullValue)
-        ) and isinstance(right, (StringValue, NumberValue, BooleanValue, NullValue)):
-            return BooleanValue(left.value != right.value)
+def eval_logical_expression(
+    expression: LogicalExpression, environment: Environment
+) -> RuntimeValue:
+    """Evaluate a logical expression (the right side only if it is needed)."""
+    left = evaluate(expression.left, environment)
 
-        return BooleanValue(True)
+    result = eval_short_circuit(expression, left)
+    if result is not None:
+        return result
 
-    return NullValue()
+    return eval_binary_operation(
+        expression, left, evaluate(expression.right, environment)
+    )
 
 
 def eval_member_expression(
@@ -551,27 +498,24 @@ def eval_member_expression(
             property_value = member.property.symbol
 
         if isinstance(object_value, ClassValue):
-            return object_value.methods.get(property_value, NullValue())
+            return object_value.methods.get(property_value, NULL)
 
         if isinstance(object_value, EnumValue):
-            return object_value.values.get(property_value, NullValue())
+            return object_value.values.get(property_value, NULL)
 
-        return object_value.properties.get(property_value, NullValue())
+        return object_value.properties.get(property_value, NULL)
 
-    if isinstance(object_value, ArrayValue):
+    if isinstance(object_value, (ArrayValue, MappedFileValue)):
         if member.computed:
             property_value = evaluate(member.property, environment)
             if not isinstance(property_value, NumberValue):
                 raise RuntimeError("Expected a number as an index." + fmt_pos(member))
 
-            return (
-                object_value.elements[int(property_value.value)]
-                if len(object_value.elements) > int(property_value.value)
-                else NullValue()
-            )
+            return object_value.get(int(property_value.value))
 
+        name = "an array" if isinstance(object_value, ArrayValue) else "a mapped file"
         raise RuntimeError(
-            "Expected a computed property for an array: string[number]."
+            f"Expected a computed property for {name}: string[number]."
             + fmt_pos(member)
         )
 
@@ -584,7 +528,7 @@ def eval_member_expression(
             return (
                 StringValue(object_value.value[int(property_value.value)])
                 if len(object_value.value) > int(property_value.value)
-                else NullValue()
+                else NULL
             )
 
         raise RuntimeError(
@@ -595,82 +539,6 @@ def eval_member_expression(
     raise RuntimeError("Unsupported value type in member expression." + fmt_pos(member))
 
 
-def eval_numeric_binary_expression(
-    left: NumberValue, right: NumberValue, operator: str
-) -> NumberValue | NullValue:
-    """Evaluate a binary expression with two parsed numeric operands (always numbers)."""
-    match operator:
-        case "+":
-            return NumberValue(left.value + right.value)
-        case "-":
-            return NumberValue(left.value - right.value)
-        case "*":
-            return NumberValue(left.value * right.value)
-        case "/":
-            if right.value == 0:
-                raise ZeroDivisionError()
-            return NumberValue(left.value / right.value)
-        case "%":
-            return NumberValue(left.value % right.value)
-
-    return NullValue()
-
-
-def eval_numeric_comparison_expression(
-    left: NumberValue, right: NumberValue, operator: str
-) -> bool:
-    """Evaluate a numeric comparison expression."""
-    match operator:
-        case "==":
-            return left.value == right.value
-        case "!=":
-            return left.value != right.value
-        case "<":
-            return left.value < right.value
-        case ">":
-            return left.value > right.value
-        case "<=":
-            return left.value <= right.value
-        case ">=":
-            return left.value >= right.value
-
-    return False
-
-
-def eval_logical_expression(
-    left: BooleanValue | StringValue | NumberValue | NullValue,
-    right: BooleanValue | StringValue | NumberValue | NullValue,
-    operator: str,
-) -> BooleanValue | NullValue:
-    """Evaluate a logical expression."""
-    match operator:
-        case "&&":
-            return BooleanValue(bool(left.value) and bool(right.value))
-        case "||":
-            return BooleanValue(bool(left.value) or bool(right.value))
-
-    return NullValue()
-
-
-def eval_numeric_bitwise_expression(
-    left: NumberValue, right: NumberValue, operator: str
-) -> NumberValue | NullValue:
-    """Evaluate a numeric binary expression."""
-    match operator:
-        case "^":
-            return NumberValue(int(left.value) ^ int(right.value))
-        case "&":
-            return NumberValue(int(left.value) & int(right.value))
-        case "|":
-            return NumberValue(int(left.value) | int(right.value))
-        case "<<":
-            return NumberValue(int(left.value) << int(right.value))
-        case ">>":
-            return NumberValue(int(left.value) >> int(right.value))
-
-    return NullValue()
-
-
 def eval_object_expression(
     obj: ObjectLiteral, environment: Environment
 ) -> RuntimeValue:
@@ -690,16 +558,31 @@ def eval_object_expression(
 
 def eval_identifier(identifier: Identifier, environment: Environment) -> RuntimeValue:
     """Evaluate an identifier."""
-    return environment.lookup_variable(identifier.symbol)
+    if identifier.depth is None:
+        return environment.lookup_variable(identifier.symbol)
+    return environment.lookup_resolved(
+        identifier.symbol, identifier.depth, identifier.slot
+    )
+
+
+def assign_identifier(
+    identifier: Identifier, value: RuntimeValue, environment: Environment
+) -> RuntimeValue:
+    """Assign a value to the variable of an identifier."""
+    if identifier.depth is None:
+        return environment.assign_variable(identifier.symbol, value)
+    return environment.assign_resolved(
+        identifier.symbol, identifier.depth, identifier.slot, value
+    )
 
 
 def assignment_helper(
     value: Identifier | RuntimeValue,
+    evaluated: RuntimeValue,
     node: AssignmentExpression,
     environment: Environment,
 ) -> NumberValue:
     """Helper function for assignment expressions."""
-    evaluated = evaluate(node.value, environment)
     if isinstance(value, Identifier):
         assigne_value = environment.lookup_variable(value.symbol)
     elif isinstance(value, NumberValue):
@@ -709,33 +592,28 @@ def assignment_helper(
             "Expected an identifier or number value for an assignment." + fmt_pos(node)
         )
 
+    return eval_compound_assignment(assigne_value, evaluated, node)
+
+
+def eval_compound_assignment(
+    assigne_value: RuntimeValue, evaluated: RuntimeValue, node: AssignmentExpression
+) -> NumberValue:
+    """Apply the operator of a compound assignment to the current and new values."""
+    if assigne_value.__class__ is NumberValue and evaluated.__class__ is NumberValue:
+        function = COMPOUND_OPERATORS.get(node.operator)
+        if function is not None:
+            try:
+                value = function(assigne_value.value, evaluated.value)  # type: ignore
+            except ZeroDivisionError as e:
+                raise RuntimeError("Division by zero." + fmt_pos(node)) from e
+            return number_value(value)
+
     if not isinstance(assigne_value, NumberValue):
         raise RuntimeError(
             "Expected a number value (assigne) for an assignment." + fmt_pos(node)
         )
     if not isinstance(evaluated, NumberValue):
         raise RuntimeError("Expected a number value for an assignment." + fmt_pos(node))
-
-    if node.operator == "+=":
-        return NumberValue(assigne_value.value + evaluated.value)
-    if node.operator == "-=":
-        return NumberValue(assigne_value.value - evaluated.value)
-    if node.operator == "*=":
-        return NumberValue(assigne_value.value * evaluated.value)
-    if node.operator == "/=":
-        return NumberValue(assigne_value.value / evaluated.value)
-    if node.operator == "%=":
-        return NumberValue(assigne_value.value % evaluated.value)
-    if node.operator == "^=":
-        return NumberValue(assigne_value.value**evaluated.value)
-    if node.operator == "&=":
-        return NumberValue(int(assigne_value.value) & int(evaluated.value))
-    if node.operator == "|=":
-        return NumberValue(int(assigne_value.value) | int(evaluated.value))
-    if node.operator == "<<=":
-        return NumberValue(int(assigne_value.value) << int(evaluated.value))
-    if node.operator == ">>=":
-        return NumberValue(int(assigne_value.value) >> int(evaluated.value))
     raise RuntimeError(f"Unknown assignment operator: {node.operator}" + fmt_pos(node))
 
 
@@ -743,29 +621,24 @@ def eval_assignment_expression(
     node: AssignmentExpression, environment: Environment
 ) -> RuntimeValue:
     """Evaluate an assignment expression."""
-    value = evaluate(node.value, environment)
+    return eval_assignment(node, evaluate(node.value, environment), environment)
+
 
+def eval_assignment(
+    node: AssignmentExpression, value: RuntimeValue, environment: Environment
+) -> RuntimeValue:
+    """Assign the evaluated value of an assignment expression to its assigne."""
     if node.operator:
-        if node.operator not in [
-            "+=",
-            "-=",
-            "*=",
-            "/=",
-            "%=",
-            "^=",
-            "&=",
-            "|=",
-            "<<=",
-            ">>=",
-        ]:
+        if node.operator not in COMPOUND_OPERATORS:
             raise RuntimeError(
                 f"Unknown assignment operator: '{node.operator}'" + fmt_pos(node)
             )
 
         if isinstance(node.assigne, Identifier):
-            value = assignment_helper(node.assigne, node, environment)
-            environment.assign_variable(node.assigne.symbol, value)
-            return value
+            value = eval_compound_assignment(
+                eval_identifier(node.assigne, environment), value, node
+            )
+            return assign_identifier(node.assigne, value, environment)
 
         if isinstance(node.assigne, MemberExpression):
             obj, prop = resolve_member_expression(
@@ -792,16 +665,17 @@ def eval_assignment_expression(
                         f'Cannot assign to immutable object "{prop}"' + fmt_pos(node)
                     )
 
-                value = assignment_helper(obj.properties[prop], node, environment)
+                value = assignment_helper(
+                    obj.properties[prop], value, node, environment
+                )
                 obj.properties[prop] = value
             else:
-                value = assignment_helper(obj.methods[prop], node, environment)
+                value = assignment_helper(obj.methods[prop], value, node, environment)
                 obj.methods[prop] = value
             return value
 
     if isinstance(node.assigne, Identifier):
-        environment.assign_variable(node.assigne.symbol, value)
-        return value
+        return assign_identifier(node.assigne, value, environment)
 
     if isinstance(node.assigne, MemberExpression):
         obj, prop = resolve_member_expression(
@@ -854,9 +728,9 @@ def resolve_member_expression(
             current = parent.properties[prop] = ObjectValue(properties={})
         else:
             if isinstance(parent, ObjectValue):
-                current = parent.properties.get(prop, NullValue())
+                current = parent.properties.get(prop, NULL)
             else:
-                current = NullValue()
+                current = NULL
 
     if not isinstance(current, ObjectValue) and create_path:
         current = ObjectValue(properties={})
@@ -870,6 +744,25 @@ def resolve_member_expression(
     return current, str(prop)
 
 
+def eval_return_statement(
+    return_statement: ReturnStatement, environment: Environment
+) -> Completion:
+    """Evaluate a return statement."""
+    expression = return_statement.value
+    if not return_statement.tail_call:
+        return Completion(CompletionType.RETURN, evaluate(expression, environment))
+
+    arguments = [evaluate(arg, environment) for arg in expression.arguments]
+    func = evaluate(expression.caller, environment)
+    if func is environment.function:
+        # Left to the running call, which runs it in place instead of nesting a call
+        return Completion(CompletionType.TAIL_CALL, arguments=arguments)
+
+    return Completion(
+        CompletionType.RETURN, call_value(func, arguments, expression, environment)
+    )
+
+
 def eval_call_expression(
     expression: CallExpression, environment: Environment
 ) -> RuntimeValue:
@@ -877,6 +770,16 @@ def eval_call_expression(
     arguments = [evaluate(arg, environment) for arg in expression.arguments]
     func = evaluate(expression.caller, environment)
 
+    return call_value(func, arguments, expression, environment)
+
+
+def call_value(
+    func: RuntimeValue,
+    arguments: list[RuntimeValue],
+    expression: CallExpression,
+    environment: Environment,
+) -> RuntimeValue:
+    """Call a function (or construct a class) with evaluated arguments."""
     if isinstance(func, NativeFunctionValue):
         result = func.call(arguments, environment, expression)
         return result
@@ -894,43 +797,44 @@ def eval_call_expression(
             return ObjectValue(properties=new_args | methods)
 
     if isinstance(func, FunctionValue):
-        function_environment = Environment(
-            func.environment, disable_file_io=environment.disable_file_io
-        )
-
-        for i, function_argument in enumerate(func.arguments):
-            if i >= len(arguments):  # Allow less arguments than expected
-                function_environment.declare_variable(
-                    function_argument, NullValue(), False
-                )
+        # Tail calls of the function run its body again (in a new frame), as a loop
+        while True:
+            result = eval_statements(
+                func.body, Frame(func, arguments, func.local_slots)
+            )
+            if not isinstance(result, Completion):
+                return NULL
+            if result.type is CompletionType.TAIL_CALL:
+                arguments = result.arguments  # type: ignore
+            elif result.type is CompletionType.RETURN:
+                return result.value  # type: ignore
             else:
-                function_environment.declare_variable(
-                    function_argument, arguments[i], False
+                raise RuntimeError(
+                    MISPLACED_COMPLETIONS[result.type] + fmt_pos(expression)
                 )
 
-        # Evaluate the function body statement by statement
-        try:
-            for statement in func.body:
-                evaluate(statement, function_environment)
-        except ReturnException as ret:
-            return ret.value
-
-        return NullValue()
+    if isinstance(func, MemoValue):
+        return func.call(
+            arguments,
+            lambda function, values: call_value(
+                function, values, expression, environment
+            ),
+        )
 
     raise RuntimeError("Cannot call a non-function value." + fmt_pos(expression))
 
 
 # MAIN
-def evaluate(ast_node: Statement | None, environment: Environment) -> RuntimeValue:
+def evaluate(
+    ast_node: Statement | None, environment: Environment
+) -> RuntimeValue | Completion:
     """Evaluate an AST node."""
     if not ast_node:
-        return NullValue()
+        return NULL
 
     match ast_node:
-        case NumericLiteral():
-            return NumberValue(ast_node.value)
-        case StringLiteral():
-            return StringValue(ast_node.value)
+        case NumericLiteral() | StringLiteral():
+            return ast_node.runtime_value or literal_value(ast_node)
         case ArrayLiteral():
             return ArrayValue(
                 [evaluate(element, environment) for element in ast_node.elements]
@@ -939,6 +843,8 @@ def evaluate(ast_node: Statement | None, environment: Environment) -> RuntimeVal
             return eval_identifier(ast_node, environment)
         case BinaryExpression():
             return eval_binary_expression(ast_node, environment)
+        case LogicalExpression():
+            return eval_logical_expression(ast_node, environment)
         case AssignmentExpression():
             return eval_assignment_expression(ast_node, environment)
         case CallExpression():
@@ -970,13 +876,11 @@ def evaluate(ast_node: Statement | None, environment: Environment) -> RuntimeVal
         case ForStatement():
             return eval_for_statement(ast_node, environment)
         case BreakLiteral():
-            raise BreakException()
+            return BREAK
         case ContinueLiteral():
-            raise ContinueException()
+            return CONTINUE
         case ReturnStatement():
-            # Directly evaluate and raise ReturnException if it's a return statement
-            value = evaluate(ast_node.value, environment)
-            raise ReturnException(value)
+            return eval_return_statement(ast_node, environment)
         case ImportStatement():
             return eval_import_statement(ast_node, environment)
         case _:
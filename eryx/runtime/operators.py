@@ -0,0 +1,215 @@
+"""Operators shared by the execution engines and the optimizer."""
+
+import operator
+from itertools import product
+from typing import Callable
+
+from eryx.frontend.ast import BinaryExpression, LogicalExpression
+from eryx.runtime.values import (
+    FALSE,
+    NULL,
+    TRUE,
+    ArrayValue,
+    BooleanValue,
+    FunctionValue,
+    MapValue,
+    NativeFunctionValue,
+    NullValue,
+    NumberValue,
+    ObjectValue,
+    RangeValue,
+    RuntimeValue,
+    SetValue,
+    StringValue,
+    boolean_value,
+    number_value,
+)
+from eryx.utils.pretty_print import fmt_pos
+
+Operation = Callable[[RuntimeValue, RuntimeValue], RuntimeValue]
+
+PRIMITIVE_TYPES = (StringValue, NumberValue, BooleanValue, NullValue)
+FUNCTION_TYPES = (FunctionValue, NativeFunctionValue)
+ARRAY_TYPES = (ArrayValue, RangeValue)
+LOGICAL_TYPES = (BooleanValue, StringValue, NumberValue)
+
+
+def comparison(function: Callable) -> Operation:
+    """Make a comparison of the values of two primitives."""
+    return lambda left, right: TRUE if function(left.value, right.value) else FALSE
+
+
+def logical(function: Callable) -> Operation:
+    """Make a logical operation on the truthiness of two primitives."""
+    return lambda left, right: boolean_value(
+        function(bool(left.value), bool(right.value))
+    )
+
+
+# Handlers of binary operations by (operator, left type, right type), anything
+# missing falls back to eval_unsupported_operation
+BINARY_OPERATIONS: dict[tuple[str, type, type], Operation] = {
+    ("+", NumberValue, NumberValue): lambda left, right: number_value(
+        left.value + right.value
+    ),
+    ("-", NumberValue, NumberValue): lambda left, right: number_value(
+        left.value - right.value
+    ),
+    ("*", NumberValue, NumberValue): lambda left, right: number_value(
+        left.value * right.value
+    ),
+    ("/", NumberValue, NumberValue): lambda left, right: number_value(
+        left.value / right.value
+    ),
+    ("%", NumberValue, NumberValue): lambda left, right: number_value(
+        left.value % right.value
+    ),
+    ("**", NumberValue, NumberValue): lambda left, right: number_value(
+        left.value**right.value
+    ),
+    ("<", NumberValue, NumberValue): lambda left, right: (
+        TRUE if left.value < right.value else FALSE
+    ),
+    (">", NumberValue, NumberValue): lambda left, right: (
+        TRUE if left.value > right.value else FALSE
+    ),
+    ("<=", NumberValue, NumberValue): lambda left, right: (
+        TRUE if left.value <= right.value else FALSE
+    ),
+    (">=", NumberValue, NumberValue): lambda left, right: (
+        TRUE if left.value >= right.value else FALSE
+    ),
+    ("^", NumberValue, NumberValue): lambda left, right: number_value(
+        int(left.value) ^ int(right.value)
+    ),
+    ("&", NumberValue, NumberValue): lambda left, right: number_value(
+        int(left.value) & int(right.value)
+    ),
+    ("|", NumberValue, NumberValue): lambda left, right: number_value(
+        int(left.value) | int(right.value)
+    ),
+    ("<<", NumberValue, NumberValue): lambda left, right: number_value(
+        int(left.value) << int(right.value)
+    ),
+    (">>", NumberValue, NumberValue): lambda left, right: number_value(
+        int(left.value) >> int(right.value)
+    ),
+    ("+", StringValue, StringValue): lambda left, right: StringValue(
+        left.value + right.value
+    ),
+    ("+", ObjectValue, ObjectValue): lambda left, right: ObjectValue(
+        {**left.properties, **right.properties}
+    ),
+    ("==", ObjectValue, ObjectValue): lambda left, right: boolean_value(
+        left.properties == right.properties
+    ),
+    ("!=", ObjectValue, ObjectValue): lambda left, right: boolean_value(
+        left.properties != right.properties
+    ),
+}
+
+# Primitives compare by value, even across types (1 == true)
+for left_type, right_type in product(PRIMITIVE_TYPES, repeat=2):
+    BINARY_OPERATIONS[("==", left_type, right_type)] = comparison(operator.eq)
+    BINARY_OPERATIONS[("!=", left_type, right_type)] = comparison(operator.ne)
+
+# Ranges are arrays, read without building their elements
+for left_type, right_type in product(ARRAY_TYPES, repeat=2):
+    BINARY_OPERATIONS[("+", left_type, right_type)] = lambda left, right: ArrayValue(
+        [*left.iterate(), *right.iterate()]
+    )
+    BINARY_OPERATIONS[("==", left_type, right_type)] = lambda left, right: (
+        boolean_value(left == right)
+    )
+    BINARY_OPERATIONS[("!=", left_type, right_type)] = lambda left, right: (
+        boolean_value(left != right)
+    )
+
+for left_type, right_type in [
+    *product(FUNCTION_TYPES, repeat=2),
+    (MapValue, MapValue),
+    (SetValue, SetValue),
+]:
+    BINARY_OPERATIONS[("==", left_type, right_type)] = lambda left, right: (
+        boolean_value(left == right)
+    )
+    BINARY_OPERATIONS[("!=", left_type, right_type)] = lambda left, right: (
+        boolean_value(left != right)
+    )
+
+for left_type, right_type in [
+    (NumberValue, NumberValue),
+    *product((BooleanValue, StringValue), repeat=2),
+]:
+    BINARY_OPERATIONS[("&&", left_type, right_type)] = logical(operator.and_)
+    BINARY_OPERATIONS[("||", left_type, right_type)] = logical(operator.or_)
+
+# Compound assignments only apply to numbers, so they are keyed by operator alone
+# and take the raw values ("^=" is a power, unlike the "^" operator)
+COMPOUND_OPERATORS: dict[str, Callable[[float, float], float]] = {
+    "+=": operator.add,
+    "-=": operator.sub,
+    "*=": operator.mul,
+    "/=": operator.truediv,
+    "%=": operator.mod,
+    "^=": operator.pow,
+    "&=": lambda left, right: int(left) & int(right),
+    "|=": lambda left, right: int(left) | int(right),
+    "<<=": lambda left, right: int(left) << int(right),
+    ">>=": lambda left, right: int(left) >> int(right),
+}
+
+
+def eval_short_circuit(
+    expression: LogicalExpression, left: RuntimeValue
+) -> BooleanValue | None:
+    """Get the result of a logical expression decided by its left side, if any."""
+    if not isinstance(left, LOGICAL_TYPES):
+        raise RuntimeError(
+            "Expected boolean, string or number values for logical operators."
+            + fmt_pos(expression)
+        )
+
+    if expression.operator == "&&":
+        return None if left.value else FALSE
+    return TRUE if left.value else None
+
+
+def eval_binary_operation(
+    binop: BinaryExpression | LogicalExpression,
+    left: RuntimeValue,
+    right: RuntimeValue,
+) -> RuntimeValue:
+    """Apply the operator of a binary expression to its evaluated operands."""
+    operation = BINARY_OPERATIONS.get((binop.operator, left.__class__, right.__class__))
+    if operation is None:
+        return eval_unsupported_operation(binop, left, right)
+
+    try:
+        return operation(left, right)
+    except ZeroDivisionError as e:
+        raise RuntimeError("Division by zero." + fmt_pos(binop)) from e
+
+
+def eval_unsupported_operation(
+    binop: BinaryExpression | LogicalExpression,
+    left: RuntimeValue,
+    right: RuntimeValue,
+) -> RuntimeValue:
+    """Evaluate a binary operation without a handler for its operand types."""
+    if isinstance(left, NumberValue) and isinstance(right, NumberValue):
+        raise RuntimeError(
+            f"Unknown binary operator {binop.operator}." + fmt_pos(binop)
+        )
+
+    if binop.operator in ("&&", "||"):
+        raise RuntimeError(
+            "Expected boolean, string or number values for logical operators."
+            + fmt_pos(binop)
+        )
+
+    if binop.operator == "==":
+        return FALSE
+    if binop.operator == "!=":
+        return TRUE
+    return NULL
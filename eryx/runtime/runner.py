@@ -1,15 +1,28 @@
 """Module for running Eryx code."""
 
+import sys
+
 from colorama import Fore
 
+from eryx.frontend.cache import AST_CACHE
 from eryx.frontend.lexer import tokenize
+from eryx.frontend.optimizer import optimize_program
 from eryx.frontend.parser import Parser
 from eryx.frontend.transpiler import transpile
+from eryx.runtime import closures, vm
+from eryx.runtime.bytecode import compile_program, disassemble
 from eryx.runtime.environment import Environment, get_value
 from eryx.runtime.interpreter import evaluate
 from eryx.runtime.values import NullValue
 from eryx.utils.pretty_print import pprint
 
+# Execution engines (all of them take the AST and an environment)
+ENGINES = {
+    "interpreter": evaluate,
+    "closures": closures.execute,
+    "vm": vm.execute,
+}
+
 
 class TokenList:
     """List of tokens to use with the pretty printer."""
@@ -26,11 +39,16 @@ def run_code(
     environment: Environment | None = None,
     parser: Parser | None = None,
     transpile_code: bool = False,
+    file_path: str | None = None,
+    engine: str = "interpreter",
+    log_bytecode: bool = False,
+    optimize: bool = False,
 ) -> str | None:
-    """Run an Eryx file."""
+    """Run an Eryx file (the AST is cached on disk when file_path is given)."""
 
     result = None
 
+    owns_environment = environment is None
     environment = environment or Environment()
     parser = parser or Parser()
 
@@ -45,10 +63,20 @@ def run_code(
                 return
 
         try:
-            ast = parser.produce_ast(source_code)
+            ast = (
+                AST_CACHE.parse(source_code, file_path, parser)
+                if file_path
+                else parser.produce_ast(source_code)
+            )
+            if optimize:
+                folded = optimize_program(ast)
+                print(f"Optimizer: folded {folded} nodes.", file=sys.stderr)
             if log_ast:
                 print("AST:")
                 pprint(ast)
+            if log_bytecode:
+                print("Bytecode:")
+                print(disassemble(compile_program(ast)))
             if transpile_code:
                 return transpile(ast.body, return_value=True)
         except RuntimeError as e:
@@ -59,12 +87,15 @@ def run_code(
         return
 
     try:
-        result = evaluate(ast, environment)
+        result = ENGINES[engine](ast, environment)
         if log_result:
             print("\nResult:")
             pprint(result)
     except RuntimeError as e:
         print(f"{Fore.RED}Runtime Error{Fore.RESET}: {e}")
+    finally:
+        if owns_environment:  # A REPL keeps its files open between runs
+            environment.close_files()
 
     if result is not None and not isinstance(result, NullValue):
         return get_value(result)
@@ -1,48 +1,92 @@
 """Values and their types in the runtime environment."""
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Dict, List
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from math import copysign
+from mmap import mmap
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    TextIO,
+)
 
 if TYPE_CHECKING:
-    from frontend.ast import Statement
+    from frontend.ast import NumericLiteral, Statement, StringLiteral
     from runtime.environment import Environment
 
 
-@dataclass()
+@dataclass(slots=True)
 class RuntimeValue:
     """Base class for all runtime values."""
 
 
-@dataclass()
+# Primitive values are immutable (and interned), so they compare and hash by value
+@dataclass(slots=True, eq=False)
 class NullValue(RuntimeValue):
     """Null value class."""
 
     value: None = None
 
+    def __eq__(self, other: object) -> bool:
+        return other.__class__ is NullValue
 
-@dataclass()
+    def __hash__(self) -> int:
+        return hash(None)
+
+
+@dataclass(slots=True, eq=False)
 class NumberValue(RuntimeValue):
     """Number value class."""
 
     value: float
 
+    def __eq__(self, other: object) -> bool:
+        return other.__class__ is NumberValue and self.value == other.value  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
-@dataclass()
+
+@dataclass(slots=True, eq=False)
 class BooleanValue(RuntimeValue):
     """Boolean value class."""
 
     value: bool
 
+    def __eq__(self, other: object) -> bool:
+        return other.__class__ is BooleanValue and self.value is other.value  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
-@dataclass()
+
+@dataclass(slots=True, eq=False)
 class ObjectValue(RuntimeValue):
     """Object value class."""
 
     properties: Dict[str, RuntimeValue]
     immutable: bool = False
 
+    def __eq__(self, other: object) -> bool:
+        return (
+            other.__class__ is ObjectValue
+            and self.properties == other.properties  # type: ignore
+            and self.immutable == other.immutable  # type: ignore
+        )
+
+    def iterate(self) -> Iterable["StringValue"]:
+        """Iterate over the keys (as they were when the iteration started)."""
+        return map(StringValue, tuple(self.properties))
 
-@dataclass()
+
+@dataclass(slots=True)
 class FunctionCall:
     """Function call class."""
 
@@ -50,14 +94,14 @@ class FunctionCall:
     environment: "Environment"
 
 
-@dataclass()
+@dataclass(slots=True)
 class NativeFunctionValue(RuntimeValue):
     """Native function value class."""
 
     call: Callable
 
 
-@dataclass()
+@dataclass(slots=True)
 class FunctionValue(RuntimeValue):
     """Function value class."""
 
@@ -65,23 +109,280 @@ class FunctionValue(RuntimeValue):
     arguments: List[str]
     environment: "Environment"
     body: List["Statement"]
-
-
-@dataclass()
+    local_slots: Dict[str, int] | None = field(default=None, repr=False)
+
+
+@dataclass(slots=True, eq=False)
+class MemoValue(RuntimeValue):
+    """Memoized function value class, caches results by (primitive) arguments."""
+
+    function: FunctionValue
+    max_size: int
+    # Least recently used results first
+    cache: "OrderedDict[tuple, RuntimeValue]" = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+
+    def call(
+        self,
+        arguments: List[RuntimeValue],
+        call_function: Callable[[FunctionValue, List[RuntimeValue]], RuntimeValue],
+    ) -> RuntimeValue:
+        """Get the cached result of a call, calling the function on a miss."""
+        key = tuple(arguments)
+        for argument in key:
+            if not isinstance(argument, KEY_TYPES):
+                raise RuntimeError(
+                    "Arguments of a memoized function must be null, numbers, "
+                    "booleans or strings"
+                )
+
+        cache = self.cache
+        result = cache.get(key)
+        if result is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = call_function(self.function, arguments)
+        cache[key] = result
+        if len(cache) > self.max_size:
+            cache.popitem(last=False)
+        return result
+
+
+@dataclass(slots=True, eq=False)
 class StringValue(RuntimeValue):
     """String value class."""
 
     value: str
 
+    def __eq__(self, other: object) -> bool:
+        return other.__class__ is StringValue and self.value == other.value  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def iterate(self) -> Iterable["StringValue"]:
+        """Iterate over the characters."""
+        return map(StringValue, self.value)
+
+
+# Elements at each end of a deque that it indexes in constant time (one block)
+DEQUE_ENDS = 64
 
-@dataclass()
+
+@dataclass(slots=True, eq=False)
 class ArrayValue(RuntimeValue):
     """Array value class."""
 
-    elements: List[RuntimeValue]
+    # A list, until an operation on the front switches it to a deque (and indexing
+    # the middle of the deque switches it back)
+    elements: List[RuntimeValue] | Deque[RuntimeValue]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayValue):
+            return False
+        left, right = self.elements, other.elements
+        if left.__class__ is not right.__class__:
+            return list(left) == list(right)
+        return left == right
+
+    def as_deque(self) -> Deque[RuntimeValue]:
+        """Get the elements as a deque (O(1) at both ends), switching to one once."""
+        elements = self.elements
+        if elements.__class__ is not deque:
+            elements = self.elements = deque(elements)
+        return elements  # type: ignore
+
+    def iterate(self) -> Iterable[RuntimeValue]:
+        """Iterate over the elements."""
+        return self.iterate_from(0)
+
+    def iterate_from(self, index: int) -> Iterator[RuntimeValue]:
+        """Iterate over the elements from an index, seeing changes made meanwhile."""
+        # By index like a list iterator (a deque iterator raises if it is mutated, and
+        # the elements can switch between a list and a deque during the loop)
+        while index < len(self.elements):
+            yield self.get(index)
+            index += 1
+
+    def length(self) -> int:
+        """Get the number of elements."""
+        return len(self.elements)
+
+    def get(self, index: int) -> RuntimeValue:
+        """Get the element at an index, null if it is out of range."""
+        elements = self.elements
+        length = len(elements)
+        if not -length <= index < length:
+            return NULL
+        if elements.__class__ is deque and (
+            DEQUE_ENDS <= index % length < length - DEQUE_ENDS
+        ):
+            # Indexing the middle of a deque is O(n), switch back to a list for it
+            elements = self.elements = list(elements)
+        return elements[index]
+
+
+class RangeValue(ArrayValue):
+    """Range value class, an array of numbers that is only built when it is needed."""
+
+    __slots__ = ("numbers", "built")
+
+    def __init__(self, numbers: range) -> None:  # pylint: disable=super-init-not-called
+        self.numbers = numbers
+        self.built: List[RuntimeValue] | Deque[RuntimeValue] | None = None
+
+    @property  # type: ignore[override]
+    def elements(self) -> List[RuntimeValue] | Deque[RuntimeValue]:
+        """Elements of the range, built (once) when they are accessed directly."""
+        if self.built is None:
+            self.built = [number_value(i) for i in self.numbers]
+        return self.built
+
+    @elements.setter
+    def elements(self, elements: List[RuntimeValue] | Deque[RuntimeValue]) -> None:
+        self.built = elements
+
+    def __eq__(self, other: object) -> bool:
+        if self.built is None and other.__class__ is RangeValue:
+            if other.built is None:  # type: ignore
+                return self.numbers == other.numbers  # type: ignore
+        return ArrayValue.__eq__(self, other)
+
+    def __repr__(self) -> str:
+        if self.built is None:
+            return f"RangeValue(numbers={self.numbers!r})"
+        return ArrayValue.__repr__(self)
+
+    def iterate(self) -> Iterable[RuntimeValue]:
+        if self.built is None:
+            return self.iterate_numbers()
+        return ArrayValue.iterate(self)
+
+    def iterate_numbers(self) -> Iterator[RuntimeValue]:
+        """Iterate over the numbers, then over the elements if the loop builds them."""
+        for index, number in enumerate(self.numbers):
+            if self.built is not None:
+                yield from self.iterate_from(index)
+                return
+            yield number_value(number)
+
+    def length(self) -> int:
+        if self.built is None:
+            return len(self.numbers)
+        return ArrayValue.length(self)
+
+    def get(self, index: int) -> RuntimeValue:
+        if self.built is None:
+            numbers = self.numbers
+            if -len(numbers) <= index < len(numbers):
+                return number_value(numbers[index])
+            return NULL
+        return ArrayValue.get(self, index)
+
+
+@dataclass(slots=True, eq=False)
+class MapValue(RuntimeValue):
+    """Map value class, values by primitive keys (null, numbers, booleans, strings)."""
+
+    entries: Dict[RuntimeValue, RuntimeValue]
+
+    def __eq__(self, other: object) -> bool:
+        return other.__class__ is MapValue and self.entries == other.entries  # type: ignore
+
+    def iterate(self) -> Iterable[RuntimeValue]:
+        """Iterate over the keys (as they were when the iteration started)."""
+        return tuple(self.entries)
+
+
+@dataclass(slots=True, eq=False)
+class SetValue(RuntimeValue):
+    """Set value class, unique primitive values in insertion order."""
+
+    items: Dict[RuntimeValue, None]
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            other.__class__ is SetValue
+            and self.items.keys() == other.items.keys()  # type: ignore
+        )
+
+    def iterate(self) -> Iterable[RuntimeValue]:
+        """Iterate over the values (as they were when the iteration started)."""
+        return tuple(self.items)
+
+
+@dataclass(slots=True, eq=False)
+class IteratorValue(RuntimeValue):
+    """Iterator value class, streams values from a native source (only once)."""
 
+    iterator: Iterator[RuntimeValue]
 
-@dataclass()
+    def iterate(self) -> Iterable[RuntimeValue]:
+        """Iterate over the values that were not consumed yet."""
+        return self.iterator
+
+
+@dataclass(slots=True, eq=False)
+class FileValue(RuntimeValue):
+    """File value class, a handle to a file opened by the file module."""
+
+    path: str
+    file: TextIO
+
+    def iterate(self) -> Iterable[StringValue]:
+        """Iterate over the lines that were not read yet (without line breaks)."""
+        return self.stream_lines()
+
+    def stream_lines(self) -> Iterator[StringValue]:
+        """Stream the lines that were not read yet, errors are runtime errors."""
+        with file_errors(self):
+            for line in self.file:
+                yield StringValue(line.rstrip("\r\n"))
+
+    def close(self) -> None:
+        """Close the file."""
+        self.file.close()
+
+
+@contextmanager
+def file_errors(handle: FileValue) -> Generator[None, None, None]:
+    """Report the errors of an operation on a file handle as runtime errors."""
+    try:
+        yield
+    except (OSError, UnicodeError) as e:
+        raise RuntimeError(f"Cannot access file '{handle.path}': {e}") from e
+    except ValueError as e:  # Raised by closed files
+        raise RuntimeError(f"File '{handle.path}' is closed") from e
+
+
+@dataclass(slots=True, eq=False)
+class MappedFileValue(RuntimeValue):
+    """Mapped file value class, read only random access to a file (by byte)."""
+
+    path: str
+    data: mmap
+
+    def open_data(self) -> mmap:
+        """Get the mapped data, raises if the file was closed."""
+        if self.data.closed:
+            raise RuntimeError(f"File '{self.path}' is closed")
+        return self.data
+
+    def get(self, index: int) -> RuntimeValue:
+        """Get the byte at an index, null if it is out of range."""
+        data = self.open_data()
+        return number_value(data[index]) if -len(data) <= index < len(data) else NULL
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self.data.close()
+
+
+@dataclass(slots=True)
 class ClassValue(RuntimeValue):
     """Class value class."""
 
@@ -90,9 +391,65 @@ class ClassValue(RuntimeValue):
     arguments: List[str] | None = None
 
 
-@dataclass()
+@dataclass(slots=True)
 class EnumValue(RuntimeValue):
     """Enum value class."""
 
     name: str
     values: Dict[str, RuntimeValue]
+
+
+# Values a for loop can iterate over, they all have an iterate method
+ITERABLE_TYPES = (
+    ArrayValue,
+    StringValue,
+    ObjectValue,
+    MapValue,
+    SetValue,
+    IteratorValue,
+    FileValue,
+)
+
+# Values that hash by value (map keys, set values, arguments of memoized functions)
+KEY_TYPES = (NullValue, NumberValue, BooleanValue, StringValue)
+
+# Interned values, primitive values are never mutated so they can be shared
+NULL = NullValue()
+TRUE = BooleanValue(True)
+FALSE = BooleanValue(False)
+
+# Small integral numbers (number literals are floats, results of builtins are ints)
+SMALL_NUMBERS = range(-5, 257)
+SMALL_INTS = tuple(NumberValue(number) for number in SMALL_NUMBERS)
+SMALL_FLOATS = tuple(NumberValue(float(number)) for number in SMALL_NUMBERS)
+
+
+def number_value(value: float) -> NumberValue:
+    """Get a number value, interned if it is a small integral number."""
+    if value.__class__ is float:
+        if (
+            -5.0 <= value <= 256.0
+            and value.is_integer()
+            and (value or copysign(1.0, value) > 0)  # Keep -0.0
+        ):
+            return SMALL_FLOATS[int(value) + 5]
+    elif value.__class__ is int and -5 <= value <= 256:
+        return SMALL_INTS[value + 5]  # type: ignore
+    return NumberValue(value)
+
+
+def boolean_value(value: bool) -> BooleanValue:
+    """Get the interned boolean value."""
+    return TRUE if value else FALSE
+
+
+def literal_value(literal: "NumericLiteral | StringLiteral") -> RuntimeValue:
+    """Get the value of a number or string literal, built once and kept on the node."""
+    value = literal.runtime_value
+    if value is None:
+        value = literal.runtime_value = (
+            StringValue(literal.value)
+            if literal.value.__class__ is str
+            else number_value(literal.value)  # type: ignore
+        )
+    return value
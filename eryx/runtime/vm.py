@@ -0,0 +1,594 @@
+"""Stack based virtual machine that runs the compiled bytecode."""
+
+from eryx.frontend.ast import CallExpression, Identifier, MemberExpression, Program
+from eryx.runtime.bytecode import (
+    ARITHMETIC,
+    ASSERT,
+    ASSIGN_MEMBER,
+    BINARY_OP,
+    BITWISE,
+    BREAK_LOOP,
+    BUILD_ARRAY,
+    BUILD_OBJECT,
+    CALL,
+    COMPARE,
+    CONTINUE_LOOP,
+    DECLARE_CONST,
+    DECLARE_FAST,
+    DECLARE_NAME,
+    EVAL,
+    FOR_DECLARE_FAST,
+    FOR_DECLARE_NAME,
+    FOR_ITER,
+    FOR_RESTORE_FAST,
+    FOR_RESTORE_NAME,
+    GET_ITER,
+    INPLACE_FAST,
+    INPLACE_NAME,
+    JUMP,
+    LOAD_ATTR,
+    LOAD_CONST,
+    LOAD_FAST,
+    LOAD_NAME,
+    LOAD_SUBSCRIPT,
+    MAKE_FUNCTION,
+    OPNAMES,
+    POP_BLOCK,
+    POP_JUMP_IF_FALSE,
+    POP_TOP,
+    RETURN_VALUE,
+    TAIL_CALL,
+    ROT_TWO,
+    SAVE_FAST,
+    SAVE_NAME,
+    SETUP_LOOP,
+    SHORT_CIRCUIT,
+    STORE_FAST,
+    STORE_NAME,
+    CodeObject,
+    compile_function,
+    compile_program,
+    fast_locals,
+)
+from eryx.runtime.closures import (
+    CONDITION_TYPES,
+    BreakException,
+    ContinueException,
+    ReturnException,
+)
+from eryx.runtime.environment import UNBOUND, Environment, Frame
+from eryx.runtime.interpreter import (
+    Completion,
+    assignment_helper,
+    eval_assignment,
+    eval_compound_assignment,
+    evaluate,
+)
+from eryx.runtime.operators import eval_binary_operation, eval_short_circuit
+from eryx.runtime.values import (
+    FALSE,
+    ITERABLE_TYPES,
+    NULL,
+    TRUE,
+    ArrayValue,
+    BooleanValue,
+    ClassValue,
+    EnumValue,
+    FunctionValue,
+    MappedFileValue,
+    MemoValue,
+    NativeFunctionValue,
+    NumberValue,
+    ObjectValue,
+    RuntimeValue,
+    StringValue,
+)
+from eryx.utils.pretty_print import fmt_pos
+
+# Saved value of a loop variable that the loop declared (it had no value before)
+DECLARED = object()
+
+
+def get_member(
+    node: MemberExpression, object_value: RuntimeValue, key: str
+) -> RuntimeValue:
+    """Get a member of an object, class or enum."""
+    if isinstance(object_value, ClassValue):
+        return object_value.methods.get(key, NULL)
+    if isinstance(object_value, EnumValue):
+        return object_value.values.get(key, NULL)
+    if isinstance(object_value, ObjectValue):
+        return object_value.properties.get(key, NULL)
+    raise RuntimeError("Unsupported value type in member expression." + fmt_pos(node))
+
+
+def get_attribute(node: MemberExpression, object_value: RuntimeValue) -> RuntimeValue:
+    """Get the value of a non computed member expression (obj.prop)."""
+    if isinstance(object_value, (ObjectValue, ClassValue, EnumValue)):
+        if not isinstance(node.property, Identifier):
+            raise RuntimeError("Expected an identifier as a property." + fmt_pos(node))
+        return get_member(node, object_value, node.property.symbol)
+
+    if isinstance(object_value, ArrayValue):
+        raise RuntimeError(
+            "Expected a computed property for an array: string[number]." + fmt_pos(node)
+        )
+
+    if isinstance(object_value, MappedFileValue):
+        raise RuntimeError(
+            "Expected a computed property for a mapped file: string[number]."
+            + fmt_pos(node)
+        )
+
+    if isinstance(object_value, StringValue):
+        raise RuntimeError(
+            "Expected a computed property for a string: string[number]." + fmt_pos(node)
+        )
+
+    raise RuntimeError("Unsupported value type in member expression." + fmt_pos(node))
+
+
+def get_subscript(
+    node: MemberExpression, object_value: RuntimeValue, key: RuntimeValue
+) -> RuntimeValue:
+    """Get the value of a computed member expression (obj[prop])."""
+    if isinstance(object_value, (ObjectValue, ClassValue, EnumValue)):
+        if not isinstance(key, StringValue):
+            raise RuntimeError("Expected a string as a property." + fmt_pos(node))
+        return get_member(node, object_value, key.value)
+
+    if isinstance(object_value, (ArrayValue, StringValue, MappedFileValue)):
+        if not isinstance(key, NumberValue):
+            raise RuntimeError("Expected a number as an index." + fmt_pos(node))
+        index = int(key.value)
+
+        if isinstance(object_value, (ArrayValue, MappedFileValue)):
+            return object_value.get(index)
+
+        string = object_value.value
+        return StringValue(string[index]) if len(string) > index else NULL
+
+    raise RuntimeError("Unsupported value type in member expression." + fmt_pos(node))
+
+
+def construct_class(
+    node: CallExpression, cls: RuntimeValue, arguments: list[RuntimeValue]
+) -> RuntimeValue:
+    """Call a class to create an object (other values can not be called)."""
+    if isinstance(cls, ClassValue) and cls.arguments:
+        if len(cls.arguments) != len(arguments):
+            raise RuntimeError(
+                f"Expected {len(cls.arguments)} arguments, got {len(arguments)}. "
+                f"({', '.join(cls.arguments)})" + fmt_pos(node)
+            )
+        return ObjectValue(properties=dict(zip(cls.arguments, arguments)) | cls.methods)
+
+    raise RuntimeError("Cannot call a non-function value." + fmt_pos(node))
+
+
+def fast_slots(
+    code: CodeObject, func: FunctionValue, arguments: list[RuntimeValue]
+) -> list:
+    """Get the local slots of a call of fast code, the arguments are the first ones."""
+    slots = [UNBOUND] * len(code.varnames)
+    for i in range(len(func.arguments)):
+        slots[i] = arguments[i] if i < len(arguments) else NULL
+    return slots
+
+
+class VirtualMachine:
+    """Runs code objects, one Python call per Eryx function call."""
+
+    def __init__(self) -> None:
+        # Compiled function bodies, keyed by the id of the (kept alive) body
+        self.functions: dict[int, tuple[list, CodeObject]] = {}
+
+    def function_code(self, func: FunctionValue) -> CodeObject:
+        """Get the compiled body of a function, compiling it on the first call."""
+        compiled = self.functions.get(id(func.body))
+        if compiled is None:
+            code = compile_function(
+                func.name, func.body, fast_locals(func.arguments, func.body)
+            )
+            compiled = self.functions[id(func.body)] = (func.body, code)
+        return compiled[1]
+
+    def call_function(
+        self,
+        func: FunctionValue,
+        arguments: list[RuntimeValue],
+        node: CallExpression,
+    ) -> RuntimeValue:
+        """Call an Eryx function."""
+        code = self.function_code(func)
+
+        try:
+            if code.fast:
+                return self.run(
+                    code, func.environment, fast_slots(code, func, arguments), func
+                )
+
+            return self.run(code, Frame(func, arguments, None), running=func)
+        except BreakException as e:
+            raise RuntimeError(
+                "Break keyword found outside of a loop." + fmt_pos(node)
+            ) from e
+        except ContinueException as e:
+            raise RuntimeError(
+                "Continue keyword found outside of a loop." + fmt_pos(node)
+            ) from e
+
+    def call_memoized(
+        self, memo: MemoValue, arguments: list[RuntimeValue], node: CallExpression
+    ) -> RuntimeValue:
+        """Call a memoized Eryx function."""
+        return memo.call(
+            arguments,
+            lambda function, values: self.call_function(function, values, node),
+        )
+
+    # pylint: disable=too-many-branches,too-many-statements,too-many-locals
+    # pylint: disable=too-many-nested-blocks,unidiomatic-typecheck
+    def run(
+        self,
+        code: CodeObject,
+        environment: Environment,
+        slots: list | None = None,
+        running: FunctionValue | None = None,
+    ) -> RuntimeValue:
+        """
+        Run a code object until it returns.
+
+        Fast code keeps its locals in slots and uses the environment of the function
+        declaration for everything else. Tail calls of the running function (the one
+        the code belongs to) run the code again in place.
+        """
+        instructions = code.instructions
+        constants = code.constants
+        names = code.names
+        varnames = code.varnames
+        nodes = code.nodes
+        operators = code.operators
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+        blocks: list[tuple[int, int, int]] = (
+            []
+        )  # (break target, continue target, depth)
+        pc = 0
+
+        while True:
+            opcode, arg = instructions[pc]
+            pc += 1
+
+            # The most frequent opcodes come first
+            if opcode == LOAD_NAME:
+                push(environment.lookup_variable(names[arg]))
+
+            elif opcode == LOAD_FAST:
+                value = slots[arg]  # type: ignore
+                if value is UNBOUND:
+                    value = environment.lookup_variable(varnames[arg])
+                push(value)
+
+            elif opcode == LOAD_CONST:
+                push(constants[arg])
+
+            elif opcode == POP_TOP:
+                pop()
+
+            elif opcode == COMPARE:
+                right = pop()
+                left = stack[-1]
+                function, node = operators[arg]
+                if type(left) is NumberValue and type(right) is NumberValue:
+                    stack[-1] = TRUE if function(left.value, right.value) else FALSE  # type: ignore
+                else:
+                    stack[-1] = eval_binary_operation(node, left, right)
+
+            elif opcode == POP_JUMP_IF_FALSE:
+                condition = pop()
+                if isinstance(condition, CONDITION_TYPES):
+                    if not condition.value:
+                        pc = arg[0]
+                else:
+                    pc = arg[1]
+
+            elif opcode == JUMP:
+                pc = arg
+
+            elif opcode == ARITHMETIC:
+                right = pop()
+                left = stack[-1]
+                function, node = operators[arg]
+                if type(left) is NumberValue and type(right) is NumberValue:
+                    try:
+                        stack[-1] = NumberValue(function(left.value, right.value))  # type: ignore
+                        continue
+                    except ZeroDivisionError:
+                        pass  # Let the interpreter raise the error
+                stack[-1] = eval_binary_operation(node, left, right)
+
+            elif opcode == INPLACE_NAME:
+                function, node = operators[arg]
+                symbol = node.assigne.symbol
+                current = environment.lookup_variable(symbol)
+                value = stack[-1]
+                if type(current) is NumberValue and type(value) is NumberValue:
+                    try:
+                        value = NumberValue(function(current.value, value.value))  # type: ignore
+                    except ZeroDivisionError:
+                        value = eval_compound_assignment(current, value, node)
+                else:
+                    value = eval_compound_assignment(current, value, node)
+                stack[-1] = environment.assign_variable(symbol, value)
+
+            elif opcode == INPLACE_FAST:
+                slot, operator_index = arg
+                function, node = operators[operator_index]
+                current = slots[slot]  # type: ignore
+                value = stack[-1]
+                if type(current) is NumberValue and type(value) is NumberValue:
+                    try:
+                        stack[-1] = slots[slot] = NumberValue(  # type: ignore
+                            function(current.value, value.value)
+                        )
+                        continue
+                    except ZeroDivisionError:
+                        pass  # Let the interpreter raise the error
+                if current is UNBOUND:
+                    stack[-1] = environment.assign_variable(
+                        varnames[slot],
+                        assignment_helper(node.assigne, stack[-1], node, environment),
+                    )
+                else:
+                    stack[-1] = slots[slot] = eval_compound_assignment(  # type: ignore
+                        current, stack[-1], node
+                    )
+
+            elif opcode == STORE_NAME:
+                environment.assign_variable(names[arg], stack[-1])
+
+            elif opcode == STORE_FAST:
+                if slots[arg] is UNBOUND:  # type: ignore
+                    environment.assign_variable(varnames[arg], stack[-1])
+                else:
+                    slots[arg] = stack[-1]  # type: ignore
+
+            elif opcode == LOAD_SUBSCRIPT:
+                key = pop()
+                stack[-1] = get_subscript(nodes[arg], stack[-1], key)
+
+            elif opcode == FOR_ITER:
+                value = next(stack[-1], UNBOUND)
+                if value is UNBOUND:
+                    pc = arg
+                else:
+                    push(value)
+
+            elif opcode == FOR_DECLARE_FAST:
+                slots[arg] = pop()  # type: ignore
+                if stack[-2] is None:
+                    stack[-2] = DECLARED
+
+            elif opcode == FOR_DECLARE_NAME:
+                environment.declare_variable(names[arg], pop(), False, True)
+                if stack[-2] is None:
+                    stack[-2] = DECLARED
+
+            elif opcode == CALL:
+                node = nodes[arg]
+                func = pop()
+                count = len(node.arguments)
+                arguments = stack[-count:] if count else []
+                if count:
+                    del stack[-count:]
+
+                if type(func) is FunctionValue:
+                    push(self.call_function(func, arguments, node))
+                elif isinstance(func, NativeFunctionValue):
+                    push(func.call(arguments, environment, node))
+                elif type(func) is MemoValue:
+                    push(self.call_memoized(func, arguments, node))
+                else:
+                    push(construct_class(node, func, arguments))
+
+            elif opcode == RETURN_VALUE:
+                return pop()
+
+            elif opcode == TAIL_CALL:
+                node = nodes[arg]
+                func = pop()
+                count = len(node.arguments)
+                arguments = stack[-count:] if count else []
+                if count:
+                    del stack[-count:]
+
+                if func is not running:
+                    if type(func) is FunctionValue:
+                        return self.call_function(func, arguments, node)
+                    if isinstance(func, NativeFunctionValue):
+                        return func.call(arguments, environment, node)
+                    if type(func) is MemoValue:
+                        return self.call_memoized(func, arguments, node)
+                    return construct_class(node, func, arguments)
+
+                # Start over with the locals of the new call
+                if slots is None:
+                    environment = Frame(func, arguments, None)
+                else:
+                    slots = fast_slots(code, func, arguments)
+                stack.clear()
+                blocks.clear()
+                pc = 0
+
+            elif opcode == LOAD_ATTR:
+                stack[-1] = get_attribute(nodes[arg], stack[-1])
+
+            elif opcode == BITWISE:
+                right = pop()
+                left = stack[-1]
+                function, node = operators[arg]
+                if type(left) is NumberValue and type(right) is NumberValue:
+                    stack[-1] = NumberValue(
+                        function(int(left.value), int(right.value))  # type: ignore
+                    )
+                else:
+                    stack[-1] = eval_binary_operation(node, left, right)
+
+            elif opcode == BINARY_OP:
+                right = pop()
+                stack[-1] = eval_binary_operation(operators[arg][1], stack[-1], right)
+
+            elif opcode == SHORT_CIRCUIT:
+                target, operator_index = arg
+                result = eval_short_circuit(operators[operator_index][1], stack[-1])
+                if result is not None:
+                    stack[-1] = result
+                    pc = target
+
+            elif opcode == BUILD_ARRAY:
+                elements = stack[-arg:] if arg else []
+                if arg:
+                    del stack[-arg:]
+                push(ArrayValue(elements))
+
+            elif opcode == BUILD_OBJECT:
+                keys = [prop.key for prop in nodes[arg].properties]
+                values = stack[-len(keys) :] if keys else []
+                if keys:
+                    del stack[-len(keys) :]
+                push(ObjectValue(dict(zip(keys, values))))
+
+            elif opcode == DECLARE_FAST:
+                if slots[arg] is not UNBOUND:  # type: ignore
+                    raise RuntimeError(f'Variable "{varnames[arg]}" already declared')
+                slots[arg] = stack[-1]  # type: ignore
+
+            elif opcode == DECLARE_NAME:
+                environment.declare_variable(names[arg], stack[-1])
+
+            elif opcode == DECLARE_CONST:
+                environment.declare_variable(names[arg], stack[-1], True)
+
+            elif opcode == SETUP_LOOP:
+                blocks.append((arg, pc, len(stack)))
+
+            elif opcode == POP_BLOCK:
+                blocks.pop()
+
+            elif opcode == BREAK_LOOP:
+                if not blocks:
+                    raise BreakException()
+                pc, _, depth = blocks.pop()
+                del stack[depth:]
+
+            elif opcode == CONTINUE_LOOP:
+                if not blocks:
+                    raise ContinueException()
+                _, pc, depth = blocks[-1]
+                del stack[depth:]
+
+            elif opcode == GET_ITER:
+                if not isinstance(stack[-1], ITERABLE_TYPES):
+                    raise RuntimeError(
+                        "Expected an array, string, object or iterator to loop over."
+                        + fmt_pos(nodes[arg])
+                    )
+                stack[-1] = iter(stack[-1].iterate())
+
+            elif opcode == SAVE_FAST:
+                value = slots[arg]  # type: ignore
+                if value is UNBOUND:
+                    try:
+                        value = environment.lookup_variable(varnames[arg])
+                    except RuntimeError:
+                        value = None
+                push(value)
+
+            elif opcode == SAVE_NAME:
+                try:
+                    push(environment.lookup_variable(names[arg]))
+                except RuntimeError:
+                    push(None)
+
+            elif opcode == ROT_TWO:
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+
+            elif opcode == FOR_RESTORE_FAST:
+                pop()  # Iterator
+                saved = pop()
+                if saved is DECLARED:
+                    if slots[arg] is UNBOUND:  # type: ignore
+                        raise RuntimeError(
+                            f'Variable "{varnames[arg]}" not found in scope'
+                        )
+                    slots[arg] = UNBOUND  # type: ignore
+                elif saved is not None and slots[arg] is not UNBOUND:  # type: ignore
+                    slots[arg] = saved  # type: ignore
+                elif saved is not None:
+                    environment.assign_variable(varnames[arg], saved, overwrite=True)
+
+            elif opcode == FOR_RESTORE_NAME:
+                pop()  # Iterator
+                saved = pop()
+                if saved is DECLARED:
+                    environment.delete_variable(names[arg])
+                elif saved is not None:
+                    environment.assign_variable(names[arg], saved, overwrite=True)
+
+            elif opcode == MAKE_FUNCTION:
+                node, function_code = code.functions[arg]
+                self.functions[id(node.body)] = (node.body, function_code)
+                push(
+                    FunctionValue(
+                        name=node.name,
+                        arguments=node.arguments,
+                        environment=environment,
+                        body=node.body,
+                        local_slots=node.local_slots,
+                    )
+                )
+
+            elif opcode == ASSIGN_MEMBER:
+                stack[-1] = eval_assignment(nodes[arg], stack[-1], environment)
+
+            elif opcode == ASSERT:
+                node = nodes[arg]
+                if not isinstance(stack[-1], BooleanValue):
+                    raise RuntimeError(
+                        "Expected a boolean value in an assert statement."
+                        + fmt_pos(node)
+                    )
+                if not stack[-1].value:
+                    raise RuntimeError(
+                        f"Assertion failed: {node.message}" + fmt_pos(node)
+                    )
+                stack[-1] = NULL
+
+            elif opcode == EVAL:
+                value = evaluate(nodes[arg], environment)
+                if isinstance(value, Completion):  # A return outside of a function
+                    raise ReturnException(value.value)
+                push(value)
+
+            else:
+                raise RuntimeError(f"Unknown opcode {OPNAMES.get(opcode, opcode)}.")
+
+
+def execute(program: Program, environment: Environment) -> RuntimeValue:
+    """Compile a program to bytecode and run it."""
+    try:
+        return VirtualMachine().run(compile_program(program), environment)
+    except ReturnException as e:
+        raise RuntimeError(
+            "Return statement found outside of a function." + fmt_pos(program)
+        ) from e
+    except BreakException as e:
+        raise RuntimeError(
+            "Break keyword found outside of a loop." + fmt_pos(program)
+        ) from e
+    except ContinueException as e:
+        raise RuntimeError(
+            "Continue keyword found outside of a loop." + fmt_pos(program)
+        ) from e
@@ -16,7 +16,7 @@ from eryx.frontend.lexer import Token, tokenize
 from eryx.frontend.parser import Parser
 from eryx.frontend.transpiler import transpile
 from eryx.runtime.environment import Environment, get_value
-from eryx.runtime.interpreter import evaluate
+from eryx.runtime.runner import ENGINES
 from eryx.utils.pretty_print import pprint
 
 app = Flask(__name__)
@@ -30,6 +30,7 @@ class Config:
     """Web IDE configuration class."""
 
     disable_file_io: bool = False
+    engine: str = "interpreter"
 
 
 config = Config()
@@ -152,19 +153,21 @@ def handle_actions(action):
                     {"error": ansi_to_html(Fore.RED + output_buffer.getvalue())}
                 )
             return jsonify({"error": ansi_to_html(Fore.RED + str(e))})
+    # Handle REPL logic to keep track of environments
+    env = None
+    is_repl = False
+    if "env_uuid" in request_json:
+        env_uuid = request_json["env_uuid"]
+        env = environments.get(env_uuid)
+        is_repl = True
+    # Files opened by a program are closed when it ends, unless a REPL keeps them
+    owns_environment = env is None
+    env = env["env"] if env else Environment(disable_file_io=config.disable_file_io)
     try:
-        # Handle REPL logic to keep track of environments
-        env = None
-        is_repl = False
-        if "env_uuid" in request_json:
-            env_uuid = request_json["env_uuid"]
-            env = environments.get(env_uuid)
-            is_repl = True
-        env = env["env"] if env else Environment(disable_file_io=config.disable_file_io)
         output_buffer = io.StringIO()
         with redirect_stdout(output_buffer):
             # If the action is not AST or transpile, evaluate the code
-            result = evaluate(ast_nodes, env)
+            result = ENGINES[config.engine](ast_nodes, env)
             # If result is requested, return the result
             if action == "result":
                 return jsonify(
@@ -178,6 +181,9 @@ def handle_actions(action):
             return jsonify({"result": ansi_to_html(output)})
     except RuntimeError as e:
         return jsonify({"error": ansi_to_html(Fore.RED + str(e))})
+    finally:
+        if owns_environment:
+            env.close_files()
 
     return jsonify({})
 
@@ -199,7 +205,7 @@ def repl():
         return jsonify({"error": "No environment UUID provided"})
     env_uuid = request.args["envId"]
     if env_uuid in environments:
-        del environments[env_uuid]
+        environments.pop(env_uuid)["env"].close_files()
     return jsonify({})
 
 
@@ -215,18 +221,25 @@ def favicon():
     return app.send_static_file("eryx.ico")
 
 
-def start_ide(host: str = "0.0.0.0", port: int = 80, disable_file_io: bool = False):
+def start_ide(
+    host: str = "0.0.0.0",
+    port: int = 80,
+    disable_file_io: bool = False,
+    engine: str = "interpreter",
+):
     """Start the web IDE."""
     config.disable_file_io = disable_file_io
+    config.engine = engine
     app.run(host=host, port=port, debug=False, use_reloader=False)
 
 
 @app.before_request
 def before_req_handler():
     """Delete expired environments when a request is received."""
-    for env_uuid, env_data in environments.items():
+    for env_uuid, env_data in list(environments.items()):
         if time.time() > env_data["expiry"]:
             del environments[env_uuid]
+            env_data["env"].close_files()
 
 
 if __name__ == "__main__":
@@ -6,9 +6,12 @@ import warnings
 import pytest
 
 from eryx.__init__ import CURRENT_VERSION
+from eryx.frontend.ast import BinaryExpression
+from eryx.frontend.cache import AstCache
+from eryx.frontend.optimizer import optimize_program
 from eryx.frontend.parser import Parser
-from eryx.runtime.environment import Environment
-from eryx.runtime.interpreter import evaluate
+from eryx.runtime.environment import BUILTIN_SCOPE, Environment
+from eryx.runtime.runner import ENGINES, run_code
 from eryx.utils.pretty_print import pprint
 
 current_path = os.path.dirname(os.path.abspath(__file__))
@@ -34,15 +37,16 @@ def read_info(file_path: str) -> dict:
     return info
 
 
-@pytest.mark.parametrize(
-    "test_folder",
-    [
-        f
-        for f in os.listdir(os.path.join(current_path, "test"))
-        if os.path.isdir(os.path.join(current_path, "test", f))
-    ],
-)
-def test_eryx_code(test_folder: str, capfd: pytest.CaptureFixture):
+test_folders = [
+    f
+    for f in os.listdir(os.path.join(current_path, "test"))
+    if os.path.isdir(os.path.join(current_path, "test", f))
+]
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("test_folder", test_folders)
+def test_eryx_code(test_folder: str, engine: str, capfd: pytest.CaptureFixture):
     """Test Eryx code by parsing, producing the AST, evaluating it, and checking output."""
 
     environment = Environment()
@@ -74,12 +78,12 @@ def test_eryx_code(test_folder: str, capfd: pytest.CaptureFixture):
     test_ast = parser.produce_ast(test_code)
 
     expected_ast = read_file(ast_expected_path)
-    assert pprint(test_ast, use_color=False, print_output=False) == expected_ast, (
-        f"AST mismatch for {test_folder}"
-    )
+    assert (
+        pprint(test_ast, use_color=False, print_output=False) == expected_ast
+    ), f"AST mismatch for {test_folder}"
 
     # Step 2: Evaluate the AST
-    evaluate(test_ast, environment)
+    ENGINES[engine](test_ast, environment)
 
     # Step 3: Check printed output
     captured = capfd.readouterr()
@@ -87,5 +91,163 @@ def test_eryx_code(test_folder: str, capfd: pytest.CaptureFixture):
     assert captured.out.strip() == expected_output, f"Output mismatch for {test_folder}"
 
 
+@pytest.mark.parametrize("test_folder", test_folders)
+def test_optimized_code(test_folder: str, capfd: pytest.CaptureFixture):
+    """Test that optimized programs print the same output."""
+    test_code = read_file(os.path.join(base_folder, test_folder, f"{test_folder}.eryx"))
+    test_ast = Parser().produce_ast(test_code)
+    optimize_program(test_ast)
+
+    ENGINES["interpreter"](test_ast, Environment())
+
+    captured = capfd.readouterr()
+    expected_output = read_file(
+        os.path.join(base_folder, test_folder, f"{test_folder}.eryx.output")
+    )
+    assert captured.out.strip() == expected_output, f"Output mismatch for {test_folder}"
+
+
+def test_function_values():
+    """Test that every engine creates the same function values."""
+    program = Parser().produce_ast("func add(a, b) { let c = a + b; return c; }")
+    functions = []
+    for engine in ENGINES.values():
+        environment = Environment()
+        engine(program, environment)
+        functions.append(environment.lookup_variable("add"))
+
+    assert all(func.local_slots == {"a": 0, "b": 1, "c": 2} for func in functions)
+
+
+def test_builtin_scope(capfd: pytest.CaptureFixture):
+    """Test that global scopes share the builtins until a program writes to them."""
+    reader, writer = Environment(), Environment()
+    run_code("print(len([1, 2]));", environment=reader)
+    run_code("del print; let total = len([1]);", environment=writer)
+    assert reader.variables is BUILTIN_SCOPE
+    assert "print" in BUILTIN_SCOPE and "print" not in writer.variables
+    assert writer.lookup_variable("total").value == 1
+    assert capfd.readouterr().out == "2\n"
+
+
+def test_duplicate_arguments():
+    """Test that a function cannot declare the same argument twice."""
+    with pytest.raises(SyntaxError, match='Argument "a" already declared'):
+        Parser().produce_ast("func f(a, b, a) { return a; }")
+
+
+def test_optimizer():
+    """Test constant folding and dead branch pruning."""
+    program = Parser().produce_ast(
+        'let a = 60 * 60 * 24; let b = "x" + "y"; let c = a * 2;'
+        "if (1 < 2) { print(a); } else { print(b); } let d = 1 / 0;"
+    )
+    position = program.body[0].value.position
+    assert optimize_program(program) == 4
+
+    day, string, variable, then, division = program.body
+    assert (day.value.value, day.value.position) == (86400, position)
+    assert string.value.value == "xy"
+    assert isinstance(variable.value, BinaryExpression)
+    assert then.arguments[0].symbol == "a"
+    assert isinstance(division.value, BinaryExpression)
+
+
+def test_ast_cache(tmp_path):
+    """Test that parsed programs are cached on disk and invalidated on changes."""
+    cache = AstCache()
+    file_path = str(tmp_path / "functions.eryx")
+    source_code = read_file(os.path.join(base_folder, "functions", "functions.eryx"))
+
+    cold = cache.parse(source_code, file_path)
+    warm = cache.parse(source_code, file_path)
+    assert warm == cold
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.parse(source_code + "\nprint(1);", file_path)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.enabled = False
+    cache.parse(source_code, file_path)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_file_handles(tmp_path, capfd: pytest.CaptureFixture):
+    """Test file handles, and that the ones left open are closed at the end."""
+    file_path = (tmp_path / "lines.txt").as_posix()
+    run_code(
+        f'import "file"; let out = file.open("{file_path}", "w");'
+        'file.write(out, "a"); file.write(out, "b"); file.close(out);'
+        f'let lines = file.open("{file_path}"); print(file.readLine(lines));'
+        "print(file.readLine(lines));"
+        f'let chunks = file.open("{file_path}"); print(file.readChunk(chunks, 1));'
+        f'let left = file.open("{file_path}", "a"); file.write(left, "c");'
+    )
+    assert capfd.readouterr().out == "ab\nnull\na\n"
+    assert (tmp_path / "lines.txt").read_text(encoding="utf8") == "abc"
+
+
+def test_file_lines(tmp_path, capfd: pytest.CaptureFixture):
+    """Test that streamed lines are closed at the end even if they are not all read."""
+    file_path = tmp_path / "lines.txt"
+    file_path.write_text("a\nb\nc\n", encoding="utf8")
+    environment = Environment()
+    run_code(
+        f'import "file"; let lines = file.lines("{file_path.as_posix()}");'
+        "for line in lines { print(line); break; }"
+        f'let done = file.lines("{file_path.as_posix()}");'
+        "for line in done { } for line in done { print(line); }",
+        environment=environment,
+    )
+    assert capfd.readouterr().out == "a\n"
+    (handle,) = environment.open_files.values()
+    environment.close_files()
+    assert handle.file.closed
+
+
+def test_file_handle_loops(tmp_path, capfd: pytest.CaptureFixture):
+    """Test that looping over a handle that cannot be read is a runtime error."""
+    file_path = (tmp_path / "lines.txt").as_posix()
+    run_code(
+        f'import "file"; let out = file.open("{file_path}", "w");'
+        "for line in out { print(line); }"
+    )
+    assert "Cannot access file" in capfd.readouterr().out
+    run_code(
+        f'import "file"; let lines = file.open("{file_path}"); file.close(lines);'
+        "for line in lines { print(line); }"
+    )
+    assert "is closed" in capfd.readouterr().out
+
+
+def test_ide_closes_files(tmp_path):
+    """Test that the web IDE closes the files of programs once they end."""
+    ide = pytest.importorskip("eryx.server.ide")
+    file_path = (tmp_path / "data.txt").as_posix()
+    source_code = f'import "file"; let handle = file.open("{file_path}", "w");'
+    client = ide.app.test_client()
+
+    client.post("/run", json={"source_code": source_code})
+    env_uuid = client.post("/repl").get_json()["env_uuid"]
+    client.post("/run", json={"source_code": source_code, "env_uuid": env_uuid})
+    environment = ide.environments[env_uuid]["env"]
+    assert len(environment.open_files) == 1
+
+    client.delete(f"/repl?envId={env_uuid}")
+    assert not environment.open_files
+
+
+def test_mapped_file(tmp_path, capfd: pytest.CaptureFixture):
+    """Test indexing, slicing and searching a memory mapped file."""
+    file_path = tmp_path / "data.txt"
+    file_path.write_bytes(b"key=value\n")
+    run_code(
+        f'import "file"; let data = file.map("{file_path.as_posix()}");'
+        "print(len(data), data[0], data[10], data[-100], file.slice(data, 4, 9));"
+        'print(file.find(data, "value"), file.find(data, "key", 1));'
+    )
+    assert capfd.readouterr().out == "10 107 null null value\n4 -1\n"
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -2,6 +2,8 @@
 Module to pretty print a class instance for debugging. (the code is actual garbage but it works)
 """
 
+from dataclasses import fields, is_dataclass
+
 from colorama import Fore
 
 from eryx.frontend.parser import Statement
@@ -10,7 +12,9 @@ from eryx.frontend.parser import Statement
 # https://stackoverflow.com/questions/395735/how-to-check-whether-a-variable-is-a-class-or-not
 def isclass(cls):
     """Check if a variable is a class."""
-    return str(type(cls)).startswith("<class") and hasattr(cls, "__weakref__")
+    return str(type(cls)).startswith("<class") and (
+        hasattr(cls, "__slots__") or hasattr(cls, "__weakref__")
+    )
 
 
 def isenum(cls):
@@ -221,8 +225,13 @@ def pprint(
     if not isclass(class_instance):
         raise TypeError("Argument must be a class instance.")
 
-    # Get the properties of the class (excluding dunder methods)
-    properties = list(filter(lambda x: not x.startswith("__"), dir(class_instance)))
+    # Get the properties of the class (excluding dunder methods and annotations)
+    if is_dataclass(class_instance):
+        properties = sorted(
+            field.name for field in fields(class_instance) if field.repr
+        )
+    else:
+        properties = list(filter(lambda x: not x.startswith("__"), dir(class_instance)))
     string = ""
     # Add color for the class name
     if use_color: